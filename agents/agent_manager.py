@@ -898,16 +898,14 @@ class AgentManager:
             typed_values = {}
             for key, value in input_values.items():
                 # Find parameter in task definition
-                param = next((p for p in task.definition.input_schema if p.name == key), None)
+                param = task.definition.get_input_parameter(key)
                 if param:
                     typed_values[key] = ParameterValue(value=value, parameter_type=param.type)
 
             # Check for missing required parameters
-            missing_params = []
-            for param in task.definition.input_schema:
-                if param.required and param.name not in typed_values:
-                    missing_params.append(param.name)
-                    logger.warning(f"Missing required parameter: {param.name}")
+            missing_params = task.definition.missing_required_inputs(typed_values)
+            for name in missing_params:
+                logger.warning(f"Missing required parameter: {name}")
 
             if missing_params:
                 logger.error(f"Task {task_id} missing required parameters: {missing_params}")
@@ -20,6 +20,11 @@ class MemoryBackend(ABC):
         """Store a conversation turn and return its ID."""
         pass
 
+    @abstractmethod
+    async def store_next_turn(self, turn: ConversationTurn) -> int:
+        """Store a turn as its agent's next turn and return the assigned turn number."""
+        pass
+
     @abstractmethod
     async def get_turns_by_timerange(
         self,
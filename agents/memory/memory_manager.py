@@ -13,6 +13,7 @@ from common.models import (
     ToolUsageStatus,
     TurnStatus,
 )
+from common.models.base import new_id
 from common.types import (
     ToolApprovalUpdate,
     ToolExecutionComplete,
@@ -82,8 +83,7 @@ class MemoryManager:
         Returns:
             Turn ID for updating later
         """
-        turn_id = str(uuid.uuid4())
-        turn_number = await self._storage.get_next_turn_number(agent_id)
+        turn_id = new_id()
 
         # Default target_entity to agent_id if not specified
         if target_entity is None:
@@ -93,7 +93,6 @@ class MemoryManager:
             id=turn_id,
             agent_id=agent_id,
             session_id=session_id,
-            turn_number=turn_number,
             timestamp=datetime.utcnow(),
             source_entity=source_entity,
             target_entity=target_entity,
@@ -114,11 +113,11 @@ class MemoryManager:
             updated_at=datetime.utcnow(),
         )
 
+        # The backend assigns the agent's next turn number as part of the insert
+        turn_number = await self._storage.store_next_turn(turn)
         logger.debug(
-            f"💾 Creating in-progress turn: id={turn_id}, agent={agent_id}, turn={turn_number}"
+            f"✅ In-progress turn created: id={turn_id}, agent={agent_id}, turn={turn_number}"
         )
-        result = await self._storage.store_turn(turn)
-        logger.debug(f"✅ In-progress turn created: {result}")
         return turn_id
 
     async def update_turn_completion(
@@ -209,8 +208,7 @@ class MemoryManager:
         Returns:
             Turn ID
         """
-        turn_id = str(uuid.uuid4())
-        turn_number = await self._storage.get_next_turn_number(agent_id)
+        turn_id = new_id()
 
         # Set tools_used to True if any tools were used
         has_tools = bool(tools_used)
@@ -223,7 +221,6 @@ class MemoryManager:
             id=turn_id,
             agent_id=agent_id,
             session_id=session_id,
-            turn_number=turn_number,
             timestamp=datetime.utcnow(),
             source_entity=source_entity,
             target_entity=target_entity,
@@ -243,15 +240,13 @@ class MemoryManager:
             compacted=False,
         )
 
-        logger.debug(
-            f"💾 Recording conversation turn: id={turn_id}, agent={agent_id}, turn={turn_number}"
-        )
+        logger.debug(f"💾 Recording conversation turn: id={turn_id}, agent={agent_id}")
         logger.debug(f"   User query: {user_query[:50]}...")
         logger.debug(f"   Agent response: {agent_response[:50]}...")
 
-        result = await self._storage.store_turn(turn)
-        logger.debug(f"✅ Turn saved to database: {result}")
-        return result
+        turn_number = await self._storage.store_next_turn(turn)
+        logger.debug(f"✅ Turn saved to database: {turn_id} (turn {turn_number})")
+        return turn_id
 
     # Query interfaces
     async def get_session_history(
@@ -490,7 +485,7 @@ class MemoryManager:
         compressed_token_count: int,
     ) -> CompactMemory:
         """Store a new compact memory."""
-        compact_id = str(uuid.uuid4())
+        compact_id = new_id()
 
         compact_memory = CompactMemory(
             id=compact_id,
@@ -555,7 +550,7 @@ class MemoryManager:
         from common.models import ToolUsage
 
         tool_usage = ToolUsage(
-            id=str(uuid.uuid4()),
+            id=new_id(),
             turn_id=turn_id,
             agent_id=agent_id,
             tool_name=tool_name,
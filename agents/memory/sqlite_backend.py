@@ -2,12 +2,11 @@
 
 import asyncio
 import logging
-import uuid
 from datetime import datetime
 from functools import wraps
 from typing import Any, Callable, Coroutine, Optional, TypeVar
 
-from sqlalchemy import and_, asc, delete, desc, func, text
+from sqlalchemy import and_, asc, delete, desc, false, func, insert, text, true
 from sqlalchemy.engine.cursor import CursorResult
 from sqlalchemy.exc import IntegrityError, OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
@@ -22,6 +21,8 @@ from common.models import (
     ToolUsageStatus,
     TurnStatus,
 )
+from common.models.base import new_id
+from common.models.loaders import strict_load
 
 from .memory_backend import MemoryBackend
 
@@ -173,7 +174,7 @@ class SQLiteBackend(MemoryBackend):
     async def store_turn(self, turn: ConversationTurn) -> str:
         """Store a conversation turn."""
         if not turn.id:
-            turn.id = str(uuid.uuid4())
+            turn.id = new_id()
 
         logger.debug(
             f"💾 Storing turn: id={turn.id}, agent={turn.agent_id}, turn_number={turn.turn_number}"
@@ -213,6 +214,35 @@ class SQLiteBackend(MemoryBackend):
             logger.debug(f"✅ Turn {turn.id} committed to SQLite database")
             return turn.id
 
+    @with_retry(max_attempts=3, backoff_factor=0.1)
+    async def store_next_turn(self, turn: ConversationTurn) -> int:
+        """Store a turn as its agent's next turn and return the assigned turn number."""
+        if not turn.id:
+            turn.id = new_id()
+
+        if not self.async_session:
+            raise RuntimeError("SQLite backend not initialized")
+        table = ConversationTurn.__table__  # type: ignore[attr-defined]
+        # Number the turn inside the INSERT and read it back with RETURNING: one
+        # statement instead of a MAX() round trip before the insert, and no window
+        # for a concurrent turn to take the same number
+        next_number = (
+            select(func.coalesce(func.max(table.c.turn_number), 0) + 1)
+            .where(table.c.agent_id == turn.agent_id)
+            .scalar_subquery()
+        )
+        values = {column.name: getattr(turn, column.name) for column in table.columns}
+        values["turn_number"] = next_number
+        async with self.async_session() as session:
+            result = await session.execute(
+                insert(table).values(values).returning(table.c.turn_number)
+            )
+            turn.turn_number = result.scalar_one()
+            await session.commit()
+
+        logger.debug(f"✅ Turn {turn.id} stored as turn {turn.turn_number} of {turn.agent_id}")
+        return turn.turn_number
+
     @with_retry(max_attempts=3, backoff_factor=0.1)
     async def update_turn(self, turn_id: str, updates: dict[str, Any]) -> bool:
         """Update a conversation turn with new data."""
@@ -255,7 +285,7 @@ class SQLiteBackend(MemoryBackend):
             if limit:
                 query = query.limit(limit)
 
-            result = await session.execute(query)
+            result = await session.execute(strict_load(query))
             db_turns = result.scalars().all()
 
             return list(db_turns)
@@ -292,7 +322,7 @@ class SQLiteBackend(MemoryBackend):
             if limit:
                 query = query.limit(limit)
 
-            result = await session.execute(query)
+            result = await session.execute(strict_load(query))
             db_turns = result.scalars().all()
 
             logger.debug(f"📊 SQLite returned {len(db_turns)} turns from timerange query")
@@ -305,7 +335,7 @@ class SQLiteBackend(MemoryBackend):
             raise RuntimeError("SQLite backend not initialized")
         async with self.async_session() as session:
             query = select(ConversationTurn).where(col(ConversationTurn.id) == turn_id)
-            result = await session.execute(query)
+            result = await session.execute(strict_load(query))
             db_turn = result.scalar_one_or_none()
 
             if db_turn:
@@ -368,14 +398,14 @@ class SQLiteBackend(MemoryBackend):
         async with self.async_session() as session:
             query = (
                 select(ConversationTurn)
-                .where(col(ConversationTurn.compacted).is_(False))
+                .where(col(ConversationTurn.compacted) == false())
                 .order_by(col(ConversationTurn.timestamp).asc())
             )
 
             if limit:
                 query = query.limit(limit)
 
-            result = await session.execute(query)
+            result = await session.execute(strict_load(query))
             db_turns = result.scalars().all()
 
             turns = list(db_turns)
@@ -654,7 +684,7 @@ class SQLiteBackend(MemoryBackend):
     async def store_tool_usage(self, tool_usage: ToolUsage) -> str:
         """Store a tool usage record."""
         if not tool_usage.id:
-            tool_usage.id = str(uuid.uuid4())
+            tool_usage.id = new_id()
 
         if not self.async_session:
             raise RuntimeError("SQLite backend not initialized")
@@ -690,7 +720,7 @@ class SQLiteBackend(MemoryBackend):
             raise RuntimeError("SQLite backend not initialized")
         async with self.async_session() as session:
             stmt = select(ToolUsage).where(col(ToolUsage.id) == tool_usage_id)
-            result = await session.execute(stmt)
+            result = await session.execute(strict_load(stmt))
             db_model = result.scalar_one_or_none()
 
             if db_model:
@@ -725,7 +755,7 @@ class SQLiteBackend(MemoryBackend):
                 .order_by(col(ToolUsage.created_at))
             )
 
-            result = await session.execute(stmt)
+            result = await session.execute(strict_load(stmt))
             db_models = result.scalars().all()
 
             return list(db_models)
@@ -738,7 +768,7 @@ class SQLiteBackend(MemoryBackend):
             stmt = select(ToolUsage).where(
                 and_(
                     col(ToolUsage.execution_status) == "PENDING",
-                    col(ToolUsage.requires_approval).is_(True),
+                    col(ToolUsage.requires_approval) == true(),
                 )
             )
 
@@ -747,7 +777,7 @@ class SQLiteBackend(MemoryBackend):
 
             stmt = stmt.order_by(col(ToolUsage.created_at))
 
-            result = await session.execute(stmt)
+            result = await session.execute(strict_load(stmt))
             db_models = result.scalars().all()
 
             return list(db_models)
@@ -769,7 +799,7 @@ class SQLiteBackend(MemoryBackend):
 
             stmt = stmt.limit(limit)
 
-            result = await session.execute(stmt)
+            result = await session.execute(strict_load(stmt))
             db_models = result.scalars().all()
 
             return list(db_models)
@@ -790,7 +820,7 @@ class SQLiteBackend(MemoryBackend):
             if limit:
                 stmt = stmt.limit(limit)
 
-            result = await session.execute(stmt)
+            result = await session.execute(strict_load(stmt))
             db_models = result.scalars().all()
 
             return list(db_models)
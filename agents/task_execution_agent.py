@@ -93,8 +93,10 @@ Instructions:
 Input values provided:
 """
 
-        for key, param_value in context.input_values.items():
-            prompt += f"- {key}: {param_value.to_string()}\n"
+        prompt += "".join(
+            f"- {key}: {param_value.to_string()}\n"
+            for key, param_value in context.input_values.items()
+        )
 
         prompt += "\nPlease execute this task now using available tools."
         return prompt
@@ -1,7 +1,6 @@
 """Chat API routes."""
 
 import asyncio
-import json
 import logging
 from typing import AsyncGenerator
 
@@ -9,7 +8,7 @@ from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import StreamingResponse
 
 from agents.agent_manager import AgentManager
-from common.messages import ApprovalResponseMessage, SSEMessage, UserMessage
+from common.messages import ApprovalResponseMessage, Message, SSEMessage, UserMessage
 
 from ..models.chat import ApprovalResponse, ChatRequest
 
@@ -18,6 +17,16 @@ logger = logging.getLogger(__name__)
 chat_router = APIRouter()
 
 
+def _sse_frame(message: Message) -> bytes:
+    """Encode a message as a single SSE data frame.
+
+    Frames carry an empty "metadata" object, which the CLI's stream types
+    expect; it is appended to the serialized object rather than declared on
+    every message model.
+    """
+    return b"data: " + message.to_json_bytes()[:-1] + b',"metadata":{}}\n\n'
+
+
 def get_manager(request: Request) -> AgentManager:
     """Get AgentManager from app state."""
     if not hasattr(request.app.state, "manager"):
@@ -65,7 +74,7 @@ async def chat_stream(request: Request, chat_request: ChatRequest) -> StreamingR
     """Stream chat responses as they are generated."""
     logger.info(f"[API ENDPOINT] /chat/stream called with {chat_request}")
 
-    async def generate_stream() -> AsyncGenerator[str, None]:
+    async def generate_stream() -> AsyncGenerator[bytes, None]:
         try:
             # Convert to Message object
             message = chat_request.to_message()
@@ -90,22 +99,8 @@ async def chat_stream(request: Request, chat_request: ChatRequest) -> StreamingR
             message_count = 0
             async for response in manager.chat_stream(message):
                 message_count += 1
-                # Convert Message to JSON and yield
-                # Each message type has specific fields we need to serialize
-                response_dict = response.to_dict()
-
-                # Ensure metadata field exists
-                if "metadata" not in response_dict:
-                    response_dict["metadata"] = {}
-
-                # Handle timestamp conversion - it might be a datetime or already a string
-                if "timestamp" in response_dict and response_dict["timestamp"]:
-                    timestamp = response_dict["timestamp"]
-                    if hasattr(timestamp, "isoformat"):
-                        response_dict["timestamp"] = timestamp.isoformat()
-                    # If it's already a string, leave it as is
-
-                yield f"data: {json.dumps(response_dict)}\n\n"
+                # Serialize straight from pydantic-core to bytes, no intermediate dict
+                yield _sse_frame(response)
 
                 # No need for separate completion signal - AgentMessage.final indicates completion
 
@@ -123,7 +118,7 @@ async def chat_stream(request: Request, chat_request: ChatRequest) -> StreamingR
                 session_id=chat_request.session_id or "",
                 error=f"Stream error: {str(e)}",
             )
-            yield f"data: {json.dumps(error_msg.to_dict())}\n\n"
+            yield _sse_frame(error_msg)
         finally:
             logger.info(f"🏁 Stream completed for session: {chat_request.session_id}")
             # Don't unregister session here - the agent might still be processing
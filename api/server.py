@@ -64,7 +64,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
             )
             logger.info(
                 f"🔐 Tool approval configured: "
-                f"auto_approve={TOOL_APPROVAL_CONFIG['auto_approve_tools'][:3]}..."
+                f"auto_approve={sorted(TOOL_APPROVAL_CONFIG['auto_approve_tools'])[:3]}..."
             )
 
         # Store manager reference for routes
@@ -270,9 +270,9 @@ class MetagenGoogleAuth(BaseAuthProvider):
             "expiry": credentials.expiry.isoformat() if credentials.expiry else None,
         }
 
-        # Write to file
+        # Write to file; only machines read it, so keep it compact
         with open(token_file, "w") as f:
-            json.dump(token_data, f, indent=2)
+            json.dump(token_data, f, separators=(",", ":"))
 
         logger.info(f"Credentials stored in: {token_file}")
 
@@ -288,7 +288,7 @@ class MetagenGoogleAuth(BaseAuthProvider):
             return result  # type: ignore[no-any-return]
 
         # Run in executor to avoid blocking
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, _test_call)
 
     async def check_authentication(self) -> bool:
@@ -426,7 +426,7 @@ class MetagenGoogleAuth(BaseAuthProvider):
                 return (name, email)
 
             # Run in executor to avoid blocking
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             name, email = await loop.run_in_executor(None, _get_user_info)
 
             return {"name": name, "email": email, "provider": "google"}
@@ -1,11 +1,12 @@
 """Anthropic Claude client with Instructor support."""
 
-from typing import Any, AsyncIterator, Optional, Union
+from typing import Any, AsyncIterator, Optional, Union, cast
 
 import instructor
 from anthropic import AsyncAnthropic
 from anthropic.types import Message as AnthropicMessage
 
+from common.types import ToolCall
 from tools.base import Tool
 
 from .base_provider_client import BaseProviderClient
@@ -52,7 +53,7 @@ class AnthropicClient(BaseProviderClient):
 
             # Handle tool result messages (TOOL role)
             if msg.role == LLMMessageRole.TOOL and msg.tool_call_results:
-                content = []
+                content: list[dict[str, Any]] = []
                 for result in msg.tool_call_results:
                     content.append(
                         {
@@ -100,7 +101,7 @@ class AnthropicClient(BaseProviderClient):
     ) -> LLMMessage:
         """Parse Anthropic response into our format."""
         content = ""
-        tool_calls = []
+        tool_calls: list[ToolCall] = []
 
         # Handle different content types
         if isinstance(response.content, str):
@@ -112,7 +113,11 @@ class AnthropicClient(BaseProviderClient):
                         content += block.text
                     elif block.type == "tool_use" and has_tools:
                         tool_calls.append(
-                            {"id": block.id, "name": block.name, "arguments": block.input}
+                            ToolCall(
+                                id=block.id,
+                                name=block.name,
+                                arguments=cast(dict[str, Any], block.input),
+                            )
                         )
 
         # Parse usage
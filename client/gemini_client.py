@@ -10,6 +10,7 @@ from google.genai.types import HttpOptions
 
 from client.base_provider_client import BaseProviderClient
 from client.types import LLMMessage, LLMMessageRole, LLMStreamEvent, LLMTokenUsage
+from common.types import ToolCall
 from tools.base import Tool
 
 logger = logging.getLogger(__name__)
@@ -128,9 +129,9 @@ class GeminiClient(BaseProviderClient):
         # Wrap function declarations in a Tool object
         return [types.Tool(function_declarations=function_declarations)]
 
-    def _extract_tool_calls_from_response(self, response: Any) -> list[dict[str, Any]]:
+    def _extract_tool_calls_from_response(self, response: Any) -> list[ToolCall]:
         """Extract tool calls from Gemini response."""
-        tool_calls = []
+        tool_calls: list[ToolCall] = []
 
         if hasattr(response, "candidates"):
             for candidate in response.candidates:
@@ -141,20 +142,20 @@ class GeminiClient(BaseProviderClient):
                             # Extract the function call details
                             func_call = part.function_call
                             tool_calls.append(
-                                {
+                                ToolCall(
                                     # Generate ID since Gemini doesn't provide one
-                                    "id": f"call_{i}",
-                                    "name": (
+                                    id=f"call_{i}",
+                                    name=(
                                         func_call.name
                                         if hasattr(func_call, "name")
                                         else func_call.get("name")
                                     ),
-                                    "arguments": (
+                                    arguments=(
                                         dict(func_call.args)
                                         if hasattr(func_call, "args")
                                         else func_call.get("args", {})
                                     ),
-                                }
+                                )
                             )
 
         return tool_calls
@@ -214,15 +214,12 @@ class LLMClient:
         # Yield tool calls if present
         if hasattr(response, "tool_calls") and response.tool_calls:
             # Convert to ToolCallRequest objects
-            tool_call_requests = []
-            for i, tool_call in enumerate(response.tool_calls):
-                tool_call_requests.append(
-                    ToolCallRequest(
-                        tool_id=tool_call.get("id", f"call_{i}"),
-                        tool_name=tool_call.get("name", ""),
-                        tool_args=tool_call.get("arguments", {}),
-                    )
+            tool_call_requests = [
+                ToolCallRequest(
+                    tool_id=tool_call.id, tool_name=tool_call.name, tool_args=tool_call.arguments
                 )
+                for tool_call in response.tool_calls
+            ]
 
             yield ToolCallMessage(
                 agent_id=agent_id, session_id=session_id, tool_calls=tool_call_requests
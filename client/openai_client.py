@@ -1,12 +1,24 @@
 """OpenAI client with Instructor support."""
 
+import asyncio
+import functools
 import json
+import logging
 from typing import Any, AsyncIterator, Optional, Union
 
+import httpx
 import instructor
-from openai import AsyncOpenAI
-from openai.types.chat import ChatCompletion
+import msgspec
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+from openai.types.chat import (
+    ChatCompletion,
+    ChatCompletionNamedToolChoiceParam,
+    ChatCompletionToolParam,
+)
+from pydantic import BaseModel, ValidationError
 
+from common.types import ToolCall
+from config import LLM_CLIENT_CONFIG
 from tools.base import Tool
 
 from .base_provider_client import BaseProviderClient
@@ -20,6 +32,145 @@ from .types import (
     LLMTokenUsage,
 )
 
+logger = logging.getLogger(__name__)
+
+# Process-wide pool of AsyncOpenAI clients keyed by API key and event loop. Every
+# OpenAIClient using the same key on the same loop shares one client and its
+# explicitly owned httpx client instead of opening its own connection pool; httpx
+# connections are bound to the loop that opened them, so loops never share.
+# Reference counts make sure the httpx client is only closed when its last user closes.
+_PoolKey = tuple[str, int]
+_CLIENT_POOL: dict[_PoolKey, tuple[AsyncOpenAI, httpx.AsyncClient]] = {}
+_CLIENT_REFS: dict[_PoolKey, int] = {}
+
+
+class _StreamDelta(msgspec.Struct):
+    """Delta of a raw streaming chunk (only the fields we read)."""
+
+    content: Optional[str] = None
+
+
+class _StreamChoice(msgspec.Struct):
+    """Choice of a raw streaming chunk."""
+
+    delta: _StreamDelta
+    finish_reason: Optional[str] = None
+
+
+class _StreamChunk(msgspec.Struct):
+    """Raw chat completion chunk, decoded without Pydantic validation."""
+
+    choices: list[_StreamChoice] = []
+
+
+_STREAM_CHUNK_DECODER = msgspec.json.Decoder(_StreamChunk)
+
+
+@functools.lru_cache(maxsize=128)
+def _system_message_dict(content: str) -> dict[str, Any]:
+    """Build the OpenAI dict for a system prompt.
+
+    System prompts are large and resent unchanged every turn, so the dict is
+    cached and shared between requests. Callers must not mutate it.
+    """
+    return {"role": "system", "content": content}
+
+
+# Total LLM calls a structured request may make by default, fast path included;
+# matches Instructor's own max_retries default
+_STRUCTURED_OUTPUT_ATTEMPTS = 3
+
+
+@functools.lru_cache(maxsize=64)
+def _structured_output_tool(response_model: type[BaseModel]) -> ChatCompletionToolParam:
+    """Build the function-tool payload for a structured output model.
+
+    Deriving the JSON schema is the expensive part of a structured call and
+    never changes for a given model class, so it is done once per class.
+    """
+    return {
+        "type": "function",
+        "function": {
+            "name": response_model.__name__,
+            "description": response_model.__doc__ or "",
+            "parameters": response_model.model_json_schema(),
+        },
+    }
+
+
+# Roles whose adjacent plain-text messages can be merged without changing meaning
+_MERGEABLE_ROLES = ("user", "system")
+
+
+def _merge_adjacent_messages(openai_messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Merge back-to-back user/user and system/system text messages.
+
+    Tool results and assistant tool calls are never merged. Merged messages
+    are new dicts, so cached inputs (e.g. system prompts) are never mutated.
+    """
+    merged: list[dict[str, Any]] = []
+    for msg in openai_messages:
+        prev = merged[-1] if merged else None
+        if (
+            prev is not None
+            and msg["role"] in _MERGEABLE_ROLES
+            and msg["role"] == prev["role"]
+            and isinstance(msg.get("content"), str)
+            and isinstance(prev.get("content"), str)
+        ):
+            merged[-1] = {"role": msg["role"], "content": f"{prev['content']}\n\n{msg['content']}"}
+        else:
+            merged.append(msg)
+    return merged
+
+
+# Output budgets a defaulted max_tokens is drawn from
+_MAX_TOKENS_BUCKETS = (256, 512, 1024, 2048, 4096)
+
+
+def _bucket_max_tokens(model_limit: Optional[int]) -> int:
+    """Pick the largest bucket within the model's output limit as the default budget.
+
+    Requests that leave max_tokens unset then share a few small output budgets,
+    which the server batches better than each model's full output limit.
+    """
+    if model_limit is None:
+        return _MAX_TOKENS_BUCKETS[-1]
+    fitting = [b for b in _MAX_TOKENS_BUCKETS if b <= model_limit]
+    return fitting[-1] if fitting else model_limit
+
+
+def _pool_key(api_key: str) -> _PoolKey:
+    """Pool key for an API key on the running event loop."""
+    return (api_key, id(asyncio.get_running_loop()))
+
+
+def _acquire_client(key: _PoolKey) -> tuple[AsyncOpenAI, httpx.AsyncClient]:
+    """Get the pooled clients for a pool key, creating them on first use."""
+    entry = _CLIENT_POOL.get(key)
+    if entry is None:
+        http_client = DefaultAsyncHttpxClient()
+        entry = (AsyncOpenAI(api_key=key[0], http_client=http_client), http_client)
+        _CLIENT_POOL[key] = entry
+        _CLIENT_REFS[key] = 0
+    _CLIENT_REFS[key] += 1
+    return entry
+
+
+def _release_client(key: _PoolKey) -> Optional[httpx.AsyncClient]:
+    """Drop a reference to the pooled clients.
+
+    Returns:
+        The httpx client if this was the last reference and it should be closed, else None
+    """
+    refs = _CLIENT_REFS.get(key, 0) - 1
+    if refs > 0:
+        _CLIENT_REFS[key] = refs
+        return None
+    _CLIENT_REFS.pop(key, None)
+    entry = _CLIENT_POOL.pop(key, None)
+    return entry[1] if entry else None
+
 
 class OpenAIClient(BaseProviderClient):
     """OpenAI client for text generation."""
@@ -34,14 +185,28 @@ class OpenAIClient(BaseProviderClient):
         super().__init__(api_key)
         self.default_model = default_model or "gpt-4o-mini"
         self._client: Optional[AsyncOpenAI] = None
+        self._http: Optional[httpx.AsyncClient] = None
+        self._pool_key: Optional[_PoolKey] = None
         self._instructor_client: Optional[instructor.AsyncInstructor] = None
+        self._init_lock = asyncio.Lock()
 
     async def initialize(self) -> None:
         """Initialize the OpenAI client."""
-        self._client = AsyncOpenAI(api_key=self.api_key)
+        if self._client is not None:
+            return
+        # No await between lookup and insert, so the pool needs no lock
+        self._pool_key = _pool_key(self.api_key)
+        self._client, self._http = _acquire_client(self._pool_key)
         # Create instructor-patched client for structured outputs
         self._instructor_client = instructor.from_openai(self._client)
 
+    async def _ensure_initialized(self) -> None:
+        """Initialize on first use without racing concurrent callers."""
+        if self._client is None:
+            async with self._init_lock:
+                if self._client is None:
+                    await self.initialize()
+
     def _llm_message_to_openai_dict(
         self, msg: LLMMessage
     ) -> Union[dict[str, Any], list[dict[str, Any]]]:
@@ -49,6 +214,12 @@ class OpenAIClient(BaseProviderClient):
 
         Returns either a single dict or a list of dicts (for tool results).
         """
+        # Fast path for the common case: plain user/assistant/system text
+        if not msg.tool_call_results and not msg.tool_calls:
+            if msg.role == LLMMessageRole.SYSTEM:
+                return _system_message_dict(msg.content)
+            return {"role": msg.role, "content": msg.content}
+
         # Handle tool result messages
         if msg.role == LLMMessageRole.TOOL and msg.tool_call_results:
             # OpenAI expects tool results as separate messages for each result
@@ -85,13 +256,9 @@ class OpenAIClient(BaseProviderClient):
                 assistant_msg["tool_calls"] = tool_calls
             return assistant_msg
 
-        # Handle system messages
-        elif msg.role == LLMMessageRole.SYSTEM:
-            return {"role": "system", "content": msg.content}
-
-        # Handle regular user/assistant messages
+        # Tool state on a role that doesn't carry it is sent as plain content
         else:
-            return {"role": msg.role.value, "content": msg.content}
+            return {"role": msg.role, "content": msg.content}
 
     def _convert_messages_to_openai(self, messages: list[LLMMessage]) -> list[dict[str, Any]]:
         """Convert our Message format to OpenAI's format."""
@@ -104,6 +271,8 @@ class OpenAIClient(BaseProviderClient):
             else:
                 openai_messages.append(result)
 
+        if LLM_CLIENT_CONFIG["merge_adjacent_messages"]:
+            return _merge_adjacent_messages(openai_messages)
         return openai_messages
 
     def _parse_openai_response(
@@ -112,20 +281,20 @@ class OpenAIClient(BaseProviderClient):
         """Parse OpenAI response into our format."""
         choice = response.choices[0]
         content = choice.message.content or ""
-        tool_calls = []
+        tool_calls: list[ToolCall] = []
 
         # Check for tool calls
         if has_tools and hasattr(choice.message, "tool_calls") and choice.message.tool_calls:
             for tc in choice.message.tool_calls:
                 if hasattr(tc, "function"):
                     tool_calls.append(
-                        {
-                            "id": tc.id,
-                            "name": tc.function.name,
-                            "arguments": json.loads(tc.function.arguments)
+                        ToolCall(
+                            id=tc.id,
+                            name=tc.function.name,
+                            arguments=json.loads(tc.function.arguments)
                             if tc.function.arguments
                             else {},
-                        }
+                        )
                     )
 
         # Parse usage
@@ -159,18 +328,26 @@ class OpenAIClient(BaseProviderClient):
         max_tokens: Optional[int] = None,
         stream: bool = False,
         tools: Optional[list[Tool]] = None,
+        bucket_max_tokens: bool = True,
         **kwargs: Any,
     ) -> Union[LLMMessage, AsyncIterator[LLMStreamEvent]]:
-        """Generate text from OpenAI."""
-        if not self._client:
-            await self.initialize()
+        """Generate text from OpenAI.
+
+        With bucket_max_tokens, an unset max_tokens defaults to the largest of a few
+        fixed budgets (256 to 4096) within the model's output limit, instead of the
+        full limit. An explicit max_tokens is always sent as given.
+        """
+        await self._ensure_initialized()
 
         model = model or self.default_model
 
         # Get model info for max tokens
         model_info = get_model(model)
         if max_tokens is None:
-            max_tokens = model_info.max_output_tokens or 4096
+            if bucket_max_tokens:
+                max_tokens = _bucket_max_tokens(model_info.max_output_tokens)
+            else:
+                max_tokens = model_info.max_output_tokens or 4096
 
         # Prepare request
         openai_messages = self._convert_messages_to_openai(messages)
@@ -244,7 +421,11 @@ class OpenAIClient(BaseProviderClient):
 
         if not self._client:
             raise RuntimeError("OpenAI client not initialized")
-        stream = await self._client.chat.completions.create(**request_params)
+        stream: AsyncIterator[Any]
+        if LLM_CLIENT_CONFIG["fast_stream_parsing"]:
+            stream = self._stream_raw_chunks(request_params)
+        else:
+            stream = await self._client.chat.completions.create(**request_params)
 
         async for chunk in stream:
             if chunk.choices:
@@ -263,6 +444,27 @@ class OpenAIClient(BaseProviderClient):
                         metadata={"finish_reason": choice.finish_reason},
                     )
 
+    async def _stream_raw_chunks(
+        self, request_params: dict[str, Any]
+    ) -> AsyncIterator[_StreamChunk]:
+        """Stream chat completion chunks, decoding the SSE lines with msgspec.
+
+        Skips the SDK's per-chunk Pydantic model construction, which dominates
+        CPU time for fast-token models.
+        """
+        if not self._client:
+            raise RuntimeError("OpenAI client not initialized")
+        async with self._client.chat.completions.with_streaming_response.create(
+            **request_params
+        ) as response:
+            async for line in response.iter_lines():
+                if not line.startswith("data: "):
+                    continue
+                data = line[6:]
+                if data == "[DONE]":
+                    break
+                yield _STREAM_CHUNK_DECODER.decode(data)
+
     async def generate_structured(
         self,
         messages: list[LLMMessage],
@@ -270,18 +472,29 @@ class OpenAIClient(BaseProviderClient):
         model: Optional[str] = None,
         temperature: float = 0.7,
         max_tokens: Optional[int] = None,
+        bucket_max_tokens: bool = True,
         **kwargs: Any,
     ) -> Any:
-        """Generate structured output using Instructor."""
-        if not self._instructor_client:
-            await self.initialize()
+        """Generate structured output, falling back to Instructor when needed.
+
+        Pydantic models are first requested with one forced tool call. If the
+        arguments fail validation, Instructor re-asks the model with the
+        remaining attempts of max_retries (default 3), so the total number of
+        LLM calls stays within the same budget as using Instructor alone.
+
+        An unset max_tokens is bucketed the same way as in generate().
+        """
+        await self._ensure_initialized()
 
         model = model or self.default_model
 
         # Get model info for max tokens
         model_info = get_model(model)
         if max_tokens is None:
-            max_tokens = model_info.max_output_tokens or 4096
+            if bucket_max_tokens:
+                max_tokens = _bucket_max_tokens(model_info.max_output_tokens)
+            else:
+                max_tokens = model_info.max_output_tokens or 4096
 
         # O3-pro requires special handling as it's not a chat model
         if model == ModelID.O3_PRO.value:
@@ -296,12 +509,7 @@ class OpenAIClient(BaseProviderClient):
         # Check if this is an O3 model that needs special handling
         is_o3_model = model in [ModelID.O3.value, ModelID.O3_PRO.value, ModelID.O4_MINI.value]
 
-        request_params = {
-            "model": model,
-            "messages": openai_messages,
-            "response_model": response_model,
-            **kwargs,
-        }
+        request_params = {"model": model, "messages": openai_messages, **kwargs}
 
         # O3 models only support temperature=1
         if is_o3_model:
@@ -315,14 +523,79 @@ class OpenAIClient(BaseProviderClient):
         else:
             request_params["max_tokens"] = max_tokens
 
+        # Instructor's own option; the fast path sends request_params to the API as is
+        max_attempts = request_params.pop("max_retries", _STRUCTURED_OUTPUT_ATTEMPTS)
+
+        # Fast path: force a call to the cached schema tool and validate it ourselves.
+        # It needs tools/tool_choice for itself, so callers passing their own go
+        # straight to Instructor.
+        if (
+            isinstance(max_attempts, int)
+            and isinstance(response_model, type)
+            and issubclass(response_model, BaseModel)
+            and "tools" not in request_params
+            and "tool_choice" not in request_params
+        ):
+            result = await self._generate_structured_fast(request_params, response_model)
+            if result is not None:
+                return result
+            # The failed fast-path call counts as the first attempt, so a bad
+            # response costs no more LLM calls than going to Instructor directly
+            # (Instructor still gets one attempt if the caller allowed only one)
+            max_attempts = max(max_attempts - 1, 1)
+            logger.warning(
+                "Structured output for %s failed validation, retrying through Instructor",
+                response_model.__name__,
+            )
+
+        # Fall back to Instructor, which re-asks the model on validation errors
         if not self._instructor_client:
             raise RuntimeError("Instructor client not initialized")
-        return await self._instructor_client.chat.completions.create(**request_params)
+        return await self._instructor_client.chat.completions.create(
+            response_model=response_model, max_retries=max_attempts, **request_params
+        )
+
+    async def _generate_structured_fast(
+        self, request_params: dict[str, Any], response_model: type[BaseModel]
+    ) -> Optional[BaseModel]:
+        """Generate structured output with a single forced tool call.
+
+        Skips Instructor's per-call schema derivation and retry handling.
+
+        Returns:
+            The validated response, or None if the model did not return valid arguments
+        """
+        if not self._client:
+            raise RuntimeError("OpenAI client not initialized")
+        tool = _structured_output_tool(response_model)
+        tool_choice: ChatCompletionNamedToolChoiceParam = {
+            "type": "function",
+            "function": {"name": tool["function"]["name"]},
+        }
+        response = await self._client.chat.completions.create(
+            **request_params, tools=[tool], tool_choice=tool_choice
+        )
+
+        tool_calls = response.choices[0].message.tool_calls if response.choices else None
+        if not tool_calls or not hasattr(tool_calls[0], "function"):
+            return None
+        try:
+            return response_model.model_validate_json(tool_calls[0].function.arguments)
+        except ValidationError:
+            return None
 
     async def close(self) -> None:
         """Close the client."""
-        if self._client:
-            await self._client.close()
+        if self._client is None or self._pool_key is None:
+            return
+        self._client = None
+        self._http = None
+        self._instructor_client = None
+        # Close the httpx client we own once no other OpenAIClient shares it
+        http_client = _release_client(self._pool_key)
+        self._pool_key = None
+        if http_client is not None:
+            await http_client.aclose()
 
     @property
     def name(self) -> str:
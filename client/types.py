@@ -8,7 +8,10 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Optional
 
-from pydantic import BaseModel
+from pydantic.config import ConfigDict
+from pydantic.main import BaseModel
+
+from common.types import ToolCall, ToolCallResult
 
 
 class LLMMessageRole(str, Enum):
@@ -31,30 +34,21 @@ class LLMMessage(BaseModel):
     Agents never see or use LLMMessage directly.
     """
 
+    # Roles are stored as their plain string values, so dumps need no enum pass
+    model_config = ConfigDict(use_enum_values=True)
+
     role: LLMMessageRole
     content: str = ""  # Default empty string for tool-only responses
     name: Optional[str] = None
-    tool_calls: Optional[list[Any]] = None  # Provider-specific tool call format
+    tool_calls: Optional[list[ToolCall]] = None  # Normalized from each provider's format
     tool_call_id: Optional[str] = None
-    tool_call_results: Optional[list[Any]] = None  # For TOOL role messages
+    tool_call_results: Optional[list[ToolCallResult]] = None  # For TOOL role messages
     finish_reason: Optional[str] = None  # For responses: stop, tool_calls, etc
     usage: Optional["LLMTokenUsage"] = None  # For responses: token usage info
     model: Optional[str] = None  # For responses: model that generated this
 
-    class Config:
-        """Pydantic configuration."""
-
-        json_encoders = {LLMMessageRole: lambda v: v.value}
-
-    def model_dump(self, **kwargs: Any) -> dict[str, Any]:
-        """Override to ensure enums are serialized as strings."""
-        data = super().model_dump(**kwargs)
-        if "role" in data and isinstance(data["role"], LLMMessageRole):
-            data["role"] = data["role"].value
-        return data
 
-
-@dataclass
+@dataclass(slots=True)
 class LLMTokenUsage:
     """Token usage information."""
 
@@ -63,7 +57,13 @@ class LLMTokenUsage:
     total_tokens: int
 
 
-@dataclass
+# LLMMessage refers to LLMTokenUsage before it is defined, which leaves its
+# validator and serializer unbuilt until first use. Build them at import instead
+# so the first LLM call doesn't pay for schema compilation.
+LLMMessage.model_rebuild()
+
+
+@dataclass(slots=True)
 class LLMStreamChunk:
     """A chunk of streaming content."""
 
@@ -85,7 +85,7 @@ class LLMStreamEventType(str, Enum):
     USAGE = "usage"  # Token usage information
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMStreamEvent:
     """A streaming event that can represent different types of stream data.
 
@@ -1,15 +1,44 @@
 """Unified message system for agent communication."""
 
+import sys
+import threading
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any, Optional, Union
+from typing import Annotated, Any, Literal, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic.fields import Field
+from pydantic.functional_validators import AfterValidator, SkipValidation
+from pydantic.main import BaseModel
+from pydantic.type_adapter import TypeAdapter
 
 # Default agent IDs
 DEFAULT_AGENT_ID = "METAGEN"  # Default agent ID for MetaAgent
 
+# Agent and session IDs repeat across every message of a session; interning
+# them shares one string object and makes routing-key comparisons identity checks
+_InternedStr = Annotated[str, AfterValidator(sys.intern)]
+
+# Per-thread (monotonic time, datetime) of the last timestamp handed out
+_now_cache = threading.local()
+
+
+def _fast_now() -> datetime:
+    """Return the current local time, reusing the last value for up to 1ms.
+
+    Streaming creates messages in bursts; sub-millisecond precision is not
+    needed for their timestamps, and datetime objects are immutable so the
+    cached value can be shared.
+    """
+    mono = time.monotonic()
+    cached: Optional[tuple[float, datetime]] = getattr(_now_cache, "value", None)
+    if cached is not None and mono - cached[0] < 0.001:
+        return cached[1]
+    now = datetime.now()
+    _now_cache.value = (mono, now)
+    return now
+
 
 class MessageType(str, Enum):
     """Types of messages in the system."""
@@ -37,9 +66,9 @@ class Message(BaseModel):
     """Base message class for all communication."""
 
     type: MessageType
-    timestamp: datetime = Field(default_factory=datetime.now)
-    agent_id: str = DEFAULT_AGENT_ID  # TODO: This should be set properly by each agent
-    session_id: str  # Required - for routing responses to correct client(s)
+    timestamp: datetime = Field(default_factory=_fast_now)
+    agent_id: _InternedStr = DEFAULT_AGENT_ID  # TODO: This should be set properly by each agent
+    session_id: _InternedStr  # Required - for routing responses to correct client(s)
     # TODO: Consider adding task_id as well for task context tracking
     # TODO: Review if we need both agent_id on Message base and on
     # specific messages like ApprovalRequest
@@ -48,6 +77,10 @@ class Message(BaseModel):
         """Convert to dictionary for JSON serialization."""
         return self.model_dump(mode="json")
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize straight to UTF-8 JSON bytes without building a dict first."""
+        return self.__pydantic_serializer__.to_json(self)
+
 
 # Structured data models
 class ToolCallRequest(BaseModel):
@@ -68,26 +101,26 @@ class ChatMessage(Message):
 class UserMessage(ChatMessage):
     """User chat message."""
 
-    type: MessageType = MessageType.USER
+    type: Literal[MessageType.USER] = MessageType.USER
 
 
 class AgentMessage(ChatMessage):
     """Agent chat message."""
 
-    type: MessageType = MessageType.AGENT
+    type: Literal[MessageType.AGENT] = MessageType.AGENT
     final: bool = False  # Indicates if this is the final message in a response
 
 
 class SystemMessage(ChatMessage):
     """System message for agent context."""
 
-    type: MessageType = MessageType.SYSTEM
+    type: Literal[MessageType.SYSTEM] = MessageType.SYSTEM
 
 
 class ThinkingMessage(Message):
     """Agent thinking indicator."""
 
-    type: MessageType = MessageType.THINKING
+    type: Literal[MessageType.THINKING] = MessageType.THINKING
     content: str
 
 
@@ -95,14 +128,14 @@ class ThinkingMessage(Message):
 class ToolCallMessage(Message):
     """LLM wants to call tools - contains all tool call details."""
 
-    type: MessageType = MessageType.TOOL_CALL
+    type: Literal[MessageType.TOOL_CALL] = MessageType.TOOL_CALL
     tool_calls: list[ToolCallRequest]  # Properly typed tool calls
 
 
 class ApprovalRequestMessage(Message):
     """Agent requests approval for a specific tool."""
 
-    type: MessageType = MessageType.APPROVAL_REQUEST
+    type: Literal[MessageType.APPROVAL_REQUEST] = MessageType.APPROVAL_REQUEST
     tool_id: str
     tool_name: str
     tool_args: dict[str, Any]
@@ -118,7 +151,7 @@ class ApprovalDecision(str, Enum):
 class ApprovalResponseMessage(Message):
     """User responds to approval request."""
 
-    type: MessageType = MessageType.APPROVAL_RESPONSE
+    type: Literal[MessageType.APPROVAL_RESPONSE] = MessageType.APPROVAL_RESPONSE
     tool_id: str
     decision: ApprovalDecision
     feedback: Optional[str] = None
@@ -127,7 +160,7 @@ class ApprovalResponseMessage(Message):
 class ToolStartedMessage(Message):
     """Agent notifies tool execution started."""
 
-    type: MessageType = MessageType.TOOL_STARTED
+    type: Literal[MessageType.TOOL_STARTED] = MessageType.TOOL_STARTED
     tool_id: str
     tool_name: str
 
@@ -135,16 +168,16 @@ class ToolStartedMessage(Message):
 class ToolResultMessage(Message):
     """Agent sends tool execution result."""
 
-    type: MessageType = MessageType.TOOL_RESULT
+    type: Literal[MessageType.TOOL_RESULT] = MessageType.TOOL_RESULT
     tool_id: str
     tool_name: str
-    result: Any
+    result: SkipValidation[Any]  # Passed through as-is; tool output can be large
 
 
 class ToolErrorMessage(Message):
     """Agent sends tool execution error."""
 
-    type: MessageType = MessageType.TOOL_ERROR
+    type: Literal[MessageType.TOOL_ERROR] = MessageType.TOOL_ERROR
     tool_id: str
     tool_name: str
     error: str
@@ -154,7 +187,7 @@ class ToolErrorMessage(Message):
 class UsageMessage(Message):
     """Token usage information."""
 
-    type: MessageType = MessageType.USAGE
+    type: Literal[MessageType.USAGE] = MessageType.USAGE
     input_tokens: int
     output_tokens: int
     total_tokens: int
@@ -163,25 +196,29 @@ class UsageMessage(Message):
 class ErrorMessage(Message):
     """Error message from agent."""
 
-    type: MessageType = MessageType.ERROR
+    type: Literal[MessageType.ERROR] = MessageType.ERROR
     error: str
     details: Optional[dict[str, Any]] = None
 
 
-# Union type for all messages
-AnyMessage = Union[
-    UserMessage,
-    AgentMessage,
-    SystemMessage,
-    ThinkingMessage,
-    ToolCallMessage,
-    ApprovalRequestMessage,
-    ApprovalResponseMessage,
-    ToolStartedMessage,
-    ToolResultMessage,
-    ToolErrorMessage,
-    UsageMessage,
-    ErrorMessage,
+# Union type for all messages, discriminated on `type` so validation jumps
+# straight to the matching class instead of trying each variant in turn
+AnyMessage = Annotated[
+    Union[
+        UserMessage,
+        AgentMessage,
+        SystemMessage,
+        ThinkingMessage,
+        ToolCallMessage,
+        ApprovalRequestMessage,
+        ApprovalResponseMessage,
+        ToolStartedMessage,
+        ToolResultMessage,
+        ToolErrorMessage,
+        UsageMessage,
+        ErrorMessage,
+    ],
+    Field(discriminator="type"),
 ]
 
 # SSE streaming message type - used for documenting the streaming endpoint
@@ -292,6 +329,11 @@ def create_error_message(
     return ErrorMessage(agent_id=agent_id, session_id=session_id, error=error, details=details)
 
 
+# Built once at import; validating against the discriminated union resolves the
+# message class from the `type` tag inside pydantic-core
+_MESSAGE_ADAPTER: TypeAdapter[AnyMessage] = TypeAdapter(AnyMessage)
+
+
 def message_from_dict(data: dict[str, Any]) -> Message:
     """Reconstruct a Message object from a dictionary.
 
@@ -302,39 +344,38 @@ def message_from_dict(data: dict[str, Any]) -> Message:
         Appropriate Message subclass instance
 
     Raises:
-        ValueError: If message type is unknown
+        ValueError: If the type field is missing or unknown, or the data is invalid
     """
-    msg_type = data.get("type")
-    if msg_type is None:
+    if data.get("type") is None:
         raise ValueError("Missing 'type' field in message data")
 
-    # Map MessageType enum values to Message classes
-    type_map: dict[str, type[Message]] = {
-        MessageType.AGENT.value: AgentMessage,
-        MessageType.USER.value: UserMessage,
-        MessageType.SYSTEM.value: SystemMessage,
-        MessageType.THINKING.value: ThinkingMessage,
-        MessageType.TOOL_CALL.value: ToolCallMessage,
-        MessageType.TOOL_RESULT.value: ToolResultMessage,
-        MessageType.TOOL_STARTED.value: ToolStartedMessage,
-        MessageType.TOOL_ERROR.value: ToolErrorMessage,
-        MessageType.APPROVAL_REQUEST.value: ApprovalRequestMessage,
-        MessageType.APPROVAL_RESPONSE.value: ApprovalResponseMessage,
-        MessageType.ERROR.value: ErrorMessage,
-        MessageType.USAGE.value: UsageMessage,
-    }
-
-    message_class = type_map.get(msg_type)
-    if not message_class:
-        raise ValueError(f"Unknown message type: {msg_type}")
-
-    # Use Pydantic validation
-    return message_class(**data)
-
-
-@dataclass
+    return _MESSAGE_ADAPTER.validate_python(data)
+
+
+def message_from_json(data: Union[str, bytes]) -> Message:
+    """Reconstruct a Message object straight from its JSON encoding.
+
+    Parses and validates in one pass, without building an intermediate dict.
+
+    Args:
+        data: JSON text as produced by Message.to_json_bytes()
+
+    Returns:
+        Appropriate Message subclass instance
+
+    Raises:
+        ValueError: If the JSON is malformed, the type is unknown, or the data is invalid
+    """
+    return _MESSAGE_ADAPTER.validate_json(data)
+
+
+@dataclass(slots=True, frozen=True)
 class PendingApproval:
-    """Pending approval request."""
+    """Pending approval request.
+
+    Frozen so instances can be shared and embedded in message payloads (e.g.
+    tool_args) without defensive copies.
+    """
 
     tool_id: str
     tool_name: str
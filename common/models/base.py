@@ -1,20 +1,148 @@
 """Base models and mixins for SQLModel."""
 
-from datetime import datetime
+import os
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Callable
 
+from sqlalchemy import Insert, Update, insert, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import Field, SQLModel
 
 
-class TimestampedModel(SQLModel):
+def utc_now() -> datetime:
+    """Return the current UTC time as a naive datetime.
+
+    Stored timestamps and every comparison against them are naive UTC, so this
+    keeps that representation while avoiding the deprecated datetime.utcnow().
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def new_id() -> str:
+    """Return a new time-ordered UUID (version 7) string for a primary key.
+
+    The leading 48 bits are the Unix time in milliseconds and the rest is
+    random, so new rows land at the right edge of the primary key index
+    instead of at random leaf pages, and ids sort roughly by creation time.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10))
+    # Set the version (7) and RFC 9562 variant (0b10) bits
+    value = value & ~(0xF << 76) | 0x7 << 76
+    value = value & ~(0x3 << 62) | 0x2 << 62
+    return str(uuid.UUID(int=value))
+
+
+# Bulk statements per model class (and replace flag), built on first use. Plain
+# dicts rather than functools.cache: table model classes are not Hashable to mypy.
+_INSERT_STATEMENTS: dict[tuple[type, bool], Insert] = {}
+_UPDATE_STATEMENTS: dict[type, Update] = {}
+
+
+def _insert_statement(model: type, replace: bool) -> Insert:
+    """Build a model's bulk INSERT once and reuse it for every batch."""
+    stmt = _INSERT_STATEMENTS.get((model, replace))
+    if stmt is None:
+        stmt = insert(model)
+        if replace:
+            stmt = stmt.prefix_with("OR REPLACE")
+        _INSERT_STATEMENTS[(model, replace)] = stmt
+    return stmt
+
+
+def _update_statement(model: type) -> Update:
+    """Build a model's bulk UPDATE-by-primary-key once and reuse it for every batch."""
+    stmt = _UPDATE_STATEMENTS.get(model)
+    if stmt is None:
+        stmt = _UPDATE_STATEMENTS[model] = update(model)
+    return stmt
+
+
+class BulkWriteMixin:
+    """Batched writes for table models.
+
+    These go through a single executemany statement instead of the ORM unit of
+    work, so no model instance is built or tracked per row. Callers own the
+    transaction: commit once after the batch.
+    """
+
+    @classmethod
+    def _batch_defaults(cls) -> tuple[dict[str, Any], dict[str, Callable[[], Any]]]:
+        """Model field defaults for one batch.
+
+        Core inserts don't run Pydantic defaults (and explicit sa_columns carry no
+        column default), so they are filled in here. Each default factory runs
+        once per batch, so e.g. created_at is one shared 'now'. Primary keys must
+        be unique per row, so their factories are returned separately.
+
+        Returns:
+            Shared defaults by field name, and primary key default factories
+        """
+        primary_keys = {c.name for c in cls.__table__.primary_key}  # type: ignore[attr-defined]
+        defaults: dict[str, Any] = {}
+        key_factories: dict[str, Callable[[], Any]] = {}
+        for name, field in cls.model_fields.items():  # type: ignore[attr-defined]
+            if field.is_required():
+                continue
+            if name not in primary_keys:
+                defaults[name] = field.get_default(call_default_factory=True)
+            elif field.default_factory is not None:
+                key_factories[name] = field.default_factory
+        return defaults, key_factories
+
+    @classmethod
+    async def bulk_insert(
+        cls, session: AsyncSession, rows: list[dict[str, Any]], replace: bool = False
+    ) -> None:
+        """Insert many rows with one executemany statement.
+
+        Args:
+            session: Session whose transaction the insert joins
+            rows: Column values per row; missing columns get their defaults, and
+                missing primary keys a fresh value each (e.g. new_id())
+            replace: Replace existing rows with the same primary key instead of
+                failing. SQLite only (INSERT OR REPLACE).
+
+        Raises:
+            NotImplementedError: If replace is requested on a non-SQLite database
+        """
+        if not rows:
+            return
+        if replace and session.get_bind().dialect.name != "sqlite":
+            raise NotImplementedError("bulk_insert(replace=True) is only supported on SQLite")
+        defaults, key_factories = cls._batch_defaults()
+        values = [{**defaults, **row} for row in rows]
+        for name, factory in key_factories.items():
+            for row_values in values:
+                if row_values.get(name) is None:
+                    row_values[name] = factory()
+        await session.execute(_insert_statement(cls, replace), values)
+
+    @classmethod
+    async def bulk_update(cls, session: AsyncSession, rows: list[dict[str, Any]]) -> None:
+        """Update many rows by primary key with one executemany statement.
+
+        Args:
+            session: Session whose transaction the update joins
+            rows: Column values per row, each including the primary key
+        """
+        if not rows:
+            return
+        if "updated_at" in cls.__table__.c:  # type: ignore[attr-defined]
+            now = utc_now()
+            rows = [{"updated_at": now, **row} for row in rows]
+        await session.execute(_update_statement(cls), rows)
+
+
+class TimestampedModel(BulkWriteMixin, SQLModel):
     """Base model with created_at and updated_at timestamps.
 
     This is a mixin that can be inherited by other models to automatically
     include timestamp fields.
     """
 
-    created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    created_at: datetime = Field(default_factory=utc_now, nullable=False)
     updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
-        nullable=False,
-        sa_column_kwargs={"onupdate": datetime.utcnow},
+        default_factory=utc_now, nullable=False, sa_column_kwargs={"onupdate": utc_now}
     )
@@ -0,0 +1,27 @@
+"""Relationship loading helpers for read queries."""
+
+from typing import Any, TypeVar
+
+from sqlalchemy.orm import QueryableAttribute, raiseload, selectinload
+from sqlalchemy.sql import Select
+
+S = TypeVar("S", bound=Select[Any])
+
+
+def strict_load(stmt: S, *eager: QueryableAttribute[Any]) -> S:
+    """Eagerly load the given relationships and forbid loading any others.
+
+    Relationships listed in ``eager`` are loaded with one extra
+    ``WHERE ... IN (...)`` query each. Every other relationship on the loaded
+    objects raises on access instead of silently issuing a query per row
+    (and is skipped even if its default loader is eager), so N+1 regressions
+    fail loudly in tests.
+
+    Args:
+        stmt: The select statement to configure
+        *eager: Relationship attributes to load up front
+
+    Returns:
+        The statement with loader options applied
+    """
+    return stmt.options(*(selectinload(attr) for attr in eager), raiseload("*"))
@@ -6,10 +6,10 @@ These models serve as both SQLAlchemy ORM models and Pydantic validation models.
 from datetime import datetime
 from typing import Any, Optional
 
-from sqlalchemy import JSON, Column, Index, String
+from sqlalchemy import JSON, Column, Index, String, text
 from sqlmodel import Field, Relationship
 
-from .base import TimestampedModel
+from .base import TimestampedModel, new_id, utc_now
 from .enums import ToolUsageStatus, TurnStatus
 
 
@@ -23,17 +23,16 @@ class ConversationTurn(TimestampedModel, table=True):
     __tablename__ = "conversation_turns"
 
     # Primary identification
-    id: str = Field(primary_key=True, description="Unique turn ID")
+    id: str = Field(default_factory=new_id, primary_key=True, description="Unique turn ID")
     agent_id: str = Field(
         index=True,
         default="METAGEN",
         description="Agent identifier (METAGEN, TASK_EXECUTION_123, etc.)",
     )
-    session_id: str = Field(index=True, description="Session identifier for multi-client routing")
+    # Indexed via the (session_id, ...) compound indexes below
+    session_id: str = Field(description="Session identifier for multi-client routing")
     turn_number: int = Field(description="Sequential turn number for this agent")
-    timestamp: datetime = Field(
-        default_factory=datetime.utcnow, index=True, description="Turn start time"
-    )
+    timestamp: datetime = Field(default_factory=utc_now, index=True, description="Turn start time")
 
     # Entity tracking for flexible conversations
     source_entity: str = Field(description="Who initiated this turn (USER, METAGEN, etc.)")
@@ -84,8 +83,11 @@ class ConversationTurn(TimestampedModel, table=True):
     __table_args__ = (
         Index("idx_turns_agent_number", "agent_id", "turn_number"),
         Index("idx_turns_agent_time", "agent_id", "timestamp"),
+        Index("idx_turns_session_time", "session_id", "timestamp"),
+        Index("idx_turns_session_agent_time", "session_id", "agent_id", "timestamp"),
         Index("idx_turns_agent_turn_unique", "agent_id", "turn_number", unique=True),
-        Index("idx_turns_compacted", "compacted"),
+        # Only the (few) turns still awaiting compaction, in the order they are read
+        Index("idx_turns_uncompacted", "timestamp", sqlite_where=text("compacted = 0")),
         Index("idx_turns_source_entity", "source_entity"),
         Index("idx_turns_target_entity", "target_entity"),
         Index("idx_turns_conversation_type", "conversation_type"),
@@ -102,7 +104,7 @@ class ToolUsage(TimestampedModel, table=True):
     __tablename__ = "tool_usage"
 
     # Primary identification
-    id: str = Field(primary_key=True, description="Unique tool usage ID")
+    id: str = Field(default_factory=new_id, primary_key=True, description="Unique tool usage ID")
     turn_id: str = Field(
         foreign_key="conversation_turns.id",
         index=True,
@@ -154,7 +156,17 @@ class ToolUsage(TimestampedModel, table=True):
     conversation_turn: Optional[ConversationTurn] = Relationship(back_populates="tool_usages")
 
     # Table configuration
-    __table_args__ = (Index("idx_tool_usage_created", "created_at"),)
+    __table_args__ = (
+        Index("idx_tool_usage_created", "created_at"),
+        Index("idx_tool_usage_turn_status", "turn_id", "execution_status"),
+        # The approval queue: tools awaiting the user by status, oldest first
+        Index(
+            "idx_tool_usage_approval_queue",
+            "execution_status",
+            "created_at",
+            sqlite_where=text("requires_approval = 1"),
+        ),
+    )
 
 
 class CompactMemory(TimestampedModel, table=True):
@@ -167,7 +179,7 @@ class CompactMemory(TimestampedModel, table=True):
     __tablename__ = "compact_memories"
 
     # Primary identification
-    id: str = Field(primary_key=True, description="Unique memory ID")
+    id: str = Field(default_factory=new_id, primary_key=True, description="Unique memory ID")
 
     # Time range covered
     start_time: datetime = Field(index=True, description="Start of time range")
@@ -204,12 +216,13 @@ class CompactMemory(TimestampedModel, table=True):
     )
 
     # Processing status
-    processed: bool = Field(
-        default=False, index=True, description="Whether semantic processing is complete"
-    )
+    processed: bool = Field(default=False, description="Whether semantic processing is complete")
 
     # Table configuration
-    __table_args__ = (Index("idx_compact_memories_time_range", "start_time", "end_time"),)
+    __table_args__ = (
+        Index("idx_compact_memories_time_range", "start_time", "end_time"),
+        Index("idx_compact_memories_unprocessed", "created_at", sqlite_where=text("processed = 0")),
+    )
 
 
 class LongTermMemory(TimestampedModel, table=True):
@@ -218,7 +231,7 @@ class LongTermMemory(TimestampedModel, table=True):
     __tablename__ = "long_term_memories"
 
     # Primary identification
-    id: str = Field(primary_key=True, description="Unique memory ID")
+    id: str = Field(default_factory=new_id, primary_key=True, description="Unique memory ID")
 
     # Task context
     task_id: Optional[str] = Field(
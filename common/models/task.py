@@ -3,6 +3,7 @@
 These models serve as both SQLAlchemy ORM models and Pydantic validation models.
 """
 
+from collections.abc import Collection
 from typing import Any, Optional
 
 from pydantic import BaseModel
@@ -10,7 +11,7 @@ from pydantic import Field as PydanticField
 from sqlalchemy import Column
 from sqlmodel import Field
 
-from .base import TimestampedModel
+from .base import TimestampedModel, new_id
 from .enums import ParameterType
 from .types import PydanticJSON
 
@@ -35,6 +36,25 @@ class TaskDefinition(BaseModel):
     output_schema: list[Parameter] = PydanticField(default_factory=list)
     task_type: str = PydanticField(default="general")
 
+    def get_input_parameter(self, name: str) -> Optional[Parameter]:
+        """Look up an input parameter by name."""
+        return next((param for param in self.input_schema if param.name == name), None)
+
+    def missing_required_inputs(self, provided: Collection[str]) -> list[str]:
+        """Return required input parameter names not present in ``provided``.
+
+        Args:
+            provided: Names of the supplied input values (e.g. a dict's keys)
+
+        Returns:
+            Missing names in input_schema order; empty if all are present
+        """
+        return [
+            param.name
+            for param in self.input_schema
+            if param.required and param.name not in provided
+        ]
+
 
 class TaskConfig(TimestampedModel, table=True):
     """Model for task configuration storage.
@@ -46,7 +66,7 @@ class TaskConfig(TimestampedModel, table=True):
     __tablename__ = "task_configs"
 
     # Primary identification
-    id: str = Field(primary_key=True, description="Unique task config ID")
+    id: str = Field(default_factory=new_id, primary_key=True, description="Unique task config ID")
     name: str = Field(index=True, description="Human-readable task name")
 
     # Task definition stored as JSON with automatic serialization
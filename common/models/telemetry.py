@@ -6,11 +6,14 @@ These models serve as both SQLAlchemy ORM models and Pydantic validation models.
 from datetime import datetime
 from typing import Any, Optional
 
-from sqlalchemy import JSON, Column, Index
+from sqlalchemy import Column, Index
 from sqlmodel import Field, SQLModel
 
+from .base import BulkWriteMixin, utc_now
+from .types import MsgpackType
 
-class TelemetrySpan(SQLModel, table=True):
+
+class TelemetrySpan(BulkWriteMixin, SQLModel, table=True):
     """Model for OpenTelemetry spans.
 
     Stores distributed tracing data for observability.
@@ -32,17 +35,21 @@ class TelemetrySpan(SQLModel, table=True):
     end_time: Optional[float] = Field(default=None, description="End time as Unix timestamp")
     duration_ms: Optional[float] = Field(default=None, description="Duration in milliseconds")
 
-    # Span data
+    # Span data, written on every export and only ever read back whole
     attributes: Optional[dict[str, Any]] = Field(
-        default=None, sa_column=Column(JSON), description="Span attributes as key-value pairs"
+        default=None,
+        sa_column=Column(MsgpackType),
+        description="Span attributes as key-value pairs",
     )
     events: Optional[list[dict[str, Any]]] = Field(
-        default=None, sa_column=Column(JSON), description="Events that occurred during the span"
+        default=None,
+        sa_column=Column(MsgpackType),
+        description="Events that occurred during the span",
     )
     status: Optional[str] = Field(default=None, description="Span status (OK, ERROR, etc)")
 
     # Metadata
-    created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    created_at: datetime = Field(default_factory=utc_now, nullable=False)
 
     # Table configuration
     __table_args__ = (
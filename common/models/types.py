@@ -1,11 +1,28 @@
 """Custom SQLAlchemy types for Pydantic model serialization."""
 
-from typing import Any
+from typing import Any, Optional, Union
 
+import msgspec
 from pydantic import BaseModel
-from sqlalchemy import JSON
+from sqlalchemy import JSON, LargeBinary
 from sqlalchemy.types import TypeDecorator
 
+# Plain JSON columns (llm_context, tool_args, span attributes, ...) are encoded
+# by the engine's json_serializer/json_deserializer; msgspec is several times
+# faster than the stdlib json module SQLAlchemy uses by default.
+_json_encoder = msgspec.json.Encoder()
+_json_decoder = msgspec.json.Decoder()
+
+
+def json_serializer(value: Any) -> str:
+    """Encode a JSON column value to text (engine ``json_serializer``)."""
+    return _json_encoder.encode(value).decode()
+
+
+def json_deserializer(text: Union[str, bytes]) -> Any:
+    """Decode JSON column text (engine ``json_deserializer``)."""
+    return _json_decoder.decode(text)
+
 
 class PydanticJSON(TypeDecorator):
     """Custom SQLAlchemy type for storing Pydantic models as JSON.
@@ -13,6 +30,10 @@ class PydanticJSON(TypeDecorator):
     This type automatically handles serialization of Pydantic models to JSON
     when storing in the database, and deserialization back to Pydantic models
     when loading from the database.
+
+    Values go through the model's compiled pydantic-core serializer and
+    validator; the JSON impl then encodes and decodes the text with the
+    engine's msgspec json_serializer/json_deserializer.
     """
 
     impl = JSON
@@ -26,6 +47,9 @@ class PydanticJSON(TypeDecorator):
         """
         super().__init__()
         self._pydantic_type = pydantic_type
+        # Compiled core schema handles, so each row skips BaseModel.__init__
+        self._validator = pydantic_type.__pydantic_validator__
+        self._serializer = pydantic_type.__pydantic_serializer__
 
     def process_bind_param(self, value: Any, dialect: Any) -> Any:
         """Process value before binding to SQL parameter.
@@ -40,8 +64,10 @@ class PydanticJSON(TypeDecorator):
             JSON-serializable dict or None
         """
         if value is not None:
-            if isinstance(value, BaseModel):
+            if isinstance(value, self._pydantic_type):
                 # Use mode='json' to ensure all fields are JSON serializable
+                return self._serializer.to_python(value, mode="json")
+            elif isinstance(value, BaseModel):
                 return value.model_dump(mode="json")
             elif isinstance(value, dict):
                 # Already a dict, return as-is
@@ -66,7 +92,7 @@ class PydanticJSON(TypeDecorator):
         """
         if value is not None:
             if isinstance(value, dict):
-                return self._pydantic_type(**value)
+                return self._validator.validate_python(value)
             elif isinstance(value, self._pydantic_type):
                 # Already the right type (shouldn't happen but handle gracefully)
                 return value
@@ -92,3 +118,30 @@ class PydanticJSON(TypeDecorator):
     def python_type(self) -> type[BaseModel]:
         """Return the Python type for this column."""
         return self._pydantic_type
+
+
+_msgpack_encoder = msgspec.msgpack.Encoder()
+_msgpack_decoder = msgspec.msgpack.Decoder()
+
+
+class MsgpackType(TypeDecorator):
+    """Custom SQLAlchemy type storing JSON-like values as MessagePack blobs.
+
+    For write-heavy columns that are never queried with SQL JSON functions:
+    the encoding is smaller than JSON text and faster to produce and parse.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect: Any) -> Optional[bytes]:
+        """Encode the value to MessagePack before binding."""
+        if value is None:
+            return None
+        return _msgpack_encoder.encode(value)
+
+    def process_result_value(self, value: Optional[bytes], dialect: Any) -> Any:
+        """Decode a MessagePack blob loaded from the database."""
+        if value is None:
+            return None
+        return _msgpack_decoder.decode(value)
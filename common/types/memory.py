@@ -2,14 +2,25 @@
 
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from common.models.enums import TurnStatus
 from common.types.tools import ToolCall, ToolCallResult
 
 
+class _MemoryRequest(BaseModel):
+    """Base for memory requests.
+
+    Requests are built once per call and only read afterwards, so they are
+    frozen: accidental mutation after handing one to the memory manager fails
+    loudly instead of silently changing what gets recorded.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+
 # Turn Management Types
-class TurnCreationRequest(BaseModel):
+class TurnCreationRequest(_MemoryRequest):
     """Request to create a new conversation turn."""
 
     user_query: str
@@ -22,7 +33,7 @@ class TurnCreationRequest(BaseModel):
     user_metadata: Optional[dict[str, Any]] = None
 
 
-class TurnUpdateRequest(BaseModel):
+class TurnUpdateRequest(_MemoryRequest):
     """Request to update an existing turn."""
 
     turn_id: str
@@ -36,7 +47,7 @@ class TurnUpdateRequest(BaseModel):
     agent_metadata: Optional[dict[str, Any]] = None
 
 
-class TurnCompletionRequest(BaseModel):
+class TurnCompletionRequest(_MemoryRequest):
     """Request to complete a conversation turn."""
 
     turn_id: str
@@ -51,7 +62,7 @@ class TurnCompletionRequest(BaseModel):
 
 
 # Tool Usage Types
-class ToolUsageRequest(BaseModel):
+class ToolUsageRequest(_MemoryRequest):
     """Request to record tool usage."""
 
     tool_name: str
@@ -62,7 +73,7 @@ class ToolUsageRequest(BaseModel):
     tool_call_id: Optional[str] = None
 
 
-class ToolApprovalUpdate(BaseModel):
+class ToolApprovalUpdate(_MemoryRequest):
     """Update for tool approval status."""
 
     tool_usage_id: str
@@ -70,13 +81,13 @@ class ToolApprovalUpdate(BaseModel):
     user_feedback: Optional[str] = None
 
 
-class ToolExecutionStart(BaseModel):
+class ToolExecutionStart(_MemoryRequest):
     """Mark tool execution as started."""
 
     tool_usage_id: str
 
 
-class ToolExecutionComplete(BaseModel):
+class ToolExecutionComplete(_MemoryRequest):
     """Mark tool execution as complete."""
 
     tool_usage_id: str
@@ -1,23 +1,44 @@
 """Task-related types for typed interfaces."""
 
-from typing import Any, Optional
+import json
+import sys
+from typing import Annotated, Any, Callable, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field
 
 from common.models.enums import ParameterType
 
+# Parameter names come from a small fixed set per task; interning lets every
+# execution context share one copy of each and compare keys by identity
+_InternedStr = Annotated[str, AfterValidator(sys.intern)]
+
+# Exact-type renderers for to_string; other types (including subclasses of
+# these) go through the isinstance checks in to_string
+_TO_STRING: dict[type, Callable[[Any], str]] = {
+    str: lambda v: v,
+    bool: str,
+    int: str,
+    float: str,
+    list: json.dumps,
+    dict: json.dumps,
+}
+
 
 class ParameterValue(BaseModel):
     """Runtime value for a task parameter."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     value: Any
     parameter_type: ParameterType
 
     def to_string(self) -> str:
         """Convert to string for instruction substitution."""
+        render = _TO_STRING.get(type(self.value))
+        if render is not None:
+            return render(self.value)
+        # Subclasses such as OrderedDict still render as JSON
         if isinstance(self.value, (list, dict)):
-            import json
-
             return json.dumps(self.value)
         return str(self.value)
 
@@ -25,10 +46,12 @@ class ParameterValue(BaseModel):
 class TaskExecutionContext(BaseModel):
     """In-memory context for task execution."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     task_id: str
     task_name: str
     instructions: str  # Original parameterized instructions
-    input_values: dict[str, ParameterValue]  # The typed parameter values
+    input_values: dict[_InternedStr, ParameterValue]  # The typed parameter values
 
     # Tool call tracking
     tool_call_id: str  # Original tool_call_id from the intercepted execute_task call
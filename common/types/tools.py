@@ -3,7 +3,7 @@
 from enum import Enum
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ToolErrorType(str, Enum):
@@ -35,7 +35,17 @@ TOOL_ERROR_MESSAGES = {
 }
 
 
-class ToolCall(BaseModel):
+class _ToolModel(BaseModel):
+    """Immutable base for tool call types."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize straight to UTF-8 JSON bytes without building a dict first."""
+        return self.__pydantic_serializer__.to_json(self)
+
+
+class ToolCall(_ToolModel):
     """Represents a tool call request from the LLM.
 
     This standardized structure represents what the LLM wants to execute:
@@ -58,13 +68,15 @@ class ToolCall(BaseModel):
     session_id: str = Field(default="", description="Session ID for routing responses")
 
 
-class ToolCallResult(BaseModel):
+class ToolCallResult(_ToolModel):
     """Standardized result from tool call execution.
 
     This unified structure is used throughout the system:
     - Tool executors return this format
     - Agent passes it to LLMClient without conversion
     - LLM-specific clients format it as needed for their APIs
+
+    Results are immutable; fill in routing fields with model_copy(update=...).
     """
 
     # Identification fields
@@ -96,7 +108,7 @@ class ToolCallResult(BaseModel):
     )
 
 
-class ToolExecution(BaseModel):
+class ToolExecution(_ToolModel):
     """Record of a tool execution."""
 
     tool_call: ToolCall
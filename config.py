@@ -16,11 +16,12 @@ else:
     DB_DIR = PROJECT_ROOT / "db"
     DB_PATH = DB_DIR / "metagen.db"
 
-# Ensure db directory exists
-DB_DIR.mkdir(parents=True, exist_ok=True)
+# Ensure db directory exists (it almost always does, so check before creating)
+if not DB_DIR.is_dir():
+    DB_DIR.mkdir(parents=True, exist_ok=True)
 
 # Database URL for SQLAlchemy/Alembic
-DATABASE_URL = f"sqlite:///{DB_PATH}"
+DATABASE_URL = f"sqlite:///{DB_PATH.as_posix()}"
 
 # Memory configuration defaults (can be overridden by environment)
 MEMORY_CONFIG = {
@@ -29,86 +30,117 @@ MEMORY_CONFIG = {
     "scheduler_check_interval": int(os.getenv("MEMORY_SCHEDULER_CHECK_INTERVAL", "300")),
 }
 
+# LLM client configuration
+LLM_CLIENT_CONFIG: dict[str, Any] = {
+    # Decode raw streaming chunks with msgspec instead of the SDK's Pydantic models
+    "fast_stream_parsing": os.getenv("LLM_FAST_STREAM_PARSING", "false").lower() == "true",
+    # Merge back-to-back user/system text messages into one before sending
+    "merge_adjacent_messages": os.getenv("LLM_MERGE_ADJACENT_MESSAGES", "false").lower() == "true",
+}
+
 # Tool approval configuration
 TOOL_APPROVAL_CONFIG: dict[str, Any] = {
     # Global switch for tool approval
     "require_approval": os.getenv("REQUIRE_TOOL_APPROVAL", "true").lower() == "true",
-    # Tools that don't need approval (safe read operations)
-    "auto_approve_tools": os.getenv(
-        "AUTO_APPROVE_TOOLS", "read_file,list_files,search_files,grep,get_current_time"
-    ).split(",")
+    # Tools that don't need approval (safe read operations); frozensets, since
+    # these are only ever used for membership checks
+    "auto_approve_tools": frozenset(
+        os.getenv(
+            "AUTO_APPROVE_TOOLS", "read_file,list_files,search_files,grep,get_current_time"
+        ).split(",")
+    )
     if os.getenv("AUTO_APPROVE_TOOLS")
-    else [
-        # File system read operations
-        "read_file",
-        "list_files",
-        "search_files",
-        "grep",
-        # Time/info operations
-        "get_current_time",
-        # Memory operations
-        "memory_search",
-        "get_recent_conversations",
-        # Task management read operations
-        "list_tasks",
-        # Gmail read operations
-        "gmail_search",
-        "gmail_get_email",
-        "gmail_get_labels",
-        # Google Drive read operations
-        "drive_search_files",
-        "drive_get_file",
-        # Calendar read operations
-        "calendar_list_events",
-        # Google auth status
-        "google_auth_status",
-        # Google Docs read operations
-        "docs_get_document",
-        "docs_get_content",
-        # Google Sheets read operations
-        "sheets_get_spreadsheet",
-        "sheets_get_values",
-        # Google Slides read operations
-        "slides_get_presentation",
-    ],
+    else frozenset(
+        [
+            # File system read operations
+            "read_file",
+            "list_files",
+            "search_files",
+            "grep",
+            # Time/info operations
+            "get_current_time",
+            # Memory operations
+            "memory_search",
+            "get_recent_conversations",
+            # Task management read operations
+            "list_tasks",
+            # Gmail read operations
+            "gmail_search",
+            "gmail_get_email",
+            "gmail_get_labels",
+            # Google Drive read operations
+            "drive_search_files",
+            "drive_get_file",
+            # Calendar read operations
+            "calendar_list_events",
+            "calendar_get_events",
+            # Google auth status
+            "google_auth_status",
+            # Google Docs read operations
+            "docs_get_document",
+            "docs_get_content",
+            # Google Sheets read operations
+            "sheets_get_spreadsheet",
+            "sheets_get_values",
+            # Google Slides read operations
+            "slides_get_presentation",
+        ]
+    ),
     # Whether to remember user preferences for future sessions
     "remember_preferences": os.getenv("REMEMBER_TOOL_PREFERENCES", "true").lower() == "true",
     # Tools with side effects that should always require explicit approval
-    "tools_with_side_effects": os.getenv(
-        "TOOLS_WITH_SIDE_EFFECTS", "write_file,delete_file,execute_command,send_email"
-    ).split(",")
+    "tools_with_side_effects": frozenset(
+        os.getenv(
+            "TOOLS_WITH_SIDE_EFFECTS", "write_file,delete_file,execute_command,send_email"
+        ).split(",")
+    )
     if os.getenv("TOOLS_WITH_SIDE_EFFECTS")
-    else [
-        # File system write operations
-        "write_file",
-        "delete_file",
-        # Command execution
-        "execute_command",
-        # Email operations
-        "send_email",
-        # Task management write operations
-        "execute_task",
-        "create_task",
-        "update_task",
-        # External API calls
-        "api_request",
-        # Google Docs write operations
-        "docs_create_document",
-        "docs_insert_text",
-        "docs_replace_text",
-        # Google Sheets write operations
-        "sheets_create_spreadsheet",
-        "sheets_update_values",
-        "sheets_append_values",
-        "sheets_create_sheet",
-        # Google Slides write operations
-        "slides_create_presentation",
-        "slides_create_slide",
-        "slides_add_text",
-        "slides_replace_text",
-        "slides_duplicate_slide",
-        "slides_delete_slide",
-    ],
+    else frozenset(
+        [
+            # File system write operations
+            "write_file",
+            "delete_file",
+            # Command execution
+            "execute_command",
+            # Email operations
+            "send_email",
+            # Task management write operations
+            "execute_task",
+            "create_task",
+            "update_task",
+            # External API calls
+            "api_request",
+            # Google Docs write operations
+            "docs_create_document",
+            "docs_insert_text",
+            "docs_replace_text",
+            "docs_replace_text_many",
+            # Google Sheets write operations
+            "sheets_create_spreadsheet",
+            "sheets_update_values",
+            "sheets_append_values",
+            "sheets_create_sheet",
+            # Google Slides write operations
+            "slides_create_presentation",
+            "slides_create_slide",
+            "slides_add_text",
+            "slides_replace_text",
+            "slides_duplicate_slide",
+            "slides_delete_slide",
+        ]
+    ),
+}
+
+# Google API connector configuration
+GOOGLE_API_CONFIG: dict[str, Any] = {
+    # Worker threads shared by all Google services for blocking client calls
+    "max_workers": int(os.getenv("GOOGLE_API_MAX_WORKERS", "8")),
+    # Documents whose extracted text is kept for reuse while their revision is unchanged
+    "docs_content_cache_size": int(os.getenv("GOOGLE_DOCS_CONTENT_CACHE_SIZE", "256")),
+    # Most update requests sent in one coalesced Docs batchUpdate call
+    "docs_batch_max_requests": int(os.getenv("GOOGLE_DOCS_BATCH_MAX_REQUESTS", "100")),
+    # Most API calls a single user may have in flight at once, per service
+    "max_concurrent_requests": int(os.getenv("GOOGLE_API_MAX_CONCURRENT_REQUESTS", "8")),
 }
 
 # Agentic Loop Safety Configuration
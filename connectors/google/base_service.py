@@ -1,22 +1,58 @@
 import asyncio
 import logging
+import threading
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Optional
-
-from googleapiclient.discovery import build
+from typing import TYPE_CHECKING, Any, Optional
 
+from config import GOOGLE_API_CONFIG
 from connectors.google.auth import AsyncGoogleOAuthHandler
 
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
+    from googleapiclient.http import HttpRequest
+
 logger = logging.getLogger(__name__)
 
+# One pool for every service instance's blocking client calls; threads are
+# started on demand and joined by concurrent.futures at interpreter exit
+_api_executor = ThreadPoolExecutor(
+    max_workers=GOOGLE_API_CONFIG["max_workers"], thread_name_prefix="google-api"
+)
+
+
+def get_api_executor() -> ThreadPoolExecutor:
+    """Get the thread pool shared by all Google API services."""
+    return _api_executor
+
+
+# Built API clients by (user_id, service_name, service_version), with the
+# credentials they were built from; reused while those credentials are valid
+_service_cache: dict[tuple[str, str, str], tuple[Any, "Credentials"]] = {}
+
+
+def _is_auth_failure(error: Exception) -> bool:
+    """Whether an API error means the cached credentials are no longer usable."""
+    from googleapiclient.errors import HttpError
+
+    if isinstance(error, HttpError) and error.resp.status in (401, 403):
+        return True
+    return "invalid_grant" in str(error).lower()
+
 
 class BaseGoogleService(ABC):
     """Base class for Google API services with common OAuth and service patterns"""
 
     def __init__(self, oauth_handler: Optional[AsyncGoogleOAuthHandler] = None):
         self.oauth_handler = oauth_handler or AsyncGoogleOAuthHandler()
-        self.executor = ThreadPoolExecutor(max_workers=4)
+        self.executor = get_api_executor()
+        # Caps each user's in-flight API calls so a burst (e.g. a gather over many
+        # documents) doesn't trip Google's per-user rate limits; a waiter starts as
+        # soon as any call finishes rather than in fixed-size waves
+        self._request_slots: defaultdict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(GOOGLE_API_CONFIG["max_concurrent_requests"])
+        )
         logger.debug(f"Initialized {self.__class__.__name__}")
 
     @property
@@ -33,47 +69,98 @@ class BaseGoogleService(ABC):
 
     async def _get_service(self, user_id: str = "default_user") -> Any:
         """Get authenticated Google API service instance"""
-        logger.debug(f"Getting {self.service_name} service for user: {user_id}")
-
-        # Load credentials
-        credentials = await self.oauth_handler.load_credentials(user_id)
-        if not credentials:
-            raise ValueError(
-                f"No authentication found for user {user_id}. "
-                "Please authenticate with Google first."
-            )
+        cache_key = (user_id, self.service_name, self.service_version)
+        cached = _service_cache.get(cache_key)
+        if cached and cached[1].valid:
+            return cached[0]
+
+        # One request per user loads, refreshes and stores credentials at a time;
+        # the rest wait and then pick up whatever it left in the cache
+        async with self.oauth_handler.credentials_lock(user_id):
+            cached = _service_cache.get(cache_key)
+            if cached and cached[1].valid:
+                return cached[0]
+
+            logger.debug(f"Getting {self.service_name} service for user: {user_id}")
+
+            # Load credentials
+            credentials = await self.oauth_handler.load_credentials(user_id)
+            if not credentials:
+                raise ValueError(
+                    f"No authentication found for user {user_id}. "
+                    "Please authenticate with Google first."
+                )
 
-        # Refresh credentials if needed
-        try:
-            credentials = await self.oauth_handler.refresh_token(credentials)
-            await self.oauth_handler.store_credentials(user_id, credentials)
-        except ValueError as e:
-            # Token expired/revoked - re-raise with helpful message
-            logger.warning(f"Token expired/revoked for user {user_id}: {str(e)}")
-            raise ValueError(
-                f"Authentication expired for user {user_id}. Please re-authenticate with Google."
-            )
-        except Exception as e:
-            # Check for Google-specific auth errors
-            error_str = str(e).lower()
-            if "invalid_grant" in error_str or "token has been expired or revoked" in error_str:
-                logger.warning(f"Invalid grant error for user {user_id}: {str(e)}")
+            # Refresh credentials if needed
+            try:
+                token_before = credentials.token
+                credentials = await self.oauth_handler.refresh_token(credentials)
+                # Only write the token file back if a refresh actually issued a new token
+                if credentials.token != token_before:
+                    await self.oauth_handler.store_credentials(user_id, credentials)
+            except ValueError as e:
+                # Token expired/revoked - re-raise with helpful message
+                logger.warning(f"Token expired/revoked for user {user_id}: {str(e)}")
                 raise ValueError(
                     f"Authentication expired for user {user_id}. "
                     "Please re-authenticate with Google."
                 )
-            logger.error(f"Unexpected error refreshing credentials: {str(e)}", exc_info=True)
-            raise
-
-        # Build service using ThreadPoolExecutor
-        def _build_service() -> Any:
-            return build(self.service_name, self.service_version, credentials=credentials)
+            except Exception as e:
+                # Check for Google-specific auth errors
+                error_str = str(e).lower()
+                if "invalid_grant" in error_str or "token has been expired or revoked" in error_str:
+                    logger.warning(f"Invalid grant error for user {user_id}: {str(e)}")
+                    raise ValueError(
+                        f"Authentication expired for user {user_id}. "
+                        "Please re-authenticate with Google."
+                    )
+                logger.error(f"Unexpected error refreshing credentials: {str(e)}", exc_info=True)
+                raise
+
+            # Build service using ThreadPoolExecutor. The client library is imported here
+            # rather than at module level so sessions that never use Google tools skip it.
+            def _build_service() -> Any:
+                import httplib2
+                from google_auth_httplib2 import AuthorizedHttp
+                from googleapiclient.discovery import build
+                from googleapiclient.http import HttpRequest
+
+                from connectors.google.json_model import MsgspecJsonModel
+
+                # The service is shared by concurrent requests on the executor's threads and
+                # httplib2 connections are not thread-safe, so each thread gets its own
+                # authorized connection and keeps reusing it for this service
+                thread_http = threading.local()
+
+                def _build_request(http: Any, *args: Any, **kwargs: Any) -> "HttpRequest":
+                    authorized = getattr(thread_http, "http", None)
+                    if authorized is None:
+                        authorized = AuthorizedHttp(credentials, http=httplib2.Http())
+                        thread_http.http = authorized
+                    return HttpRequest(authorized, *args, **kwargs)
+
+                return build(
+                    self.service_name,
+                    self.service_version,
+                    credentials=credentials,
+                    requestBuilder=_build_request,
+                    model=MsgspecJsonModel(),
+                    # Use the discovery documents bundled with the client library;
+                    # never fetch them or touch the (oauth2client-only) file cache
+                    static_discovery=True,
+                    cache_discovery=False,
+                )
 
-        loop = asyncio.get_event_loop()
-        service = await loop.run_in_executor(self.executor, _build_service)
+            loop = asyncio.get_running_loop()
+            service = await loop.run_in_executor(self.executor, _build_service)
+            _service_cache[cache_key] = (service, credentials)
         logger.debug(f"Successfully built {self.service_name} service")
         return service
 
+    def _forget_service(self, user_id: str) -> None:
+        """Drop the cached service so the next request reloads credentials."""
+        _service_cache.pop((user_id, self.service_name, self.service_version), None)
+
     async def _execute_request(self, request_func: Any, user_id: str = "default_user") -> Any:
         """
         Execute a Google API request with proper error handling
@@ -83,35 +170,36 @@ class BaseGoogleService(ABC):
             user_id: User identifier for credentials
         """
         try:
-            service = await self._get_service(user_id)
+            async with self._request_slots[user_id]:
+                service = await self._get_service(user_id)
 
-            def _execute() -> Any:
-                request = request_func(service)
-                return request.execute()
+                def _execute() -> Any:
+                    request = request_func(service)
+                    return request.execute()
 
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(self.executor, _execute)
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(self.executor, _execute)
             logger.debug(f"Successfully executed {self.service_name} request")
             return result
 
         except ValueError as e:
             # Re-authentication needed
             logger.warning(f"Authentication error: {str(e)}")
+            self._forget_service(user_id)
             raise
         except Exception as e:
             logger.error(f"Error executing {self.service_name} request: {str(e)}", exc_info=True)
+            # Keep the cached service through transient and per-request errors
+            if _is_auth_failure(e):
+                self._forget_service(user_id)
             raise
 
     def _format_error_response(
-        self, error: Exception, default_structure: Optional[dict[Any, Any]] = None
-    ) -> dict:
+        self, error: Exception, default_structure: Optional[dict[str, Any]] = None
+    ) -> dict[str, Any]:
         """Format error response in consistent structure"""
-        error_response = default_structure or {"error": str(error), "success": False}
+        # Copy so the caller's default structure is never modified
+        error_response = dict(default_structure) if default_structure else {}
         error_response["error"] = str(error)
         error_response["success"] = False
         return error_response
-
-    def __del__(self) -> None:
-        """Cleanup executor on deletion"""
-        if hasattr(self, "executor"):
-            self.executor.shutdown(wait=False)
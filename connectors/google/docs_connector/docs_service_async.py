@@ -1,16 +1,82 @@
 """Async Google Docs service implementation."""
 
+import asyncio
 import logging
-from typing import Any
+from collections import OrderedDict, deque
+from functools import partial
+from typing import Any, Optional
 
+from config import GOOGLE_API_CONFIG
+from connectors.google.auth import AsyncGoogleOAuthHandler
 from connectors.google.base_service import BaseGoogleService
 
 logger = logging.getLogger(__name__)
 
+# Partial-response field mask for get_document_content: the title, the revision
+# (for the content cache) and the text runs, including inside tables. Cell content
+# is requested whole so tables nested at any depth are covered.
+_CONTENT_FIELDS = (
+    "title,revisionId,"
+    "body(content(paragraph(elements(textRun(content))),table(tableRows(tableCells(content)))))"
+)
+
+# One caller's batchUpdate requests and the future its response is delivered to
+_QueuedUpdate = tuple[list[dict[str, Any]], "asyncio.Future[dict[str, Any]]"]
+
+
+def _deliver(
+    future: "asyncio.Future[dict[str, Any]]",
+    result: Optional[dict[str, Any]] = None,
+    error: Optional[Exception] = None,
+) -> None:
+    """Complete a queued update's future unless its caller already gave up on it."""
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result or {})
+
+
+def _is_rejected(error: Exception) -> bool:
+    """Whether a batchUpdate definitely was not applied (the API rejected it as invalid).
+
+    Timeouts, dropped connections and server errors leave it unknown whether the
+    atomic update went through.
+    """
+    from googleapiclient.errors import HttpError
+
+    return isinstance(error, HttpError) and error.resp.status == 400
+
+
+# Request builders for _execute_request, bound to their arguments with partial()
+def _get_request(document_id: str, fields: Optional[str], service: Any) -> Any:
+    return service.documents().get(documentId=document_id, fields=fields)
+
+
+def _create_request(title: str, service: Any) -> Any:
+    return service.documents().create(body={"title": title})
+
+
+def _batch_update_request(document_id: str, requests: list[dict[str, Any]], service: Any) -> Any:
+    return service.documents().batchUpdate(documentId=document_id, body={"requests": requests})
+
 
 class DocsServiceAsync(BaseGoogleService):
     """Async Google Docs service implementation."""
 
+    def __init__(self, oauth_handler: Optional[AsyncGoogleOAuthHandler] = None):
+        super().__init__(oauth_handler)
+        # get_document_content results by (user_id, document_id) with the revision
+        # they were extracted from, least recently used first
+        self._content_cache: OrderedDict[tuple[str, str], tuple[str, dict[str, Any]]] = (
+            OrderedDict()
+        )
+        # batchUpdate calls waiting to be sent, and the task sending them, by
+        # (user_id, document_id); see _flush_updates
+        self._update_queues: dict[tuple[str, str], deque[_QueuedUpdate]] = {}
+        self._update_flushers: dict[tuple[str, str], asyncio.Task[None]] = {}
+
     @property
     def service_name(self) -> str:
         return "docs"
@@ -19,25 +85,26 @@ class DocsServiceAsync(BaseGoogleService):
     def service_version(self) -> str:
         return "v1"
 
-    async def get_document(self, document_id: str, user_id: str = "default_user") -> dict[str, Any]:
+    async def get_document(
+        self, document_id: str, user_id: str = "default_user", fields: Optional[str] = None
+    ) -> dict[str, Any]:
         """
         Get a Google Docs document by ID.
 
         Args:
             document_id: The Google Docs document ID
             user_id: User identifier for credentials
+            fields: Optional partial-response field mask; the full document if omitted
 
         Returns:
             Dictionary containing document data
         """
-        logger.info(f"Getting document {document_id} for user {user_id}")
+        logger.info("Getting document %s for user %s", document_id, user_id)
 
         try:
-
-            def _get_document(service: Any) -> Any:
-                return service.documents().get(documentId=document_id)
-
-            result = await self._execute_request(_get_document, user_id)
+            result = await self._execute_request(
+                partial(_get_request, document_id, fields), user_id
+            )
 
             return {
                 "success": True,
@@ -50,7 +117,7 @@ class DocsServiceAsync(BaseGoogleService):
             }
 
         except Exception as e:
-            logger.error(f"Error getting document {document_id}: {str(e)}")
+            logger.error("Error getting document %s: %s", document_id, e)
             return self._format_error_response(
                 e, {"success": False, "document_id": document_id, "document": None}
             )
@@ -66,14 +133,10 @@ class DocsServiceAsync(BaseGoogleService):
         Returns:
             Dictionary containing created document data
         """
-        logger.info(f"Creating document '{title}' for user {user_id}")
+        logger.info("Creating document '%s' for user %s", title, user_id)
 
         try:
-
-            def _create_document(service: Any) -> Any:
-                return service.documents().create(body={"title": title})
-
-            result = await self._execute_request(_create_document, user_id)
+            result = await self._execute_request(partial(_create_request, title), user_id)
 
             return {
                 "success": True,
@@ -87,7 +150,7 @@ class DocsServiceAsync(BaseGoogleService):
             }
 
         except Exception as e:
-            logger.error(f"Error creating document '{title}': {str(e)}")
+            logger.error("Error creating document '%s': %s", title, e)
             return self._format_error_response(
                 e, {"success": False, "title": title, "document": None}
             )
@@ -107,18 +170,23 @@ class DocsServiceAsync(BaseGoogleService):
             Dictionary containing update results
         """
         logger.info(
-            f"Batch updating document {document_id} with {len(requests)} requests "
-            f"for user {user_id}"
+            "Batch updating document %s with %s requests for user %s",
+            document_id,
+            len(requests),
+            user_id,
         )
 
         try:
-
-            def _batch_update(service: Any) -> Any:
-                return service.documents().batchUpdate(
-                    documentId=document_id, body={"requests": requests}
+            # Updates to the same document that arrive while another is being sent
+            # are combined into the next call, in arrival order
+            key = (user_id, document_id)
+            future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+            self._update_queues.setdefault(key, deque()).append((requests, future))
+            if key not in self._update_flushers:
+                self._update_flushers[key] = asyncio.create_task(
+                    self._flush_updates(document_id, user_id)
                 )
-
-            result = await self._execute_request(_batch_update, user_id)
+            result = await future
 
             return {
                 "success": True,
@@ -129,11 +197,82 @@ class DocsServiceAsync(BaseGoogleService):
             }
 
         except Exception as e:
-            logger.error(f"Error batch updating document {document_id}: {str(e)}")
+            logger.error("Error batch updating document %s: %s", document_id, e)
             return self._format_error_response(
                 e, {"success": False, "document_id": document_id, "requests": requests}
             )
 
+    async def _flush_updates(self, document_id: str, user_id: str) -> None:
+        """Send queued batchUpdate calls for one document until the queue is empty.
+
+        Each round combines as many waiting callers as fit in
+        GOOGLE_API_CONFIG["docs_batch_max_requests"] into one API call and hands
+        every caller its own slice of the replies. batchUpdate is atomic, so if a
+        combined call is rejected as invalid nothing was applied and each caller's
+        requests are retried on their own, keeping one bad request from failing the
+        others. Any other failure may have applied the edits, so it goes to every
+        caller in the batch rather than risking duplicate inserts.
+        """
+        key = (user_id, document_id)
+        queue = self._update_queues[key]
+        batch: list[_QueuedUpdate] = []
+        try:
+            while queue:
+                batch = [queue.popleft()]
+                size = len(batch[0][0])
+                while (
+                    queue
+                    and size + len(queue[0][0]) <= GOOGLE_API_CONFIG["docs_batch_max_requests"]
+                ):
+                    size += len(queue[0][0])
+                    batch.append(queue.popleft())
+
+                try:
+                    result = await self._send_updates(
+                        document_id, [r for requests, _ in batch for r in requests], user_id
+                    )
+                except Exception as e:
+                    if len(batch) == 1 or not _is_rejected(e):
+                        for _, future in batch:
+                            _deliver(future, error=e)
+                        continue
+                    logger.warning(
+                        "Combined update of document %s rejected, retrying %s callers alone: %s",
+                        document_id,
+                        len(batch),
+                        e,
+                    )
+                    for requests, future in batch:
+                        try:
+                            _deliver(
+                                future, await self._send_updates(document_id, requests, user_id)
+                            )
+                        except Exception as single_error:
+                            _deliver(future, error=single_error)
+                    continue
+
+                replies = result.get("replies", [])
+                start = 0
+                for requests, future in batch:
+                    _deliver(future, {**result, "replies": replies[start : start + len(requests)]})
+                    start += len(requests)
+        finally:
+            # Only reached with updates still pending if this task was cancelled
+            for _, future in [*batch, *queue]:
+                if not future.done():
+                    future.cancel()
+            del self._update_queues[key]
+            del self._update_flushers[key]
+
+    async def _send_updates(
+        self, document_id: str, requests: list[dict[str, Any]], user_id: str
+    ) -> dict[str, Any]:
+        """Make one documents.batchUpdate call."""
+        result: dict[str, Any] = await self._execute_request(
+            partial(_batch_update_request, document_id, requests), user_id
+        )
+        return result
+
     async def insert_text(
         self, document_id: str, text: str, index: int = 1, user_id: str = "default_user"
     ) -> dict[str, Any]:
@@ -150,7 +289,7 @@ class DocsServiceAsync(BaseGoogleService):
             Dictionary containing insert results
         """
         logger.info(
-            f"Inserting text into document {document_id} at index {index} for user {user_id}"
+            "Inserting text into document %s at index %s for user %s", document_id, index, user_id
         )
 
         requests = [{"insertText": {"location": {"index": index}, "text": text}}]
@@ -173,8 +312,33 @@ class DocsServiceAsync(BaseGoogleService):
             Dictionary containing replace results
         """
         logger.info(
-            f"Replacing text in document {document_id}: '{find_text}' -> "
-            f"'{replace_text}' for user {user_id}"
+            "Replacing text in document %s: '%s' -> '%s' for user %s",
+            document_id,
+            find_text,
+            replace_text,
+            user_id,
+        )
+
+        return await self.replace_text_many(document_id, [(find_text, replace_text)], user_id)
+
+    async def replace_text_many(
+        self, document_id: str, replacements: list[tuple[str, str]], user_id: str = "default_user"
+    ) -> dict[str, Any]:
+        """
+        Apply several find/replace pairs to a Google Docs document in one request.
+
+        Pairs are applied in order, so a later pair sees the result of earlier ones.
+
+        Args:
+            document_id: The Google Docs document ID
+            replacements: (find_text, replace_text) pairs; matching ignores case
+            user_id: User identifier for credentials
+
+        Returns:
+            Dictionary containing replace results, with one reply per pair
+        """
+        logger.info(
+            "Replacing %s texts in document %s for user %s", len(replacements), document_id, user_id
         )
 
         requests = [
@@ -184,6 +348,7 @@ class DocsServiceAsync(BaseGoogleService):
                     "replaceText": replace_text,
                 }
             }
+            for find_text, replace_text in replacements
         ]
 
         return await self.batch_update_document(document_id, requests, user_id)
@@ -201,53 +366,73 @@ class DocsServiceAsync(BaseGoogleService):
         Returns:
             Dictionary containing document text content
         """
-        logger.info(f"Getting content from document {document_id} for user {user_id}")
+        logger.info("Getting content from document %s for user %s", document_id, user_id)
 
+        cache_key = (user_id, document_id)
         try:
-            doc_result = await self.get_document(document_id, user_id)
-
-            if not doc_result.get("success", False):
-                return doc_result
-
-            document = doc_result.get("document", {})
-            body = document.get("body", {})
-            content = body.get("content", [])
-
-            # Extract text from document structure
-            text_content = []
-
-            def extract_text_from_element(element: dict[str, Any]) -> None:
+            cached = self._content_cache.get(cache_key)
+            if cached:
+                # A revision-only fetch is far cheaper than downloading the whole body
+                revision = await self._execute_request(
+                    partial(_get_request, document_id, "revisionId"), user_id
+                )
+                if revision.get("revisionId") == cached[0]:
+                    self._content_cache.move_to_end(cache_key)
+                    return dict(cached[1])
+
+            # Fetch directly rather than through get_document, which only wraps the
+            # response in keys this method doesn't use
+            document = await self._execute_request(
+                partial(_get_request, document_id, _CONTENT_FIELDS), user_id
+            )
+            content = document.get("body", {}).get("content", [])
+
+            # Extract text from document structure. Walk it with an explicit stack
+            # (tables nest arbitrarily) and append text runs directly; nothing is
+            # concatenated until the final join.
+            text_content: list[str] = []
+            paragraph_count = 0
+            stack = list(reversed(content))
+            while stack:
+                element = stack.pop()
                 if "paragraph" in element:
-                    paragraph = element["paragraph"]
-                    paragraph_text = ""
-                    for text_element in paragraph.get("elements", []):
+                    paragraph_count += 1
+                    for text_element in element["paragraph"].get("elements", []):
                         if "textRun" in text_element:
-                            paragraph_text += text_element["textRun"].get("content", "")
-                    text_content.append(paragraph_text)
+                            text_content.append(text_element["textRun"].get("content", ""))
                 elif "table" in element:
-                    # Handle table content
-                    table = element["table"]
-                    for row in table.get("tableRows", []):
-                        for cell in row.get("tableCells", []):
-                            for cell_element in cell.get("content", []):
-                                extract_text_from_element(cell_element)
-
-            for element in content:
-                extract_text_from_element(element)
+                    # Push cell contents so they come off the stack in reading order
+                    cell_elements = [
+                        cell_element
+                        for row in element["table"].get("tableRows", [])
+                        for cell in row.get("tableCells", [])
+                        for cell_element in cell.get("content", [])
+                    ]
+                    stack.extend(reversed(cell_elements))
 
             full_text = "".join(text_content)
 
-            return {
+            result = {
                 "success": True,
                 "document_id": document_id,
                 "title": document.get("title", ""),
                 "text_content": full_text,
-                "paragraph_count": len(text_content),
+                "paragraph_count": paragraph_count,
                 "character_count": len(full_text),
             }
 
+            # revisionId is only returned to users with edit access; without it
+            # there is no way to tell whether a cached copy is stale
+            revision_id = document.get("revisionId")
+            if revision_id:
+                self._content_cache[cache_key] = (revision_id, result)
+                self._content_cache.move_to_end(cache_key)
+                if len(self._content_cache) > GOOGLE_API_CONFIG["docs_content_cache_size"]:
+                    self._content_cache.popitem(last=False)
+            return dict(result)
+
         except Exception as e:
-            logger.error(f"Error getting content from document {document_id}: {str(e)}")
+            logger.error("Error getting content from document %s: %s", document_id, e)
             return self._format_error_response(
                 e, {"success": False, "document_id": document_id, "text_content": ""}
             )
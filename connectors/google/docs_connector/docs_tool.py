@@ -28,9 +28,23 @@ class DocsConnectorTool:
             credentials = await self.oauth_handler.load_credentials(user_id)
             return credentials is not None
         except Exception as e:
-            logger.error(f"Error checking authentication status: {str(e)}")
+            logger.error("Error checking authentication status: %s", e)
             return False
 
+    def _standardize_auth_error(self, user_id: str, result: dict[str, Any]) -> dict[str, Any]:
+        """Report missing credentials with the standard "not authenticated" message.
+
+        The service loads credentials itself and fails with a ValueError when there
+        are none, so there is no separate up-front check.
+        """
+        if not result.get("success", True) and "No authentication found" in str(
+            result.get("error", "")
+        ):
+            result["error"] = (
+                f"User {user_id} is not authenticated with Google. Please authenticate first."
+            )
+        return result
+
     async def get_document(self, user_id: str, document_id: str) -> dict[str, Any]:
         """
         Get a Google Docs document by ID.
@@ -42,22 +56,14 @@ class DocsConnectorTool:
         Returns:
             Dictionary containing document data
         """
-        logger.info(f"Getting document {document_id} for user {user_id}")
-
-        if not await self.is_authenticated(user_id):
-            return {
-                "success": False,
-                "error": (
-                    f"User {user_id} is not authenticated with Google. Please authenticate first."
-                ),
-                "document_id": document_id,
-                "document": None,
-            }
+        logger.info("Getting document %s for user %s", document_id, user_id)
 
         try:
-            return await self.docs_service.get_document(document_id, user_id)
+            return self._standardize_auth_error(
+                user_id, await self.docs_service.get_document(document_id, user_id)
+            )
         except Exception as e:
-            logger.error(f"Error getting document {document_id}: {str(e)}")
+            logger.error("Error getting document %s: %s", document_id, e)
             return {"success": False, "error": str(e), "document_id": document_id, "document": None}
 
     async def create_document(self, user_id: str, title: str) -> dict[str, Any]:
@@ -71,22 +77,14 @@ class DocsConnectorTool:
         Returns:
             Dictionary containing created document data
         """
-        logger.info(f"Creating document '{title}' for user {user_id}")
-
-        if not await self.is_authenticated(user_id):
-            return {
-                "success": False,
-                "error": (
-                    f"User {user_id} is not authenticated with Google. Please authenticate first."
-                ),
-                "title": title,
-                "document": None,
-            }
+        logger.info("Creating document '%s' for user %s", title, user_id)
 
         try:
-            return await self.docs_service.create_document(title, user_id)
+            return self._standardize_auth_error(
+                user_id, await self.docs_service.create_document(title, user_id)
+            )
         except Exception as e:
-            logger.error(f"Error creating document '{title}': {str(e)}")
+            logger.error("Error creating document '%s': %s", title, e)
             return {"success": False, "error": str(e), "title": title, "document": None}
 
     async def get_document_content(self, user_id: str, document_id: str) -> dict[str, Any]:
@@ -100,22 +98,14 @@ class DocsConnectorTool:
         Returns:
             Dictionary containing document text content
         """
-        logger.info(f"Getting content from document {document_id} for user {user_id}")
-
-        if not await self.is_authenticated(user_id):
-            return {
-                "success": False,
-                "error": (
-                    f"User {user_id} is not authenticated with Google. Please authenticate first."
-                ),
-                "document_id": document_id,
-                "text_content": "",
-            }
+        logger.info("Getting content from document %s for user %s", document_id, user_id)
 
         try:
-            return await self.docs_service.get_document_content(document_id, user_id)
+            return self._standardize_auth_error(
+                user_id, await self.docs_service.get_document_content(document_id, user_id)
+            )
         except Exception as e:
-            logger.error(f"Error getting content from document {document_id}: {str(e)}")
+            logger.error("Error getting content from document %s: %s", document_id, e)
             return {
                 "success": False,
                 "error": str(e),
@@ -139,22 +129,15 @@ class DocsConnectorTool:
             Dictionary containing insert results
         """
         logger.info(
-            f"Inserting text into document {document_id} at index {index} for user {user_id}"
+            "Inserting text into document %s at index %s for user %s", document_id, index, user_id
         )
 
-        if not await self.is_authenticated(user_id):
-            return {
-                "success": False,
-                "error": (
-                    f"User {user_id} is not authenticated with Google. Please authenticate first."
-                ),
-                "document_id": document_id,
-            }
-
         try:
-            return await self.docs_service.insert_text(document_id, text, index, user_id)
+            return self._standardize_auth_error(
+                user_id, await self.docs_service.insert_text(document_id, text, index, user_id)
+            )
         except Exception as e:
-            logger.error(f"Error inserting text into document {document_id}: {str(e)}")
+            logger.error("Error inserting text into document %s: %s", document_id, e)
             return {"success": False, "error": str(e), "document_id": document_id}
 
     async def replace_text(
@@ -173,23 +156,47 @@ class DocsConnectorTool:
             Dictionary containing replace results
         """
         logger.info(
-            f"Replacing text in document {document_id}: '{find_text}' -> "
-            f"'{replace_text}' for user {user_id}"
+            "Replacing text in document %s: '%s' -> '%s' for user %s",
+            document_id,
+            find_text,
+            replace_text,
+            user_id,
         )
 
-        if not await self.is_authenticated(user_id):
-            return {
-                "success": False,
-                "error": (
-                    f"User {user_id} is not authenticated with Google. Please authenticate first."
-                ),
-                "document_id": document_id,
-            }
+        try:
+            return self._standardize_auth_error(
+                user_id,
+                await self.docs_service.replace_text(document_id, find_text, replace_text, user_id),
+            )
+        except Exception as e:
+            logger.error("Error replacing text in document %s: %s", document_id, e)
+            return {"success": False, "error": str(e), "document_id": document_id}
+
+    async def replace_text_many(
+        self, user_id: str, document_id: str, replacements: dict[str, str]
+    ) -> dict[str, Any]:
+        """
+        Replace several texts in a Google Docs document with one API call.
+
+        Args:
+            user_id: User identifier for credentials
+            document_id: The Google Docs document ID
+            replacements: Mapping of text to find to its replacement, applied in order
+
+        Returns:
+            Dictionary containing replace results
+        """
+        logger.info(
+            "Replacing %s texts in document %s for user %s", len(replacements), document_id, user_id
+        )
 
         try:
-            return await self.docs_service.replace_text(
-                document_id, find_text, replace_text, user_id
+            return self._standardize_auth_error(
+                user_id,
+                await self.docs_service.replace_text_many(
+                    document_id, list(replacements.items()), user_id
+                ),
             )
         except Exception as e:
-            logger.error(f"Error replacing text in document {document_id}: {str(e)}")
+            logger.error("Error replacing text in document %s: %s", document_id, e)
             return {"success": False, "error": str(e), "document_id": document_id}
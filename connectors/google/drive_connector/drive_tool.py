@@ -1,5 +1,5 @@
 import logging
-from typing import Any
+from typing import Any, Optional
 
 from connectors.google.auth import AsyncGoogleOAuthHandler
 
@@ -19,38 +19,40 @@ class DriveConnectorTool:
 
     async def execute(self, method: str, **kwargs: Any) -> dict[str, Any]:
         """Execute a Drive operation"""
-        logger.debug(f"Executing Drive method: {method} with args: {kwargs}")
+        logger.debug("Executing Drive method: %s with args: %s", method, kwargs)
 
         if method == "search_files":
             return await self.search_files(**kwargs)
         elif method == "get_file":
             return await self.get_file(**kwargs)
         else:
-            logger.error(f"Unknown method: {method}")
+            logger.error("Unknown method: %s", method)
             raise ValueError(f"Unknown method: {method}")
 
-    async def search_files(self, user_id: str, query: str, max_results: int = 10) -> dict[str, Any]:
+    async def search_files(
+        self, user_id: str, query: str, max_results: int = 10, page_token: Optional[str] = None
+    ) -> dict[str, Any]:
         """Search Google Drive files"""
         logger.debug(
-            f"Searching files - user: {user_id}, query: '{query}', max_results: {max_results}"
+            "Searching files - user: %s, query: '%s', max_results: %s", user_id, query, max_results
         )
 
         try:
-            result = await self.drive_service.search_files(user_id, query, max_results)
-            logger.debug(f"Search completed - found {result['count']} files")
+            result = await self.drive_service.search_files(user_id, query, max_results, page_token)
+            logger.debug("Search completed - found %s files", result["count"])
             return result
         except Exception as e:
-            logger.error(f"Error searching files: {str(e)}", exc_info=True)
+            logger.error("Error searching files: %s", e, exc_info=True)
             raise Exception(f"Failed to search files: {str(e)}")
 
     async def get_file(self, user_id: str, file_id: str) -> dict[str, Any]:
         """Get detailed information about a specific file"""
-        logger.debug(f"Getting file - user: {user_id}, file_id: {file_id}")
+        logger.debug("Getting file - user: %s, file_id: %s", user_id, file_id)
 
         try:
             result = await self.drive_service.get_file(user_id, file_id)
-            logger.debug(f"File retrieved - name: {result['name']}")
+            logger.debug("File retrieved - name: %s", result["name"])
             return result
         except Exception as e:
-            logger.error(f"Error getting file: {str(e)}", exc_info=True)
+            logger.error("Error getting file: %s", e, exc_info=True)
             raise Exception(f"Failed to get file: {str(e)}")
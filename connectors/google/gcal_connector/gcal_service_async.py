@@ -1,66 +1,118 @@
 import asyncio
 import logging
-from concurrent.futures import ThreadPoolExecutor
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from functools import partial
 from typing import Any, Optional
 
-from googleapiclient.discovery import build
-
-from connectors.google.auth import AsyncGoogleOAuthHandler
+from connectors.google.base_service import BaseGoogleService
 
 logger = logging.getLogger(__name__)
 
 
-class AsyncGCalService:
+# Events per Calendar batch request; Google allows up to 1000 but recommends
+# keeping batches small
+_BATCH_SIZE = 50
+
+
+# RFC 3339 timestamp in UTC, as Calendar expects for timeMin/timeMax
+_RFC3339_UTC = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def _time_window(days: int) -> tuple[str, str]:
+    """Timestamps for now and ``days`` from now, from a single clock read."""
+    now = datetime.now(timezone.utc)
+    later = now + timedelta(days=days)
+    return now.strftime(_RFC3339_UTC), later.strftime(_RFC3339_UTC)
+
+
+# Request builders for _execute_request, bound to their arguments with partial()
+def _list_request(
+    time_min: str, time_max: str, max_results: int, query: Optional[str], service: Any
+) -> Any:
+    return service.events().list(
+        calendarId="primary",
+        timeMin=time_min,
+        timeMax=time_max,
+        q=query,
+        maxResults=max_results,
+        singleEvents=True,
+        orderBy="startTime",
+    )
+
+
+def _get_request(event_id: str, service: Any) -> Any:
+    return service.events().get(calendarId="primary", eventId=event_id)
+
+
+def _batch_get_request(event_ids: list[str], callback: Any, service: Any) -> Any:
+    # Sent as one multipart request to the Calendar batch endpoint; each reply is
+    # passed to callback with its event id as the request id
+    batch = service.new_batch_http_request(callback=callback)
+    for event_id in event_ids:
+        batch.add(_get_request(event_id, service), request_id=event_id)
+    return batch
+
+
+def _event_time(when: dict[str, Any]) -> Optional[str]:
+    """Timestamp of an event start/end: dateTime for timed events, date for all-day ones."""
+    return when.get("dateTime") or when.get("date")
+
+
+def _format_event_summary(event: dict[str, Any]) -> dict[str, Any]:
+    """Shape an events.list entry for list/search results."""
+    get = event.get
+    return {
+        "id": event["id"],
+        "summary": get("summary", "No title"),
+        "start": _event_time(event["start"]),
+        "end": _event_time(event["end"]),
+        "location": get("location", ""),
+        "description": get("description", ""),
+        # A tuple default avoids allocating a list for events without attendees
+        "attendees": [att["email"] for att in get("attendees", ()) if "email" in att],
+        "status": get("status", "confirmed"),
+        "link": get("htmlLink", ""),
+    }
+
+
+def _format_event_details(event: dict[str, Any]) -> dict[str, Any]:
+    """Shape an events.get response for get_event/get_events."""
+    get = event.get
+    organizer = get("organizer")
+    return {
+        "id": event["id"],
+        "summary": get("summary", "No title"),
+        "start": _event_time(event["start"]),
+        "end": _event_time(event["end"]),
+        "location": get("location", ""),
+        "description": get("description", ""),
+        "attendees": [
+            {
+                "email": att.get("email", ""),
+                "displayName": att.get("displayName", ""),
+                "responseStatus": att.get("responseStatus", "needsAction"),
+            }
+            for att in get("attendees", ())
+        ],
+        "organizer": organizer.get("email", "") if organizer else "",
+        "status": get("status", "confirmed"),
+        "link": get("htmlLink", ""),
+        "created": get("created", ""),
+        "updated": get("updated", ""),
+        "recurringEventId": get("recurringEventId", ""),
+    }
+
+
+class AsyncGCalService(BaseGoogleService):
     """Async service for interacting with Google Calendar API"""
 
-    def __init__(self, oauth_handler: AsyncGoogleOAuthHandler):
-        logger.debug("Initializing AsyncGCalService")
-        self.oauth_handler = oauth_handler
-        self.executor = ThreadPoolExecutor(max_workers=4)
-        logger.debug("Calendar service initialized")
-
-    async def _get_service(self, user_id: str) -> Any:
-        """Get authenticated Calendar service instance"""
-        logger.debug(f"Getting Calendar service for user: {user_id}")
-
-        credentials = await self.oauth_handler.load_credentials(user_id)
+    @property
+    def service_name(self) -> str:
+        return "calendar"
 
-        if not credentials:
-            logger.error(f"No credentials found for user: {user_id}")
-            raise ValueError("No authentication found. Please authenticate first.")
-
-        logger.debug("Refreshing credentials if needed")
-        try:
-            credentials = await self.oauth_handler.refresh_token(credentials)
-            # Only store credentials if refresh was successful
-            await self.oauth_handler.store_credentials(user_id, credentials)
-        except ValueError as e:
-            # This is our specific token expired error
-            logger.warning(f"Token expired/revoked for user {user_id}: {str(e)}")
-            raise
-        except Exception as e:
-            error_str = str(e).lower()
-            if "invalid_grant" in error_str or "token has been expired or revoked" in error_str:
-                logger.warning(f"Token expired/revoked for user {user_id}: {str(e)}")
-                # Re-raise with a more specific error message
-                raise ValueError("Token has been expired or revoked. Please re-authenticate.")
-            else:
-                logger.error(f"Error refreshing token for user {user_id}: {str(e)}")
-                raise
-
-        def _build_service() -> Any:
-            try:
-                logger.debug("Building Calendar API service")
-                service = build("calendar", "v3", credentials=credentials)
-                logger.debug("Calendar API service built successfully")
-                return service
-            except Exception as e:
-                logger.error(f"Error building Calendar service: {str(e)}", exc_info=True)
-                raise
-
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(self.executor, _build_service)
+    @property
+    def service_version(self) -> str:
+        return "v3"
 
     async def list_events(
         self,
@@ -70,199 +122,129 @@ class AsyncGCalService:
         time_max: Optional[str] = None,
     ) -> dict[str, Any]:
         """List calendar events"""
-        logger.debug(f"Listing events for user: {user_id}, max_results: {max_results}")
-
-        service = await self._get_service(user_id)
-
-        def _list_events() -> dict[str, Any]:
-            try:
-                # Default to next 7 days if no time range specified
-                actual_time_min = time_min if time_min else datetime.utcnow().isoformat() + "Z"
-                actual_time_max = (
-                    time_max
-                    if time_max
-                    else (datetime.utcnow() + timedelta(days=7)).isoformat() + "Z"
-                )
+        logger.debug("Listing events for user: %s, max_results: %s", user_id, max_results)
 
-                logger.debug(f"Fetching events from {actual_time_min} to {actual_time_max}")
-
-                events_result = (
-                    service.events()
-                    .list(
-                        calendarId="primary",
-                        timeMin=actual_time_min,
-                        timeMax=actual_time_max,
-                        maxResults=max_results,
-                        singleEvents=True,
-                        orderBy="startTime",
-                    )
-                    .execute()
-                )
+        # Default to next 7 days if no time range specified
+        if time_min and time_max:
+            actual_time_min, actual_time_max = time_min, time_max
+        else:
+            now, week_ahead = _time_window(days=7)
+            actual_time_min = time_min or now
+            actual_time_max = time_max or week_ahead
 
-                events = events_result.get("items", [])
-                logger.debug(f"Found {len(events)} events")
-
-                formatted_events = []
-                for event in events:
-                    start = event["start"].get("dateTime", event["start"].get("date"))
-                    end = event["end"].get("dateTime", event["end"].get("date"))
-
-                    formatted_events.append(
-                        {
-                            "id": event["id"],
-                            "summary": event.get("summary", "No title"),
-                            "start": start,
-                            "end": end,
-                            "location": event.get("location", ""),
-                            "description": event.get("description", ""),
-                            "attendees": [
-                                att.get("email", "") for att in event.get("attendees", [])
-                            ],
-                            "status": event.get("status", "confirmed"),
-                            "link": event.get("htmlLink", ""),
-                        }
-                    )
+        logger.debug("Fetching events from %s to %s", actual_time_min, actual_time_max)
 
-                result = {"count": len(formatted_events), "events": formatted_events}
-
-                logger.debug(f"Events list completed, returning {result['count']} events")
-                return result
-
-            except Exception as e:
-                logger.error(f"Error listing events: {str(e)}", exc_info=True)
-                raise
-
-        loop = asyncio.get_event_loop()
         try:
-            return await loop.run_in_executor(self.executor, _list_events)
+            events_result = await self._execute_request(
+                partial(_list_request, actual_time_min, actual_time_max, max_results, None), user_id
+            )
+        except ValueError:
+            # Authentication problems are reported as-is
+            raise
         except Exception as e:
-            logger.error(f"Failed to list events: {str(e)}")
+            logger.error("Failed to list events: %s", e)
             raise Exception(f"Failed to list events: {str(e)}")
 
+        events = events_result.get("items", [])
+        logger.debug("Found %s events", len(events))
+
+        formatted_events = [_format_event_summary(event) for event in events]
+        result = {"count": len(formatted_events), "events": formatted_events}
+
+        logger.debug("Events list completed, returning %s events", result["count"])
+        return result
+
     async def search_events(
         self, user_id: str, query: str, max_results: int = 10
     ) -> dict[str, Any]:
         """Search calendar events by text"""
         logger.debug(
-            f"Searching events for user: {user_id}, query: '{query}', max_results: {max_results}"
+            "Searching events for user: %s, query: '%s', max_results: %s",
+            user_id,
+            query,
+            max_results,
         )
 
-        service = await self._get_service(user_id)
-
-        def _search() -> dict[str, Any]:
-            try:
-                logger.debug(f"Executing Calendar search with query: '{query}'")
-
-                # Search in the next 365 days
-                time_min = datetime.utcnow().isoformat() + "Z"
-                time_max = (datetime.utcnow() + timedelta(days=365)).isoformat() + "Z"
-
-                events_result = (
-                    service.events()
-                    .list(
-                        calendarId="primary",
-                        timeMin=time_min,
-                        timeMax=time_max,
-                        q=query,
-                        maxResults=max_results,
-                        singleEvents=True,
-                        orderBy="startTime",
-                    )
-                    .execute()
-                )
-
-                events = events_result.get("items", [])
-                logger.debug(f"Search returned {len(events)} events")
-
-                formatted_events = []
-                for event in events:
-                    start = event["start"].get("dateTime", event["start"].get("date"))
-                    end = event["end"].get("dateTime", event["end"].get("date"))
-
-                    formatted_events.append(
-                        {
-                            "id": event["id"],
-                            "summary": event.get("summary", "No title"),
-                            "start": start,
-                            "end": end,
-                            "location": event.get("location", ""),
-                            "description": event.get("description", ""),
-                            "attendees": [
-                                att.get("email", "") for att in event.get("attendees", [])
-                            ],
-                            "status": event.get("status", "confirmed"),
-                            "link": event.get("htmlLink", ""),
-                        }
-                    )
+        # Search in the next 365 days
+        time_min, time_max = _time_window(days=365)
 
-                result = {"count": len(formatted_events), "events": formatted_events}
-
-                logger.debug(f"Search completed successfully, returning {result['count']} events")
-                return result
-
-            except Exception as e:
-                logger.error(f"Error during event search: {str(e)}", exc_info=True)
-                raise
-
-        loop = asyncio.get_event_loop()
         try:
-            return await loop.run_in_executor(self.executor, _search)
+            events_result = await self._execute_request(
+                partial(_list_request, time_min, time_max, max_results, query), user_id
+            )
+        except ValueError:
+            # Authentication problems are reported as-is
+            raise
         except Exception as e:
-            logger.error(f"Failed to search events: {str(e)}")
+            logger.error("Failed to search events: %s", e)
             raise Exception(f"Failed to search events: {str(e)}")
 
+        events = events_result.get("items", [])
+        logger.debug("Search returned %s events", len(events))
+
+        formatted_events = [_format_event_summary(event) for event in events]
+        result = {"count": len(formatted_events), "events": formatted_events}
+
+        logger.debug("Search completed successfully, returning %s events", result["count"])
+        return result
+
     async def get_event(self, user_id: str, event_id: str) -> dict[str, Any]:
         """Get detailed information about a specific event"""
-        logger.debug(f"Getting event for user: {user_id}, event_id: {event_id}")
-
-        service = await self._get_service(user_id)
-
-        def _get_event() -> dict[str, Any]:
-            try:
-                logger.debug(f"Fetching event details for ID: {event_id}")
-                event = service.events().get(calendarId="primary", eventId=event_id).execute()
-
-                start = event["start"].get("dateTime", event["start"].get("date"))
-                end = event["end"].get("dateTime", event["end"].get("date"))
-
-                result = {
-                    "id": event["id"],
-                    "summary": event.get("summary", "No title"),
-                    "start": start,
-                    "end": end,
-                    "location": event.get("location", ""),
-                    "description": event.get("description", ""),
-                    "attendees": [
-                        {
-                            "email": att.get("email", ""),
-                            "displayName": att.get("displayName", ""),
-                            "responseStatus": att.get("responseStatus", "needsAction"),
-                        }
-                        for att in event.get("attendees", [])
-                    ],
-                    "organizer": event.get("organizer", {}).get("email", ""),
-                    "status": event.get("status", "confirmed"),
-                    "link": event.get("htmlLink", ""),
-                    "created": event.get("created", ""),
-                    "updated": event.get("updated", ""),
-                    "recurringEventId": event.get("recurringEventId", ""),
-                }
-
-                logger.debug(f"Event retrieved successfully: {result['summary']}")
-                return result
-
-            except Exception as e:
-                logger.error(f"Error getting event {event_id}: {str(e)}", exc_info=True)
-                raise
-
-        loop = asyncio.get_event_loop()
+        logger.debug("Getting event for user: %s, event_id: %s", user_id, event_id)
+
         try:
-            return await loop.run_in_executor(self.executor, _get_event)
+            event = await self._execute_request(partial(_get_request, event_id), user_id)
+        except ValueError:
+            # Authentication problems are reported as-is
+            raise
         except Exception as e:
-            logger.error(f"Failed to get event: {str(e)}")
+            logger.error("Failed to get event: %s", e)
             raise Exception(f"Failed to get event: {str(e)}")
 
-    def __del__(self) -> None:
-        """Cleanup executor on deletion"""
-        if hasattr(self, "executor"):
-            self.executor.shutdown(wait=False)
+        result = _format_event_details(event)
+
+        logger.debug("Event retrieved successfully: %s", result["summary"])
+        return result
+
+    async def get_events(self, user_id: str, event_ids: list[str]) -> dict[str, Any]:
+        """Get detailed information about several events in one batch request.
+
+        Events are returned in the order their ids were given, duplicates once.
+        An event that can't be fetched (e.g. deleted) is reported under "errors"
+        by id instead of failing the whole call.
+        """
+        logger.debug("Getting %s events for user: %s", len(event_ids), user_id)
+
+        unique_ids = list(dict.fromkeys(event_ids))
+        events: dict[str, dict[str, Any]] = {}
+        errors: dict[str, str] = {}
+
+        def _collect(request_id: str, response: Any, exception: Optional[Exception]) -> None:
+            if exception is not None:
+                errors[request_id] = str(exception)
+            else:
+                events[request_id] = _format_event_details(response)
+
+        try:
+            # Batches share the user's concurrency slots like any other request
+            await asyncio.gather(
+                *(
+                    self._execute_request(
+                        partial(
+                            _batch_get_request, unique_ids[offset : offset + _BATCH_SIZE], _collect
+                        ),
+                        user_id,
+                    )
+                    for offset in range(0, len(unique_ids), _BATCH_SIZE)
+                )
+            )
+        except ValueError:
+            # Authentication problems are reported as-is
+            raise
+        except Exception as e:
+            logger.error("Failed to get events: %s", e)
+            raise Exception(f"Failed to get events: {str(e)}")
+
+        ordered = [events[event_id] for event_id in unique_ids if event_id in events]
+        logger.debug("Retrieved %s events, %s failed", len(ordered), len(errors))
+        return {"count": len(ordered), "events": ordered, "errors": errors}
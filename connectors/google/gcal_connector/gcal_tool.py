@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Awaitable, Callable
 from typing import Any, Optional
 
 from connectors.google.auth import AsyncGoogleOAuthHandler
@@ -15,21 +16,24 @@ class GCalConnectorTool:
         logger.debug("Initializing GCalConnectorTool")
         self.oauth_handler = oauth_handler
         self.gcal_service = AsyncGCalService(oauth_handler)
+        # Operations available through execute(), by method name
+        self._methods: dict[str, Callable[..., Awaitable[dict[str, Any]]]] = {
+            "list_events": self.list_events,
+            "search_events": self.search_events,
+            "get_event": self.get_event,
+            "get_events": self.get_events,
+        }
         logger.debug("GCalConnectorTool initialized")
 
     async def execute(self, method: str, **kwargs: Any) -> dict[str, Any]:
         """Execute a Calendar operation"""
-        logger.debug(f"Executing Calendar method: {method} with args: {kwargs}")
-
-        if method == "list_events":
-            return await self.list_events(**kwargs)
-        elif method == "search_events":
-            return await self.search_events(**kwargs)
-        elif method == "get_event":
-            return await self.get_event(**kwargs)
-        else:
-            logger.error(f"Unknown method: {method}")
+        logger.debug("Executing Calendar method: %s with args: %s", method, kwargs)
+
+        handler = self._methods.get(method)
+        if handler is None:
+            logger.error("Unknown method: %s", method)
             raise ValueError(f"Unknown method: {method}")
+        return await handler(**kwargs)
 
     async def list_events(
         self,
@@ -39,14 +43,14 @@ class GCalConnectorTool:
         time_max: Optional[str] = None,
     ) -> dict[str, Any]:
         """List calendar events"""
-        logger.debug(f"Listing events - user: {user_id}, max_results: {max_results}")
+        logger.debug("Listing events - user: %s, max_results: %s", user_id, max_results)
 
         try:
             result = await self.gcal_service.list_events(user_id, max_results, time_min, time_max)
-            logger.debug(f"List completed - found {result['count']} events")
+            logger.debug("List completed - found %s events", result["count"])
             return result
         except Exception as e:
-            logger.error(f"Error listing events: {str(e)}", exc_info=True)
+            logger.error("Error listing events: %s", e, exc_info=True)
             raise Exception(f"Failed to list events: {str(e)}")
 
     async def search_events(
@@ -54,25 +58,37 @@ class GCalConnectorTool:
     ) -> dict[str, Any]:
         """Search calendar events by text"""
         logger.debug(
-            f"Searching events - user: {user_id}, query: '{query}', max_results: {max_results}"
+            "Searching events - user: %s, query: '%s', max_results: %s", user_id, query, max_results
         )
 
         try:
             result = await self.gcal_service.search_events(user_id, query, max_results)
-            logger.debug(f"Search completed - found {result['count']} events")
+            logger.debug("Search completed - found %s events", result["count"])
             return result
         except Exception as e:
-            logger.error(f"Error searching events: {str(e)}", exc_info=True)
+            logger.error("Error searching events: %s", e, exc_info=True)
             raise Exception(f"Failed to search events: {str(e)}")
 
     async def get_event(self, user_id: str, event_id: str) -> dict[str, Any]:
         """Get detailed information about a specific event"""
-        logger.debug(f"Getting event - user: {user_id}, event_id: {event_id}")
+        logger.debug("Getting event - user: %s, event_id: %s", user_id, event_id)
 
         try:
             result = await self.gcal_service.get_event(user_id, event_id)
-            logger.debug(f"Event retrieved - summary: {result['summary']}")
+            logger.debug("Event retrieved - summary: %s", result["summary"])
             return result
         except Exception as e:
-            logger.error(f"Error getting event: {str(e)}", exc_info=True)
+            logger.error("Error getting event: %s", e, exc_info=True)
             raise Exception(f"Failed to get event: {str(e)}")
+
+    async def get_events(self, user_id: str, event_ids: list[str]) -> dict[str, Any]:
+        """Get detailed information about several events in one request"""
+        logger.debug("Getting events - user: %s, event_ids: %s", user_id, event_ids)
+
+        try:
+            result = await self.gcal_service.get_events(user_id, event_ids)
+            logger.debug("Events retrieved - found %s events", result["count"])
+            return result
+        except Exception as e:
+            logger.error("Error getting events: %s", e, exc_info=True)
+            raise Exception(f"Failed to get events: {str(e)}")
@@ -1,12 +1,10 @@
 import asyncio
 import base64
 import logging
-from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
-from googleapiclient.discovery import build
-
 from connectors.google.auth import AsyncGoogleOAuthHandler
+from connectors.google.base_service import get_api_executor
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +15,7 @@ class AsyncGmailService:
     def __init__(self, oauth_handler: AsyncGoogleOAuthHandler):
         logger.debug("Initializing AsyncGmailService")
         self.oauth_handler = oauth_handler
-        self.executor = ThreadPoolExecutor(max_workers=4)
+        self.executor = get_api_executor()
         logger.debug("Gmail service initialized")
 
     async def _get_service(self, user_id: str) -> Any:
@@ -32,9 +30,11 @@ class AsyncGmailService:
 
         logger.debug("Refreshing credentials if needed")
         try:
+            token_before = credentials.token
             credentials = await self.oauth_handler.refresh_token(credentials)
-            # Only store credentials if refresh was successful
-            await self.oauth_handler.store_credentials(user_id, credentials)
+            # Only store credentials if a refresh actually issued a new token
+            if credentials.token != token_before:
+                await self.oauth_handler.store_credentials(user_id, credentials)
         except ValueError as e:
             # This is our specific token expired error
             logger.warning(f"Token expired/revoked for user {user_id}: {str(e)}")
@@ -50,16 +50,24 @@ class AsyncGmailService:
                 raise
 
         def _build_service() -> Any:
+            from googleapiclient.discovery import build
+
             try:
                 logger.debug("Building Gmail API service")
-                service = build("gmail", "v1", credentials=credentials)
+                service = build(
+                    "gmail",
+                    "v1",
+                    credentials=credentials,
+                    static_discovery=True,
+                    cache_discovery=False,
+                )
                 logger.debug("Gmail API service built successfully")
                 return service
             except Exception as e:
                 logger.error(f"Error building Gmail service: {str(e)}", exc_info=True)
                 raise
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(self.executor, _build_service)
 
     async def search_messages(
@@ -134,7 +142,7 @@ class AsyncGmailService:
                 logger.error(f"Error during message search: {str(e)}", exc_info=True)
                 raise
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         try:
             return await loop.run_in_executor(self.executor, _search)
         except Exception as e:
@@ -192,7 +200,7 @@ class AsyncGmailService:
                 logger.error(f"Error getting message {message_id}: {str(e)}", exc_info=True)
                 raise
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         try:
             return await loop.run_in_executor(self.executor, _get_message)
         except Exception as e:
@@ -328,7 +336,7 @@ class AsyncGmailService:
                 logger.error(f"Error getting labels: {str(e)}", exc_info=True)
                 raise
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         try:
             return await loop.run_in_executor(self.executor, _get_labels)
         except Exception as e:
@@ -378,7 +386,7 @@ class AsyncGmailService:
                     logger.error(f"Error getting profile: {error_str}")
                     raise
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         try:
             return await loop.run_in_executor(self.executor, _get_profile)
         except ValueError:
@@ -387,8 +395,3 @@ class AsyncGmailService:
         except Exception as e:
             logger.error(f"Failed to get profile: {str(e)}")
             raise Exception(f"Failed to get profile: {str(e)}")
-
-    def __del__(self) -> None:
-        """Cleanup executor on deletion"""
-        if hasattr(self, "executor"):
-            self.executor.shutdown(wait=False)
@@ -0,0 +1,29 @@
+"""Response model for Google API clients that decodes JSON with msgspec.
+
+Imported only when a client is built, so it can depend on googleapiclient at
+module level without slowing down startup.
+"""
+
+from typing import Any
+
+import msgspec
+from googleapiclient.model import JsonModel
+
+
+class MsgspecJsonModel(JsonModel):
+    """JsonModel that parses response bodies with msgspec instead of json.
+
+    Large responses (full Docs bodies, long file listings) are dominated by JSON
+    decoding, which msgspec does faster and straight from bytes, skipping the
+    UTF-8 decode to str that JsonModel does first.
+    """
+
+    def deserialize(self, content: Any) -> Any:
+        try:
+            body = msgspec.json.decode(content)
+        except msgspec.DecodeError:
+            # Same fallback as JsonModel: hand back the raw text
+            return content.decode("utf-8") if isinstance(content, bytes) else content
+        if self._data_wrapper and isinstance(body, dict) and "data" in body:
+            body = body["data"]
+        return body
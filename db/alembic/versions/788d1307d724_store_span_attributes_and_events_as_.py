@@ -0,0 +1,66 @@
+"""store span attributes and events as msgpack
+
+Revision ID: 788d1307d724
+Revises: 4c838391f209
+Create Date: 2026-10-16 19:59:35.793519
+
+"""
+
+from typing import Any, Callable, Sequence, Union
+
+import msgspec
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "788d1307d724"
+down_revision: Union[str, Sequence[str], None] = "4c838391f209"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _recode_spans(recode: Callable[[Any], Any]) -> None:
+    """Re-encode every stored attributes/events value in place."""
+    conn = op.get_bind()
+    rows = conn.execute(
+        sa.text("SELECT span_id, attributes, events FROM telemetry_spans")
+    ).fetchall()
+    if rows:
+        conn.execute(
+            sa.text(
+                "UPDATE telemetry_spans SET attributes = :attributes, events = :events "
+                "WHERE span_id = :span_id"
+            ),
+            [
+                {
+                    "span_id": span_id,
+                    "attributes": None if attributes is None else recode(attributes),
+                    "events": None if events is None else recode(events),
+                }
+                for span_id, attributes, events in rows
+            ],
+        )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("telemetry_spans") as batch_op:
+        batch_op.alter_column(
+            "attributes", existing_type=sa.JSON(), type_=sa.LargeBinary(), existing_nullable=True
+        )
+        batch_op.alter_column(
+            "events", existing_type=sa.JSON(), type_=sa.LargeBinary(), existing_nullable=True
+        )
+    _recode_spans(lambda value: msgspec.msgpack.encode(msgspec.json.decode(value)))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _recode_spans(lambda value: msgspec.json.encode(msgspec.msgpack.decode(value)).decode())
+    with op.batch_alter_table("telemetry_spans") as batch_op:
+        batch_op.alter_column(
+            "events", existing_type=sa.LargeBinary(), type_=sa.JSON(), existing_nullable=True
+        )
+        batch_op.alter_column(
+            "attributes", existing_type=sa.LargeBinary(), type_=sa.JSON(), existing_nullable=True
+        )
@@ -17,6 +17,7 @@ from sqlalchemy.pool import NullPool
 from sqlmodel import SQLModel
 
 import common.models  # noqa: F401 - Import all models to register them
+from common.models.types import json_deserializer, json_serializer
 from config import DB_PATH
 
 logger = logging.getLogger(__name__)
@@ -63,6 +64,8 @@ class DatabaseEngine:
                 echo=False,
                 poolclass=NullPool,  # No connection pooling for SQLite
                 connect_args={"check_same_thread": False, "timeout": 30.0},
+                json_serializer=json_serializer,
+                json_deserializer=json_deserializer,
             )
 
             # Register SQLite pragmas
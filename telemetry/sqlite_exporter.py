@@ -1,15 +1,15 @@
 """SQLite span exporter for storing telemetry data in the same database as conversations."""
 
 import asyncio
-import json
 import logging
-from datetime import datetime
 from typing import Any
 
 from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
-from sqlalchemy import text
+from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from common.models import TelemetrySpan
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,57 +31,35 @@ class SQLiteSpanExporter(SpanExporter):
         """Export spans to SQLite database asynchronously."""
         try:
             engine = await self.db_manager.get_async_engine()
+            rows = [
+                {
+                    "span_id": format(span.context.span_id, "016x"),
+                    "trace_id": format(span.context.trace_id, "032x"),
+                    "parent_span_id": format(span.parent.span_id, "016x") if span.parent else None,
+                    "name": span.name,
+                    "service_name": span.resource.attributes.get("service.name", "unknown"),
+                    "start_time": span.start_time / 1e9,  # Convert to seconds
+                    "end_time": span.end_time / 1e9 if span.end_time else None,
+                    "duration_ms": (span.end_time - span.start_time) / 1e6
+                    if span.end_time
+                    else None,
+                    "attributes": {k: str(v) for k, v in span.attributes.items()},
+                    "events": [
+                        {
+                            "name": event.name,
+                            "timestamp": event.timestamp / 1e9,
+                            "attributes": dict(event.attributes) if event.attributes else {},
+                        }
+                        for event in span.events
+                    ],
+                    "status": span.status.status_code.name,
+                }
+                for span in spans
+            ]
+
+            # One INSERT OR REPLACE executemany for the whole batch
             async with AsyncSession(engine) as session:
-                for span in spans:
-                    # Extract span data
-                    span_data = {
-                        "span_id": format(span.context.span_id, "016x"),
-                        "trace_id": format(span.context.trace_id, "032x"),
-                        "parent_span_id": format(span.parent.span_id, "016x")
-                        if span.parent
-                        else None,
-                        "name": span.name,
-                        "service_name": span.resource.attributes.get("service.name", "unknown"),
-                        "start_time": span.start_time / 1e9,  # Convert to seconds
-                        "end_time": span.end_time / 1e9 if span.end_time else None,
-                        "duration_ms": (span.end_time - span.start_time) / 1e6
-                        if span.end_time
-                        else None,
-                        "attributes": json.dumps({k: str(v) for k, v in span.attributes.items()}),
-                        "events": json.dumps(
-                            [
-                                {
-                                    "name": event.name,
-                                    "timestamp": event.timestamp / 1e9,
-                                    "attributes": dict(event.attributes)
-                                    if event.attributes
-                                    else {},
-                                }
-                                for event in span.events
-                            ]
-                        ),
-                        "status": span.status.status_code.name,
-                    }
-
-                    # Add created_at timestamp
-                    span_data["created_at"] = datetime.utcnow()
-
-                    # Insert or replace span using SQLAlchemy
-                    await session.execute(
-                        text("""
-                        INSERT OR REPLACE INTO telemetry_spans (
-                            span_id, trace_id, parent_span_id, name, service_name,
-                            start_time, end_time, duration_ms, attributes, events, 
-                            status, created_at
-                        ) VALUES (
-                            :span_id, :trace_id, :parent_span_id, :name, :service_name,
-                            :start_time, :end_time, :duration_ms, :attributes, :events, 
-                            :status, :created_at
-                        )
-                        """),
-                        span_data,
-                    )
-
+                await TelemetrySpan.bulk_insert(session, rows, replace=True)
                 await session.commit()
 
             return SpanExportResult.SUCCESS
@@ -94,24 +72,18 @@ class SQLiteSpanExporter(SpanExporter):
         """Get all spans for a trace asynchronously."""
         engine = await self.db_manager.get_async_engine()
         async with AsyncSession(engine) as session:
+            # Core select over the table, so attributes/events are decoded by
+            # their column type
+            table = TelemetrySpan.__table__  # type: ignore[attr-defined]
             result = await session.execute(
-                text(
-                    "SELECT * FROM telemetry_spans WHERE trace_id = :trace_id ORDER BY start_time"
-                ),
-                {"trace_id": trace_id},
+                select(table).where(table.c.trace_id == trace_id).order_by(table.c.start_time)
             )
-            rows = result.fetchall()
-
-            # Get column names
-            columns = result.keys()
 
-            # Convert to dictionaries
             spans = []
-            for row in rows:
-                span = dict(zip(columns, row))
-                # Parse JSON fields
-                span["attributes"] = json.loads(span["attributes"]) if span["attributes"] else {}
-                span["events"] = json.loads(span["events"]) if span["events"] else []
+            for row in result.mappings():
+                span = dict(row)
+                span["attributes"] = span["attributes"] or {}
+                span["events"] = span["events"] or []
                 spans.append(span)
 
             return spans
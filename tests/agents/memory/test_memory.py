@@ -4,6 +4,8 @@ import asyncio
 from datetime import datetime
 
 import pytest
+from pydantic import ValidationError
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.orm import selectinload
 
 from agents.memory.memory_backend import MemoryBackend
@@ -24,6 +26,13 @@ from common.types.tools import ToolCall, ToolCallResult
 class TestTurnManagement:
     """Test typed interface for turn management."""
 
+    def test_requests_are_frozen(self) -> None:
+        """Requests cannot be mutated once built."""
+        request = TurnCreationRequest(user_query="q", agent_id="A", session_id="s")
+
+        with pytest.raises(ValidationError):
+            request.user_query = "changed"  # type: ignore[misc]
+
     @pytest.mark.asyncio
     async def test_create_turn(self, memory_manager: MemoryManager) -> None:
         """Test creating a turn with typed request."""
@@ -855,3 +864,59 @@ class TestDatabaseConsistency:
             assert len(turn_with_tools.tool_usages) == 3
             tool_names = {t.tool_name for t in turn_with_tools.tool_usages}
             assert tool_names == {"tool_0", "tool_1", "tool_2"}
+
+    @pytest.mark.asyncio
+    async def test_turn_reads_do_not_load_relationships(
+        self, storage_backend: MemoryBackend, count_queries: list[str]
+    ) -> None:
+        """Backend turn reads run one query and never lazy-load tool usages."""
+        async with storage_backend.async_session() as session:  # type: ignore[attr-defined]
+            for n in range(3):
+                session.add(
+                    ConversationTurn(
+                        id=f"strict-turn-{n}",
+                        agent_id="strict-agent",
+                        session_id="strict-session",
+                        turn_number=n,
+                        source_entity="USER",
+                        target_entity="METAGEN",
+                        conversation_type="USER_AGENT",
+                        user_query="Test",
+                        agent_response="Testing",
+                    )
+                )
+                session.add(
+                    ToolUsage(
+                        id=f"strict-tool-{n}",
+                        turn_id=f"strict-turn-{n}",
+                        agent_id="strict-agent",
+                        tool_name="tool",
+                    )
+                )
+            await session.commit()
+
+        count_queries.clear()
+        turns = await storage_backend.get_turns_by_agent("strict-agent")
+
+        assert len(turns) == 3
+        assert len(count_queries) <= 1
+        with pytest.raises(InvalidRequestError):
+            _ = turns[0].tool_usages
+
+    @pytest.mark.asyncio
+    async def test_turn_numbering_is_part_of_the_insert(
+        self, memory_manager: MemoryManager, count_queries: list[str]
+    ) -> None:
+        """Creating a turn numbers it per agent without a separate MAX() query."""
+        turn_ids = []
+        for agent_id in ["number-agent", "number-agent", "other-agent", "number-agent"]:
+            count_queries.clear()
+            turn_ids.append(
+                await memory_manager.create_in_progress_turn(
+                    agent_id=agent_id, session_id="number-session", user_query="q"
+                )
+            )
+            assert len([s for s in count_queries if "conversation_turns" in s]) == 1
+
+        turns = [await memory_manager.get_turn_by_id(turn_id) for turn_id in turn_ids]
+        assert [turn.turn_number for turn in turns if turn] == [1, 2, 1, 3]
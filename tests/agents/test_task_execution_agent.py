@@ -1,5 +1,6 @@
 """Tests for TaskExecutionAgent."""
 
+import sys
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
@@ -295,3 +296,17 @@ class TestTaskExecutionAgent:
         task_execution_agent.clear_current_task()
         assert task_execution_agent.current_task_context is None
         assert task_execution_agent.is_executing is False
+
+    def test_input_value_names_are_interned(self) -> None:
+        """Parameter names built at runtime share the interned copy."""
+        name = "".join(["file", "_path"])
+        context = TaskExecutionContext(
+            task_id="t",
+            task_name="n",
+            instructions="i",
+            input_values={name: ParameterValue(value="x", parameter_type=ParameterType.STRING)},
+            tool_call_id="c",
+        )
+
+        (key,) = context.input_values
+        assert key is sys.intern("file_path")
@@ -1,14 +1,13 @@
 """Helper utilities for parsing and consuming SSE streams in tests."""
 
 import asyncio
-import json
 import logging
 from typing import Callable, Optional
 
 from httpx import AsyncClient, Response
 
 from api.models.chat import ChatRequest
-from common.messages import AgentMessage, ApprovalRequestMessage, Message, message_from_dict
+from common.messages import AgentMessage, ApprovalRequestMessage, Message, message_from_json
 
 logger = logging.getLogger(__name__)
 
@@ -26,16 +25,9 @@ async def parse_sse_line(line: str) -> Optional[Message]:
         return None
 
     try:
-        json_str = line[6:]  # Remove "data: " prefix
-        data = json.loads(json_str)
-
-        # Check for completion signal (not a Message type)
-        if data.get("type") == "complete":
-            return None  # Handle completion separately
-
-        # Convert dict to proper Message type
-        return message_from_dict(data)
-    except (json.JSONDecodeError, ValueError) as e:
+        # Remove "data: " prefix and validate the JSON straight into a Message
+        return message_from_json(line[6:])
+    except ValueError as e:
         logger.warning(f"Failed to parse SSE line: {line}, error: {e}")
         return None
 
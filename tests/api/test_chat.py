@@ -4,11 +4,15 @@ These tests use FastAPI's TestClient which automatically handles the server life
 No actual server needs to be running - TestClient creates an in-process test server.
 """
 
+import json
+
 import pytest
 from fastapi.testclient import TestClient
 
 from api.models.chat import ChatRequest
+from api.routes.chat import _sse_frame
 from api.server import app
+from common.messages import create_user_message
 
 # ============================================================================
 # FIXTURES
@@ -85,3 +89,16 @@ class TestChatStream:
         assert response.status_code == 422
         error_detail = response.json()
         assert "detail" in error_detail
+
+
+class TestSSEFrame:
+    """Unit tests for the SSE frame encoding."""
+
+    def test_frame_keeps_empty_metadata(self) -> None:
+        """Frames are the message's JSON plus an empty metadata object."""
+        message = create_user_message("METAGEN", "stream-123", "hello")
+
+        frame = _sse_frame(message)
+
+        assert frame.startswith(b"data: ") and frame.endswith(b"\n\n")
+        assert json.loads(frame[len(b"data: ") :]) == {**message.to_dict(), "metadata": {}}
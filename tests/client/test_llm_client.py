@@ -102,7 +102,7 @@ class TestLLMClientUnit:
             role=LLMMessageRole.ASSISTANT,
             content="I'll help you with that calculation.",
             tool_calls=[
-                {"id": "call_1", "name": "calculator", "arguments": {"expression": "2 + 2"}}
+                ToolCall(id="call_1", name="calculator", arguments={"expression": "2 + 2"})
             ],
             usage=LLMTokenUsage(input_tokens=100, output_tokens=50, total_tokens=150),
             model=model_id.value,
@@ -164,12 +164,8 @@ class TestLLMClientUnit:
             role=LLMMessageRole.ASSISTANT,
             content="I'll search for that information and calculate the result.",
             tool_calls=[
-                {"id": "call_1", "name": "search", "arguments": {"query": "Paris weather"}},
-                {
-                    "id": "call_2",
-                    "name": "calculator",
-                    "arguments": {"expression": "32 * 1.8 + 32"},
-                },
+                ToolCall(id="call_1", name="search", arguments={"query": "Paris weather"}),
+                ToolCall(id="call_2", name="calculator", arguments={"expression": "32 * 1.8 + 32"}),
             ],
             usage=LLMTokenUsage(input_tokens=120, output_tokens=60, total_tokens=180),
             model=model_id.value,
@@ -292,7 +288,7 @@ class TestLLMClientUnit:
         initial_response = LLMMessage(
             role=LLMMessageRole.ASSISTANT,
             content="Let me calculate that.",
-            tool_calls=[{"id": "call_1", "name": "calculator", "arguments": {"expr": "1/0"}}],
+            tool_calls=[ToolCall(id="call_1", name="calculator", arguments={"expr": "1/0"})],
             usage=LLMTokenUsage(input_tokens=50, output_tokens=20, total_tokens=70),
             model=model_id.value,
             finish_reason="tool_use",
@@ -0,0 +1,410 @@
+"""Unit tests for OpenAIClient internals (no network access required)."""
+
+import asyncio
+import json
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from openai import AsyncOpenAI
+from pydantic import BaseModel
+
+from client import openai_client
+from client.models import get_model
+from client.openai_client import OpenAIClient
+from client.types import LLMMessage, LLMMessageRole
+from common.types import ToolCall, ToolCallResult
+from config import LLM_CLIENT_CONFIG
+from tools.base import Tool
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestOpenAIClientPool:
+    """Tests for the process-wide AsyncOpenAI pool."""
+
+    async def test_clients_share_pooled_async_openai(self) -> None:
+        """Clients with the same API key share one AsyncOpenAI instance."""
+        first = OpenAIClient(api_key="pool-test-key")
+        second = OpenAIClient(api_key="pool-test-key")
+        await first.initialize()
+        await second.initialize()
+        key = openai_client._pool_key("pool-test-key")
+
+        assert first._client is second._client
+        assert openai_client._CLIENT_REFS[key] == 2
+
+        # Closing one user keeps the shared client alive for the other
+        await first.close()
+        assert first._client is None
+        assert openai_client._CLIENT_POOL[key][0] is second._client
+        assert second._http is not None and not second._http.is_closed
+
+        http_client = second._http
+        await second.close()
+        assert http_client.is_closed
+        assert key not in openai_client._CLIENT_POOL
+        assert key not in openai_client._CLIENT_REFS
+
+    async def test_event_loops_do_not_share_clients(self) -> None:
+        """A client initialized on another event loop gets its own pool entry."""
+        here = OpenAIClient(api_key="loop-key")
+        there = OpenAIClient(api_key="loop-key")
+        await here.initialize()
+
+        async def use_other_loop() -> None:
+            await there.initialize()
+            await there.close()
+
+        await asyncio.to_thread(asyncio.run, use_other_loop())
+
+        assert openai_client._CLIENT_REFS[openai_client._pool_key("loop-key")] == 1
+        assert here._http is not None and not here._http.is_closed
+        await here.close()
+
+    async def test_initialize_is_idempotent(self) -> None:
+        """Repeated initialize calls do not take extra pool references."""
+        client = OpenAIClient(api_key="idempotent-key")
+        await client.initialize()
+        await client.initialize()
+        key = openai_client._pool_key("idempotent-key")
+
+        assert openai_client._CLIENT_REFS[key] == 1
+
+        await client.close()
+        await client.close()
+        assert key not in openai_client._CLIENT_POOL
+
+    async def test_concurrent_first_use_initializes_once(self) -> None:
+        """Concurrent lazy initialization takes a single pool reference."""
+        client = OpenAIClient(api_key="concurrent-key")
+
+        await asyncio.gather(*(client._ensure_initialized() for _ in range(5)))
+
+        assert openai_client._CLIENT_REFS[openai_client._pool_key("concurrent-key")] == 1
+        await client.close()
+
+
+def _sse_transport(lines: list[str]) -> httpx.MockTransport:
+    """Build a transport that answers every request with the given SSE lines."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = "".join(f"{line}\n\n" for line in lines)
+        return httpx.Response(200, text=body, headers={"content-type": "text/event-stream"})
+
+    return httpx.MockTransport(handler)
+
+
+def _completion_transport(arguments: str) -> httpx.MockTransport:
+    """Build a transport that answers with a single forced tool call."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            json={
+                "id": "c1",
+                "object": "chat.completion",
+                "created": 0,
+                "model": "m",
+                "choices": [
+                    {
+                        "index": 0,
+                        "finish_reason": "tool_calls",
+                        "message": {
+                            "role": "assistant",
+                            "content": None,
+                            "tool_calls": [
+                                {
+                                    "id": "call_1",
+                                    "type": "function",
+                                    "function": {"name": "Answer", "arguments": arguments},
+                                }
+                            ],
+                        },
+                    }
+                ],
+            },
+        )
+
+    return httpx.MockTransport(handler)
+
+
+class Answer(BaseModel):
+    """Structured answer."""
+
+    answer: str
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestOpenAIClientStructured:
+    """Tests for the structured output fast path."""
+
+    async def test_fast_path_validates_tool_arguments(self) -> None:
+        """A valid forced tool call is returned without going through Instructor."""
+        client = OpenAIClient(api_key="structured-key")
+        client._client = AsyncOpenAI(
+            api_key="structured-key",
+            http_client=httpx.AsyncClient(transport=_completion_transport('{"answer": "42"}')),
+        )
+        client._instructor_client = AsyncMock()
+
+        result = await client.generate_structured(
+            [LLMMessage(role=LLMMessageRole.USER, content="q")], response_model=Answer
+        )
+
+        assert result == Answer(answer="42")
+        client._instructor_client.chat.completions.create.assert_not_called()
+        await client._client.close()
+
+    async def test_invalid_arguments_fall_back_to_instructor(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Invalid tool arguments fall back to Instructor with the remaining attempts."""
+        client = OpenAIClient(api_key="structured-key")
+        client._client = AsyncOpenAI(
+            api_key="structured-key",
+            http_client=httpx.AsyncClient(transport=_completion_transport('{"wrong": 1}')),
+        )
+        client._instructor_client = AsyncMock()
+        client._instructor_client.chat.completions.create.return_value = Answer(answer="retry")
+
+        result = await client.generate_structured(
+            [LLMMessage(role=LLMMessageRole.USER, content="q")], response_model=Answer
+        )
+
+        assert result == Answer(answer="retry")
+        call_kwargs = client._instructor_client.chat.completions.create.call_args.kwargs
+        assert call_kwargs["response_model"] is Answer
+        # The fast-path call used one of the three default attempts
+        assert call_kwargs["max_retries"] == 2
+        assert "retrying through Instructor" in caplog.text
+        await client._client.close()
+
+    @pytest.mark.parametrize("caller_kwarg", ["tools", "tool_choice"])
+    async def test_caller_tools_skip_fast_path(self, caller_kwarg: str) -> None:
+        """Caller-supplied tools/tool_choice go to Instructor without a fast-path request."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(500)
+
+        client = OpenAIClient(api_key="structured-key")
+        client._client = AsyncOpenAI(
+            api_key="structured-key",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+        client._instructor_client = AsyncMock()
+        client._instructor_client.chat.completions.create.return_value = Answer(answer="42")
+        caller_value: Any = [{"type": "function"}] if caller_kwarg == "tools" else "auto"
+
+        result = await client.generate_structured(
+            [LLMMessage(role=LLMMessageRole.USER, content="q")],
+            response_model=Answer,
+            **{caller_kwarg: caller_value},
+        )
+
+        assert result == Answer(answer="42")
+        assert requests == []
+        call_kwargs = client._instructor_client.chat.completions.create.call_args.kwargs
+        assert call_kwargs[caller_kwarg] == caller_value
+        await client._client.close()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestOpenAIClientStreaming:
+    """Tests for streaming response parsing."""
+
+    @pytest.mark.parametrize("fast_stream_parsing", [True, False])
+    async def test_stream_events_match_between_parsers(self, fast_stream_parsing: bool) -> None:
+        """msgspec and SDK chunk parsing yield the same events."""
+        transport = _sse_transport(
+            [
+                'data: {"id":"c1","object":"chat.completion.chunk","created":0,"model":"m",'
+                '"choices":[{"index":0,"delta":{"content":"Hel"},"finish_reason":null}]}',
+                'data: {"id":"c1","object":"chat.completion.chunk","created":0,"model":"m",'
+                '"choices":[{"index":0,"delta":{"content":"lo"},"finish_reason":null}]}',
+                'data: {"id":"c1","object":"chat.completion.chunk","created":0,"model":"m",'
+                '"choices":[{"index":0,"delta":{},"finish_reason":"stop"}]}',
+                "data: [DONE]",
+            ]
+        )
+        client = OpenAIClient(api_key="stream-test-key")
+        client._client = AsyncOpenAI(
+            api_key="stream-test-key", http_client=httpx.AsyncClient(transport=transport)
+        )
+
+        with patch.dict(LLM_CLIENT_CONFIG, {"fast_stream_parsing": fast_stream_parsing}):
+            stream = await client.generate(
+                [LLMMessage(role=LLMMessageRole.USER, content="hi")], stream=True
+            )
+            assert not isinstance(stream, LLMMessage)
+            events = [event async for event in stream]
+
+        assert [event.content for event in events] == ["Hel", "lo", ""]
+        assert events[-1].metadata == {"finish_reason": "stop"}
+        await client._client.close()
+
+
+@pytest.mark.unit
+class TestOpenAIMessageConversion:
+    """Tests for LLMMessage -> OpenAI dict conversion."""
+
+    def test_plain_messages_use_role_value(self) -> None:
+        """Plain text messages convert to role/content dicts for every role."""
+        client = OpenAIClient(api_key="convert-key")
+        messages = [
+            LLMMessage(role=LLMMessageRole.SYSTEM, content="sys"),
+            LLMMessage(role=LLMMessageRole.USER, content="hi"),
+            LLMMessage(role=LLMMessageRole.ASSISTANT, content="hello"),
+        ]
+
+        assert client._convert_messages_to_openai(messages) == [
+            {"role": "system", "content": "sys"},
+            {"role": "user", "content": "hi"},
+            {"role": "assistant", "content": "hello"},
+        ]
+
+    def test_system_prompt_dict_is_cached(self) -> None:
+        """The same system prompt converts to one shared dict across turns."""
+        client = OpenAIClient(api_key="convert-key")
+        prompt = "You are a helpful assistant."
+
+        first = client._convert_messages_to_openai(
+            [LLMMessage(role=LLMMessageRole.SYSTEM, content=prompt)]
+        )
+        second = client._convert_messages_to_openai(
+            [LLMMessage(role=LLMMessageRole.SYSTEM, content=prompt)]
+        )
+
+        assert first[0] is second[0]
+
+    def test_merge_adjacent_messages(self) -> None:
+        """Adjacent user text messages merge when enabled; tool messages never do."""
+        client = OpenAIClient(api_key="convert-key")
+        tool_result = ToolCallResult(
+            tool_name="t",
+            tool_call_id="call_1",
+            content="out",
+            is_error=False,
+            error=None,
+            error_type=None,
+            user_display=None,
+        )
+        messages = [
+            LLMMessage(role=LLMMessageRole.SYSTEM, content="sys"),
+            LLMMessage(role=LLMMessageRole.USER, content="one"),
+            LLMMessage(role=LLMMessageRole.USER, content="two"),
+            LLMMessage(role=LLMMessageRole.TOOL, content="", tool_call_results=[tool_result]),
+            LLMMessage(role=LLMMessageRole.TOOL, content="", tool_call_results=[tool_result]),
+        ]
+
+        with patch.dict(LLM_CLIENT_CONFIG, {"merge_adjacent_messages": True}):
+            converted = client._convert_messages_to_openai(messages)
+
+        assert [m["role"] for m in converted] == ["system", "user", "tool", "tool"]
+        assert converted[1] == {"role": "user", "content": "one\n\ntwo"}
+
+    def test_tool_messages_keep_tool_format(self) -> None:
+        """Assistant tool calls and tool results still use the tool formats."""
+        client = OpenAIClient(api_key="convert-key")
+        messages = [
+            LLMMessage(
+                role=LLMMessageRole.ASSISTANT,
+                content="",
+                tool_calls=[ToolCall(id="call_1", name="read_file", arguments={"path": "a"})],
+            ),
+            LLMMessage(
+                role=LLMMessageRole.TOOL,
+                content="[read_file] Success",
+                tool_call_results=[
+                    ToolCallResult(
+                        tool_name="read_file",
+                        tool_call_id="call_1",
+                        content="data",
+                        is_error=False,
+                        error=None,
+                        error_type=None,
+                        user_display=None,
+                    )
+                ],
+            ),
+        ]
+
+        converted = client._convert_messages_to_openai(messages)
+
+        assert converted[0]["tool_calls"][0]["function"] == {
+            "name": "read_file",
+            "arguments": '{"path": "a"}',
+        }
+        assert converted[1] == {
+            "role": "tool",
+            "tool_call_id": "call_1",
+            "name": "read_file",
+            "content": "data",
+        }
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_tokens", [100, 300, 5000])
+async def test_explicit_max_tokens_is_sent_as_given(max_tokens: int) -> None:
+    """Bucketing never changes a max_tokens the caller chose."""
+    bodies: list[dict[str, Any]] = []
+    transport = _completion_transport('{"answer": "42"}')
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(json.loads(request.content))
+        return transport.handle_request(request)
+
+    client = OpenAIClient(api_key="bucket-key")
+    client._client = AsyncOpenAI(
+        api_key="bucket-key", http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+
+    await client.generate(
+        [LLMMessage(role=LLMMessageRole.USER, content="q")], model="gpt-4o", max_tokens=max_tokens
+    )
+    await client.generate([LLMMessage(role=LLMMessageRole.USER, content="q")], model="gpt-4o")
+    await client.generate(
+        [LLMMessage(role=LLMMessageRole.USER, content="q")], model="gpt-4o", bucket_max_tokens=False
+    )
+
+    assert bodies[0]["max_tokens"] == max_tokens
+    # An unset budget is bucketed below the model's output limit unless opted out
+    assert bodies[1]["max_tokens"] == 4096
+    assert bodies[2]["max_tokens"] == get_model("gpt-4o").max_output_tokens == 16384
+    await client._client.close()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "model_limit,expected",
+    [(None, 4096), (16384, 4096), (4096, 4096), (3000, 2048), (600, 512), (100, 100)],
+)
+def test_bucket_max_tokens(model_limit: int | None, expected: int) -> None:
+    """The default budget is the largest bucket within the model's output limit."""
+    assert openai_client._bucket_max_tokens(model_limit) == expected
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_response_tool_calls_are_typed() -> None:
+    """Tool calls in a parsed response are ToolCall models, not provider dicts."""
+    client = OpenAIClient(api_key="typed-key")
+    client._client = AsyncOpenAI(
+        api_key="typed-key",
+        http_client=httpx.AsyncClient(transport=_completion_transport('{"answer": "42"}')),
+    )
+
+    response = await client.generate(
+        [LLMMessage(role=LLMMessageRole.USER, content="q")],
+        tools=[Tool(name="Answer", description="d", input_schema={"type": "object"})],
+    )
+
+    assert isinstance(response, LLMMessage)
+    assert response.tool_calls == [ToolCall(id="call_1", name="Answer", arguments={"answer": "42"})]
+    await client._client.close()
@@ -0,0 +1,23 @@
+"""Unit tests for LLM client types."""
+
+import pytest
+
+from client.types import LLMMessage, LLMMessageRole
+
+
+@pytest.mark.unit
+class TestLLMMessage:
+    """Tests for the LLMMessage model."""
+
+    def test_role_is_stored_and_dumped_as_string(self) -> None:
+        """Roles are kept as plain strings but still compare equal to the enum."""
+        msg = LLMMessage(role=LLMMessageRole.ASSISTANT, content="hi")
+
+        assert type(msg.role) is str
+        assert msg.role == LLMMessageRole.ASSISTANT
+        assert msg.model_dump()["role"] == "assistant"
+        assert '"role":"assistant"' in msg.model_dump_json()
+
+    def test_schema_is_built_at_import(self) -> None:
+        """The forward reference to LLMTokenUsage is resolved eagerly."""
+        assert LLMMessage.__pydantic_complete__
@@ -0,0 +1,151 @@
+"""Tests for the unified message types and helpers."""
+
+import dataclasses
+import json
+import time
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
+from common.messages import (
+    AnyMessage,
+    PendingApproval,
+    ToolErrorMessage,
+    ToolResultMessage,
+    UserMessage,
+    _fast_now,
+    create_approval_request,
+    create_tool_result,
+    create_user_message,
+    message_from_dict,
+    message_from_json,
+)
+
+
+@pytest.mark.unit
+class TestMessageSerialization:
+    """Tests for Message serialization helpers."""
+
+    def test_to_dict_reflects_nested_changes(self) -> None:
+        """to_dict dumps the current state, including mutated nested values."""
+        msg = create_tool_result("METAGEN", "session-1", "t1", "read_file", {"lines": [1]})
+        msg.to_dict()
+
+        msg.result["lines"].append(2)
+
+        assert msg.to_dict()["result"] == {"lines": [1, 2]}
+
+    def test_to_json_bytes_matches_to_dict(self) -> None:
+        """The bytes fast path encodes the same JSON document as to_dict."""
+        msg = create_tool_result("METAGEN", "session-1", "t1", "read_file", {"lines": [1, 2]})
+
+        assert json.loads(msg.to_json_bytes()) == msg.to_dict()
+
+
+@pytest.mark.unit
+class TestAnyMessage:
+    """Tests for the AnyMessage discriminated union."""
+
+    def test_discriminator_selects_message_class(self) -> None:
+        """Validation picks the class matching the `type` tag."""
+        adapter: TypeAdapter[AnyMessage] = TypeAdapter(AnyMessage)
+
+        msg = adapter.validate_python(
+            {
+                "type": "tool_error",
+                "session_id": "s",
+                "tool_id": "t",
+                "tool_name": "n",
+                "error": "e",
+            }
+        )
+
+        assert isinstance(msg, ToolErrorMessage)
+
+    def test_unknown_type_is_rejected(self) -> None:
+        """An unknown tag fails validation instead of matching a lookalike class."""
+        adapter: TypeAdapter[AnyMessage] = TypeAdapter(AnyMessage)
+
+        with pytest.raises(ValidationError):
+            adapter.validate_python({"type": "bogus", "session_id": "s", "content": "x"})
+
+    def test_message_from_dict_round_trip(self) -> None:
+        """message_from_dict rebuilds the original message class from to_dict output."""
+        msg = create_user_message("METAGEN", "session-1", "hello")
+
+        rebuilt = message_from_dict(msg.to_dict())
+
+        assert isinstance(rebuilt, UserMessage)
+        assert rebuilt == msg
+
+    def test_message_from_dict_requires_type(self) -> None:
+        """A missing type tag raises a ValueError."""
+        with pytest.raises(ValueError, match="Missing 'type'"):
+            message_from_dict({"session_id": "s", "content": "x"})
+
+
+@pytest.mark.unit
+def test_fast_now_reuses_timestamp_within_a_millisecond() -> None:
+    """Back-to-back messages share a timestamp; later ones get a fresh one."""
+    base = time.monotonic() + 1000
+    with patch("common.messages.time.monotonic", side_effect=[base, base + 0.0005, base + 0.002]):
+        first = _fast_now()
+        assert _fast_now() is first
+        assert _fast_now() is not first
+
+
+@pytest.mark.unit
+def test_pending_approval_is_frozen_and_serializable() -> None:
+    """PendingApproval is immutable and dumps as a plain dict inside tool_args."""
+    pending = PendingApproval(
+        tool_id="t1",
+        tool_name="write_file",
+        tool_args={"path": "a"},
+        turn_id="turn-1",
+        requested_at=datetime(2025, 1, 1),
+    )
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        pending.tool_name = "other"  # type: ignore[misc]
+
+    msg = create_approval_request("METAGEN", "s1", "t1", "write_file", {"pending": pending})
+
+    assert msg.to_dict()["tool_args"]["pending"] == {
+        "tool_id": "t1",
+        "tool_name": "write_file",
+        "tool_args": {"path": "a"},
+        "turn_id": "turn-1",
+        "requested_at": "2025-01-01T00:00:00",
+    }
+
+
+@pytest.mark.unit
+def test_tool_result_payload_is_not_copied() -> None:
+    """Validated tool results keep the caller's payload object."""
+    payload = {"lines": ["x"] * 1000}
+
+    msg = ToolResultMessage(session_id="s1", tool_id="t1", tool_name="read", result=payload)
+
+    assert msg.result is payload
+
+
+@pytest.mark.unit
+def test_message_from_json_round_trip() -> None:
+    """to_json_bytes output decodes back to an equal message."""
+    msg = create_tool_result("METAGEN", "s1", "t1", "read", {"ok": True})
+
+    assert message_from_json(msg.to_json_bytes()) == msg
+    with pytest.raises(ValueError):
+        message_from_json(b'{"type": "bogus", "session_id": "s1"}')
+
+
+@pytest.mark.unit
+def test_ids_are_interned() -> None:
+    """Helpers and validated constructors share one object per ID value."""
+    session_id = "".join(["session-", "42"])  # Built at runtime, so not interned yet
+
+    built = create_user_message("METAGEN", session_id, "hi")
+    validated = UserMessage(session_id="".join(["session-", "42"]), content="hi")
+
+    assert built.session_id is validated.session_id
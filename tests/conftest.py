@@ -11,6 +11,7 @@ from typing import Any, Callable, TypeVar
 import pytest
 import pytest_asyncio
 from dotenv import load_dotenv
+from sqlalchemy import event
 
 from agents.memory.memory_manager import MemoryManager
 from agents.memory.sqlite_backend import SQLiteBackend
@@ -120,6 +121,24 @@ async def db_engine(temp_db_path: str) -> Any:  # Generator type
     await engine.close()
 
 
+@pytest_asyncio.fixture
+async def count_queries(db_engine: DatabaseEngine) -> Any:  # Generator type
+    """Record the SQL statements executed on the test database.
+
+    Yields a list that collects each statement as it runs, so tests can assert
+    an upper bound on queries (e.g. to catch N+1 loads) around a fetch.
+    """
+    sync_engine = (await db_engine.get_async_engine()).sync_engine
+    statements: list[str] = []
+
+    def record(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        statements.append(statement)
+
+    event.listen(sync_engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(sync_engine, "before_cursor_execute", record)
+
+
 @pytest_asyncio.fixture
 async def storage_backend(db_engine: DatabaseEngine) -> Any:  # Generator type
     """Create a storage backend (SQLiteBackend) for low-level testing."""
@@ -0,0 +1,91 @@
+"""Tests for BaseGoogleService's cached clients and credential refresh (no network access)."""
+
+import asyncio
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Iterator
+from unittest.mock import patch
+
+import pytest
+from google.oauth2.credentials import Credentials
+
+from connectors.google import base_service
+from connectors.google.auth import AsyncGoogleOAuthHandler
+from connectors.google.gcal_connector.gcal_service_async import AsyncGCalService
+
+
+def _write_token(tokens_dir: Path, token: str, expiry: datetime) -> None:
+    """Write a token file in the format the login flow produces."""
+    token_data = {
+        "access_token": token,
+        "refresh_token": "refresh",
+        "token_uri": "https://oauth2.googleapis.com/token",
+        "client_id": "client",
+        "client_secret": "secret",
+        "scopes": ["https://www.googleapis.com/auth/calendar"],
+        "expiry": expiry.isoformat(),
+    }
+    (tokens_dir / "u1_google_token.json").write_text(json.dumps(token_data))
+
+
+@pytest.fixture
+def service(tmp_path: Path) -> Iterator[AsyncGCalService]:
+    """A Calendar service reading tokens from a temporary directory."""
+    oauth_handler = AsyncGoogleOAuthHandler()
+    oauth_handler.tokens_dir = tmp_path
+    service = AsyncGCalService(oauth_handler)
+    # Build placeholder clients instead of real discovery-based ones
+    with patch("googleapiclient.discovery.build", lambda *args, **kwargs: object()):
+        yield service
+    base_service._service_cache.pop(("u1", service.service_name, service.service_version), None)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_expired_cached_credentials_rebuild_the_service(
+    service: AsyncGCalService, tmp_path: Path
+) -> None:
+    """A cached client whose token has expired is rebuilt from the stored credentials."""
+    now = datetime.utcnow()
+    _write_token(tmp_path, "fresh", now + timedelta(hours=1))
+    stale_client = object()
+    cache_key = ("u1", service.service_name, service.service_version)
+    base_service._service_cache[cache_key] = (
+        stale_client,
+        Credentials(token="old", expiry=now - timedelta(minutes=1)),
+    )
+
+    client = await service._get_service("u1")
+
+    assert client is not stale_client
+    credentials = base_service._service_cache[cache_key][1]
+    assert credentials.token == "fresh"
+    assert credentials.expiry == now + timedelta(hours=1)
+    assert await service._get_service("u1") is client
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_concurrent_requests_refresh_an_expired_token_once(
+    service: AsyncGCalService, tmp_path: Path
+) -> None:
+    """Concurrent callers share one refresh, and the new token and expiry are stored."""
+    _write_token(tmp_path, "old", datetime.utcnow() - timedelta(minutes=1))
+    new_expiry = datetime.utcnow() + timedelta(hours=1)
+    refreshes = 0
+
+    def refresh(credentials: Credentials, request: Any) -> None:
+        nonlocal refreshes
+        refreshes += 1
+        credentials.token = "new"
+        credentials.expiry = new_expiry
+
+    with patch.object(Credentials, "refresh", refresh):
+        clients = await asyncio.gather(*(service._get_service("u1") for _ in range(5)))
+
+    assert refreshes == 1
+    assert all(client is clients[0] for client in clients)
+    stored = await service.oauth_handler.load_credentials("u1")
+    assert stored is not None
+    assert (stored.token, stored.expiry) == ("new", new_expiry)
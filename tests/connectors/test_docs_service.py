@@ -0,0 +1,136 @@
+"""Tests for the Google Docs service's batchUpdate coalescing (no network access)."""
+
+import asyncio
+from typing import Any
+from unittest.mock import patch
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+from config import GOOGLE_API_CONFIG
+from connectors.google.docs_connector.docs_service_async import DocsServiceAsync
+
+
+def _request(name: str) -> dict[str, Any]:
+    """A stand-in update request, tagged so replies can be traced back to it."""
+    return {"insertText": {"text": name}}
+
+
+class FakeDocsService(DocsServiceAsync):
+    """DocsServiceAsync whose API calls are recorded instead of sent.
+
+    Each call replies with one entry per request, echoing its text. A call
+    containing a request whose text is "bad" is rejected as a whole with a 400,
+    like the real (atomic) batchUpdate; one containing "flaky" fails with a 503.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: list[list[str]] = []
+        self.gate: asyncio.Event | None = None
+
+    async def _execute_request(self, request_func: Any, user_id: str = "default_user") -> Any:
+        requests = request_func.args[1]
+        texts = [r["insertText"]["text"] for r in requests]
+        self.calls.append(texts)
+        if self.gate is not None:
+            await self.gate.wait()
+        if "bad" in texts:
+            raise HttpError(httplib2.Response({"status": 400}), b"invalid request")
+        if "flaky" in texts:
+            raise HttpError(httplib2.Response({"status": 503}), b"backend error")
+        return {"documentRevisionId": "rev", "replies": [{"echo": text} for text in texts]}
+
+
+def _echoes(result: dict[str, Any]) -> list[str]:
+    """The request texts a caller's replies belong to."""
+    return [reply["echo"] for reply in result["replies"]]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestUpdateCoalescing:
+    """Tests for combining concurrent batch_update_document calls per document."""
+
+    async def test_concurrent_callers_get_their_own_replies(self) -> None:
+        """Two callers share one API call and each gets only its own replies."""
+        service = FakeDocsService()
+
+        first, second = await asyncio.gather(
+            service.batch_update_document("doc", [_request("a1"), _request("a2")]),
+            service.batch_update_document("doc", [_request("b1")]),
+        )
+
+        assert service.calls == [["a1", "a2", "b1"]]
+        assert _echoes(first) == ["a1", "a2"]
+        assert _echoes(second) == ["b1"]
+        assert first["success"] and second["success"]
+        assert not service._update_flushers and not service._update_queues
+
+    async def test_failed_combined_call_is_retried_per_caller(self) -> None:
+        """Only the caller with the bad request fails once the others are retried alone."""
+        service = FakeDocsService()
+
+        good, bad, other = await asyncio.gather(
+            service.batch_update_document("doc", [_request("a")]),
+            service.batch_update_document("doc", [_request("bad")]),
+            service.batch_update_document("doc", [_request("c")]),
+        )
+
+        assert service.calls == [["a", "bad", "c"], ["a"], ["bad"], ["c"]]
+        assert _echoes(good) == ["a"]
+        assert _echoes(other) == ["c"]
+        assert bad["success"] is False
+        assert "invalid request" in bad["error"]
+
+    async def test_failure_of_unknown_outcome_is_not_retried(self) -> None:
+        """A non-400 failure may have applied the edits, so every caller gets the error."""
+        service = FakeDocsService()
+
+        results = await asyncio.gather(
+            service.batch_update_document("doc", [_request("a")]),
+            service.batch_update_document("doc", [_request("flaky")]),
+            service.batch_update_document("doc", [_request("c")]),
+        )
+
+        assert service.calls == [["a", "flaky", "c"]]
+        assert all(result["success"] is False for result in results)
+        assert all("backend error" in result["error"] for result in results)
+        assert not service._update_flushers and not service._update_queues
+
+    async def test_batches_respect_the_request_cap(self) -> None:
+        """Callers are combined only up to docs_batch_max_requests per call."""
+        service = FakeDocsService()
+
+        with patch.dict(GOOGLE_API_CONFIG, {"docs_batch_max_requests": 3}):
+            results = await asyncio.gather(
+                service.batch_update_document("doc", [_request("a1"), _request("a2")]),
+                service.batch_update_document("doc", [_request("b1")]),
+                service.batch_update_document("doc", [_request("c1"), _request("c2")]),
+            )
+
+        assert service.calls == [["a1", "a2", "b1"], ["c1", "c2"]]
+        assert [_echoes(r) for r in results] == [["a1", "a2"], ["b1"], ["c1", "c2"]]
+
+    async def test_cancelled_caller_does_not_break_the_flusher(self) -> None:
+        """A caller that gives up mid-flight is skipped and later callers still complete."""
+        service = FakeDocsService()
+        service.gate = asyncio.Event()
+
+        cancelled = asyncio.create_task(service.batch_update_document("doc", [_request("a")]))
+        while not service.calls:
+            await asyncio.sleep(0)
+        waiting = asyncio.create_task(service.batch_update_document("doc", [_request("b")]))
+        await asyncio.sleep(0)
+
+        cancelled.cancel()
+        service.gate.set()
+
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        result = await waiting
+
+        assert service.calls == [["a"], ["b"]]
+        assert _echoes(result) == ["b"]
+        assert not service._update_flushers and not service._update_queues
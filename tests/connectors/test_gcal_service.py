@@ -0,0 +1,104 @@
+"""Tests for the Google Calendar service's batched event fetches (no network access)."""
+
+from typing import Any, Callable, Optional
+from unittest.mock import patch
+
+import httplib2
+import pytest
+from google.oauth2.credentials import Credentials
+from googleapiclient.errors import HttpError
+
+from connectors.google import base_service
+from connectors.google.gcal_connector import gcal_service_async
+from connectors.google.gcal_connector.gcal_service_async import AsyncGCalService
+
+
+class FakeBatch:
+    """Stand-in for googleapiclient's BatchHttpRequest.
+
+    On execute() each added request is answered through the callback, with an
+    error for event ids starting with "missing".
+    """
+
+    def __init__(self, callback: Callable[[str, Any, Optional[Exception]], None]) -> None:
+        self.callback = callback
+        self.request_ids: list[str] = []
+
+    def add(self, request: dict[str, str], request_id: str) -> None:
+        assert request["eventId"] == request_id
+        self.request_ids.append(request_id)
+
+    def execute(self) -> None:
+        for event_id in self.request_ids:
+            if event_id.startswith("missing"):
+                self.callback(event_id, None, RuntimeError(f"{event_id} not found"))
+            else:
+                event = {"id": event_id, "start": {"date": "2026-01-01"}, "end": {"date": "d"}}
+                self.callback(event_id, event, None)
+
+
+class FakeCalendar:
+    """Stand-in for a built Calendar client that records each batch it creates."""
+
+    def __init__(self) -> None:
+        self.batches: list[FakeBatch] = []
+
+    def new_batch_http_request(self, callback: Any) -> FakeBatch:
+        batch = FakeBatch(callback)
+        self.batches.append(batch)
+        return batch
+
+    def events(self) -> "FakeCalendar":
+        return self
+
+    def get(self, calendarId: str, eventId: str) -> dict[str, str]:  # noqa: N803
+        return {"calendarId": calendarId, "eventId": eventId}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_events_batches_dedupes_and_collects_errors() -> None:
+    """Ids are sent once each in batches; results keep request order, failures go to errors."""
+    calendar = FakeCalendar()
+    service = AsyncGCalService()
+
+    async def get_service(user_id: str = "default_user") -> FakeCalendar:
+        return calendar
+
+    with (
+        patch.object(service, "_get_service", get_service),
+        patch.object(gcal_service_async, "_BATCH_SIZE", 2),
+    ):
+        result = await service.get_events("u1", ["c", "a", "missing-1", "c", "b", "a"])
+
+    # Batches are built concurrently on executor threads, so their order varies
+    assert sorted(batch.request_ids for batch in calendar.batches) == [
+        ["c", "a"],
+        ["missing-1", "b"],
+    ]
+    assert [event["id"] for event in result["events"]] == ["c", "a", "b"]
+    assert result["count"] == 3
+    assert result["errors"] == {"missing-1": "missing-1 not found"}
+    assert result["events"][0]["start"] == "2026-01-01"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("status", "evicted"), [(500, False), (404, False), (401, True)])
+async def test_execute_request_evicts_cached_service_only_on_auth_failure(
+    status: int, evicted: bool
+) -> None:
+    """A failing request drops the cached client only when the credentials are rejected."""
+    service = AsyncGCalService()
+    cache_key = ("u1", service.service_name, service.service_version)
+    base_service._service_cache[cache_key] = (object(), Credentials(token="t"))
+
+    def failing_request(client: Any) -> Any:
+        raise HttpError(httplib2.Response({"status": status}), b"")
+
+    try:
+        with pytest.raises(HttpError):
+            await service._execute_request(failing_request, "u1")
+        assert (cache_key not in base_service._service_cache) is evicted
+    finally:
+        base_service._service_cache.pop(cache_key, None)
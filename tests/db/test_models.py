@@ -0,0 +1,323 @@
+"""Tests for the SQLModel table definitions."""
+
+import uuid
+from typing import Any, cast
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import QueryableAttribute
+from sqlmodel import Session, SQLModel, select
+
+from common.models import (
+    ConversationTurn,
+    Parameter,
+    ParameterType,
+    TaskDefinition,
+    TelemetrySpan,
+    ToolUsage,
+)
+from common.models.base import new_id
+from common.models.loaders import strict_load
+from db.engine import DatabaseEngine
+from telemetry.sqlite_exporter import SQLiteSpanExporter
+
+
+@pytest.fixture
+def engine() -> Engine:
+    """In-memory SQLite engine with every table created."""
+    engine = create_engine("sqlite:///:memory:")
+    SQLModel.metadata.create_all(engine)
+    return engine
+
+
+def query_plan(engine: Engine, sql: str, **params: Any) -> str:
+    """Return SQLite's query plan for a statement as one string."""
+    with engine.connect() as conn:
+        rows = conn.execute(text(f"EXPLAIN QUERY PLAN {sql}"), params).fetchall()
+    return " | ".join(row[-1] for row in rows)
+
+
+@pytest.mark.unit
+class TestIndexes:
+    """Tests that hot queries are served by the intended indexes."""
+
+    def test_session_turns_use_compound_index(self, engine: Engine) -> None:
+        """Recent turns for a session are a single index range scan, no sort."""
+        plan = query_plan(
+            engine,
+            "SELECT * FROM conversation_turns WHERE session_id = :s ORDER BY timestamp DESC",
+            s="s1",
+        )
+
+        assert "idx_turns_session_time" in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_tool_usage_by_turn_and_status(self, engine: Engine) -> None:
+        """Tool usages filtered by turn and status use the compound index."""
+        plan = query_plan(
+            engine,
+            "SELECT * FROM tool_usage WHERE turn_id = :t AND execution_status = :st",
+            t="turn-1",
+            st="PENDING",
+        )
+
+        assert "idx_tool_usage_turn_status" in plan
+
+    def test_uncompacted_turns_use_partial_index(self, engine: Engine) -> None:
+        """Uncompacted turns in timestamp order come from the partial index, no sort."""
+        plan = query_plan(
+            engine, "SELECT * FROM conversation_turns WHERE compacted = 0 ORDER BY timestamp"
+        )
+
+        assert "idx_turns_uncompacted" in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_unprocessed_compact_memories_use_partial_index(self, engine: Engine) -> None:
+        """A bound processed=False filter still matches the partial index."""
+        plan = query_plan(
+            engine,
+            "SELECT * FROM compact_memories WHERE processed = :p ORDER BY created_at DESC",
+            p=False,
+        )
+
+        assert "idx_compact_memories_unprocessed" in plan
+
+    def test_pending_approvals_use_partial_index(self, engine: Engine) -> None:
+        """The approval queue query is served in order by its partial index."""
+        plan = query_plan(
+            engine,
+            "SELECT * FROM tool_usage WHERE execution_status = :st AND requires_approval = 1 "
+            "AND agent_id = :a ORDER BY created_at",
+            st="PENDING",
+            a="A",
+        )
+
+        assert "idx_tool_usage_approval_queue" in plan
+        assert "TEMP B-TREE" not in plan
+
+
+@pytest.mark.unit
+class TestNewId:
+    """Tests for time-ordered primary key generation."""
+
+    def test_ids_are_uuid7_in_creation_order(self) -> None:
+        """Ids are valid UUIDv7 strings whose time prefix never goes backwards."""
+        ids = [new_id() for _ in range(100)]
+
+        parsed = [uuid.UUID(i) for i in ids]
+        assert {(u.version, u.variant) for u in parsed} == {(7, uuid.RFC_4122)}
+        assert [i[:13] for i in ids] == sorted(i[:13] for i in ids)
+        assert len(set(ids)) == 100
+
+
+def make_turn(turn_id: str, turn_number: int) -> ConversationTurn:
+    """Build a minimal conversation turn."""
+    return ConversationTurn(
+        id=turn_id,
+        session_id="s1",
+        turn_number=turn_number,
+        source_entity="USER",
+        target_entity="METAGEN",
+        conversation_type="USER_AGENT",
+        user_query="q",
+        agent_response="a",
+    )
+
+
+@pytest.mark.unit
+class TestRelationships:
+    """Tests for relationship loading strategies."""
+
+    @staticmethod
+    def _turns_with_usages(engine: Engine) -> None:
+        """Store three turns with one tool usage each."""
+        with Session(engine) as session:
+            for n in range(3):
+                session.add(make_turn(f"turn-{n}", n))
+                session.add(
+                    ToolUsage(id=f"tool-{n}", turn_id=f"turn-{n}", agent_id="A", tool_name="t")
+                )
+            session.commit()
+
+    def test_strict_load_eager_relationship(self, engine: Engine) -> None:
+        """Relationships named in strict_load come back in one extra query for all turns."""
+        self._turns_with_usages(engine)
+
+        statements: list[str] = []
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        with Session(engine) as session:
+            stmt = strict_load(
+                select(ConversationTurn),
+                cast(QueryableAttribute[Any], ConversationTurn.tool_usages),
+            )
+            turns = session.exec(stmt).all()
+            session.expunge_all()
+
+        # Still accessible after the session is gone, so nothing is lazy-loaded
+        assert [len(turn.tool_usages) for turn in turns] == [1, 1, 1]
+        assert len(statements) == 2
+
+    def test_strict_load_raises_on_other_relationships(self, engine: Engine) -> None:
+        """Backend-style reads issue one query and refuse lazy relationship loads."""
+        self._turns_with_usages(engine)
+
+        statements: list[str] = []
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        with Session(engine) as session:
+            turns = session.exec(strict_load(select(ConversationTurn))).all()
+            assert len(statements) == 1
+
+            with pytest.raises(InvalidRequestError):
+                turns[0].tool_usages
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestBulkWrites:
+    """Tests for the batched insert/update helpers."""
+
+    async def test_bulk_insert_and_update(
+        self, db_engine: DatabaseEngine, count_queries: list[str]
+    ) -> None:
+        """A batch is one statement per call and fills defaults and timestamps."""
+        rows = [
+            {"id": f"bulk-{n}", "turn_id": "t", "agent_id": "A", "tool_name": "tool"}
+            for n in range(50)
+        ]
+        async with db_engine.get_session_factory()() as session:
+            session.add(make_turn("t", 0))
+            await session.commit()
+
+            count_queries.clear()
+            await ToolUsage.bulk_insert(session, rows)
+            await ToolUsage.bulk_update(
+                session, [{"id": f"bulk-{n}", "tokens_used": n} for n in range(50)]
+            )
+            await session.commit()
+            assert len([s for s in count_queries if "tool_usage" in s]) == 2
+
+            usages = (await session.execute(select(ToolUsage))).scalars().all()
+
+        assert len(usages) == 50
+        assert {u.created_at for u in usages} == {usages[0].created_at}
+        assert all(u.tool_args == {} for u in usages)
+        tokens = [u.tokens_used for u in usages if u.tokens_used is not None]
+        assert sorted(tokens) == list(range(50))
+
+    async def test_bulk_insert_generates_missing_primary_keys(
+        self, db_engine: DatabaseEngine
+    ) -> None:
+        """Rows without an id get a distinct new_id() each, as session.add() would."""
+        rows = [
+            {
+                "session_id": "s1",
+                "turn_number": n,
+                "source_entity": "USER",
+                "target_entity": "METAGEN",
+                "conversation_type": "USER_AGENT",
+                "user_query": "q",
+                "agent_response": "a",
+            }
+            for n in range(3)
+        ]
+        async with db_engine.get_session_factory()() as session:
+            await ConversationTurn.bulk_insert(session, rows)
+            await session.commit()
+
+            turns = (await session.execute(select(ConversationTurn))).scalars().all()
+
+        ids = [turn.id for turn in turns]
+        assert len(set(ids)) == 3
+        assert {uuid.UUID(i).version for i in ids} == {7}
+
+    async def test_bulk_insert_replace(self, db_engine: DatabaseEngine) -> None:
+        """replace=True overwrites rows with the same primary key."""
+        span = {"span_id": "s1", "trace_id": "tr", "name": "op", "start_time": 1.0}
+        async with db_engine.get_session_factory()() as session:
+            await TelemetrySpan.bulk_insert(session, [span])
+            await TelemetrySpan.bulk_insert(session, [span | {"name": "op2"}], replace=True)
+            await session.commit()
+
+            spans = (await session.execute(select(TelemetrySpan))).scalars().all()
+
+        assert [(s.span_id, s.name) for s in spans] == [("s1", "op2")]
+
+    async def test_span_data_stored_as_msgpack(self, db_engine: DatabaseEngine) -> None:
+        """Span attributes/events are MessagePack blobs that read back as Python values."""
+        span = {
+            "span_id": "s1",
+            "trace_id": "tr",
+            "name": "op",
+            "start_time": 1.0,
+            "attributes": {"tool": "search"},
+            "events": [{"name": "retry", "timestamp": 1.5, "attributes": {"n": 2}}],
+        }
+        async with db_engine.get_session_factory()() as session:
+            empty = {**span, "span_id": "s2", "start_time": 2.0, "attributes": None, "events": None}
+            await TelemetrySpan.bulk_insert(session, [span, empty])
+            await session.commit()
+            kinds = (
+                await session.execute(
+                    text("SELECT DISTINCT typeof(attributes) FROM telemetry_spans")
+                )
+            ).scalars()
+            assert set(kinds) == {"blob", "null"}
+
+        spans = await SQLiteSpanExporter(db_engine).get_trace_async("tr")
+
+        assert [(s["attributes"], s["events"]) for s in spans] == [
+            (span["attributes"], span["events"]),
+            ({}, []),
+        ]
+
+    async def test_json_columns_round_trip(self, db_engine: DatabaseEngine) -> None:
+        """Plain JSON columns go through the engine's serializer and back intact."""
+        args = {"text": "caf\u00e9 \U0001f600", "nested": {"n": [1, 2.5, None, True]}}
+        async with db_engine.get_session_factory()() as session:
+            session.add(make_turn("t", 0))
+            session.add(ToolUsage(id="u", turn_id="t", agent_id="A", tool_name="t", tool_args=args))
+            await session.commit()
+
+            raw = (await session.execute(text("SELECT tool_args FROM tool_usage"))).scalar_one()
+            session.expunge_all()
+            usage = (await session.execute(select(ToolUsage))).scalar_one()
+
+        assert "caf\u00e9" in raw
+        assert usage.tool_args == args
+
+
+@pytest.mark.unit
+class TestTaskDefinition:
+    """Tests for TaskDefinition input parameter lookups."""
+
+    def test_missing_required_inputs(self) -> None:
+        """Missing required names come back in schema order and follow schema changes."""
+        definition = TaskDefinition(
+            name="t",
+            description="d",
+            instructions="i",
+            input_schema=[
+                Parameter(name="b", description="", type=ParameterType.STRING, required=True),
+                Parameter(name="opt", description="", type=ParameterType.STRING),
+                Parameter(name="a", description="", type=ParameterType.STRING, required=True),
+            ],
+        )
+
+        assert definition.missing_required_inputs({}) == ["b", "a"]
+        assert definition.missing_required_inputs({"a": 1, "b": 2}) == []
+        assert definition.get_input_parameter("opt") is definition.input_schema[1]
+
+        definition.input_schema = [definition.input_schema[1]]
+
+        assert definition.missing_required_inputs({}) == []
+        assert definition.get_input_parameter("a") is None
+
+        required_y = Parameter(name="y", description="", type=ParameterType.STRING, required=True)
+        copied = definition.model_copy(update={"input_schema": [required_y]})
+        definition.input_schema.append(required_y)
+
+        assert copied.missing_required_inputs({"x"}) == ["y"]
+        assert copied.get_input_parameter("opt") is None
+        assert definition.missing_required_inputs({}) == ["y"]
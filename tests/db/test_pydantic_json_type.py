@@ -1,11 +1,12 @@
 """Tests for PydanticJSON custom SQLAlchemy type."""
 
+import json
 from datetime import datetime
 from typing import Any, Optional
 
 import pytest
 from pydantic import BaseModel
-from sqlalchemy import Column, Integer, create_engine
+from sqlalchemy import Column, Integer, create_engine, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 from sqlmodel import Field, SQLModel, select
@@ -177,6 +178,25 @@ class TestPydanticJSONType:
         assert retrieved.data.nested.name == "updated"
         assert retrieved.data.items == ["b", "c"]
 
+    def test_stored_as_json_text(self, test_session: Any) -> None:
+        """Models are written as JSON text and legacy json.dumps rows still load."""
+        model = TestComplexModel(
+            id=5, title="Raw", nested=TestNestedModel(name="n", value=1), items=[], metadata={}
+        )
+        test_session.add(TestTable(id=5, data=model))
+        test_session.commit()
+
+        raw = test_session.execute(text("SELECT data FROM test_pydantic_json WHERE id = 5"))
+        assert json.loads(raw.scalar_one()) == model.model_dump(mode="json")
+
+        legacy = json.dumps(model.model_dump(mode="json") | {"id": 6})
+        test_session.execute(
+            text("INSERT INTO test_pydantic_json (id, data) VALUES (6, :data)"), {"data": legacy}
+        )
+        test_session.expire_all()
+        retrieved = test_session.query(TestTable).filter_by(id=6).first()
+        assert retrieved.data == model.model_copy(update={"id": 6})
+
     def test_invalid_type_error(self) -> None:
         """Test that invalid types raise appropriate errors."""
         pydantic_type = PydanticJSON(TestComplexModel)
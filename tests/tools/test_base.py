@@ -0,0 +1,69 @@
+"""Tests for the tool base classes."""
+
+import pytest
+from pydantic import BaseModel
+
+from tools.base import BaseLLMTool
+
+
+class SummaryInput(BaseModel):
+    """Input for the test tool."""
+
+    query: str
+    tags: list[str]
+
+
+class SummaryOutput(BaseModel):
+    """Output for the test tool."""
+
+    summary: str
+
+
+class SummaryTool(BaseLLMTool):
+    """Minimal LLM tool for exercising prompt building."""
+
+    def __init__(self, instructions: str) -> None:
+        super().__init__(
+            name="summarize",
+            description="Summarize things",
+            input_schema=SummaryInput,
+            output_schema=SummaryOutput,
+            instructions=instructions,
+            llm_client=None,
+        )
+
+
+@pytest.mark.unit
+class TestBuildPrompt:
+    """Tests for BaseLLMTool._build_prompt placeholder substitution."""
+
+    def test_substitutes_fields_and_input(self) -> None:
+        """Field placeholders, containers and {{INPUT}} are all filled in."""
+        tool = SummaryTool("Q={{QUERY}} T={{TAGS}} ALL={{INPUT}} Q2={{QUERY}} {{UNKNOWN}}")
+        input_data = SummaryInput(query="cats", tags=["a"])
+
+        prompt = tool._build_prompt(input_data)
+
+        tags = '[\n  "a"\n]'
+        everything = '{\n  "query": "cats",\n  "tags": [\n    "a"\n  ]\n}'
+        assert prompt == f"Q=cats T={tags} ALL={everything} Q2=cats {{{{UNKNOWN}}}}"
+
+    def test_substituted_values_are_not_rescanned(self) -> None:
+        """A value that looks like a placeholder is inserted verbatim."""
+        tool = SummaryTool("{{QUERY}} / {{TAGS}}")
+        input_data = SummaryInput(query="{{TAGS}}", tags=[])
+
+        assert tool._build_prompt(input_data) == "{{TAGS}} / []"
+
+
+@pytest.mark.unit
+class TestFormatDisplay:
+    """Tests for the default BaseCoreTool display formatting."""
+
+    def test_pretty_prints_output_json(self) -> None:
+        """Output is shown as indented JSON with non-ASCII text left readable."""
+        tool = SummaryTool("")
+
+        display = tool._format_display(SummaryOutput(summary="caf\u00e9"))
+
+        assert display == '{\n  "summary": "caf\u00e9"\n}'
@@ -5,12 +5,13 @@ interceptors, error handling, and result formatting.
 """
 
 import asyncio
+import json
 import uuid
 from typing import Any, Optional
 from unittest.mock import AsyncMock, Mock
 
 import pytest
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
 from client.mcp_server import MCPServer
 from common.types import ToolCall, ToolCallResult, ToolErrorType
@@ -313,6 +314,24 @@ class TestToolExecutor:
         assert result.tool_call_id == tool_id
         assert not result.is_error
 
+    async def test_session_context_set_on_frozen_result(
+        self, executor: ToolExecutor, mock_tool: MockTool
+    ) -> None:
+        """Routing fields are filled in on a copy; results themselves are immutable."""
+        executor.register_core_tool(mock_tool)
+        tool_call = ToolCall(
+            id="call-1", name="mock_tool", arguments={"input": "x"}, agent_id="A", session_id="S"
+        )
+
+        result = await executor.execute(tool_call)
+
+        assert (result.tool_call_id, result.agent_id, result.session_id) == ("call-1", "A", "S")
+        assert json.loads(result.to_json_bytes()) == result.model_dump(mode="json")
+        with pytest.raises(ValidationError):
+            result.content = "changed"
+        with pytest.raises(ValidationError):
+            ToolCall.model_validate({"id": "c", "name": "t", "arguments": {}, "unknown": True})
+
     async def test_tool_call_id_propagation_with_error(
         self, executor: ToolExecutor, mock_tool: MockTool
     ) -> None:
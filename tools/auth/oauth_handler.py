@@ -4,26 +4,58 @@ This handles Google OAuth tokens for accessing Gmail, Drive, and Calendar APIs.
 """
 
 import asyncio
-import json
 import logging
+import os
+import tempfile
+from collections import defaultdict
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
+import msgspec
+
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
 
 logger = logging.getLogger(__name__)
 
 
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write a file via a temp file and rename, so readers never see a partial token."""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    with os.fdopen(fd, "wb") as tmp_file:
+        tmp_file.write(data)
+    os.replace(tmp_name, path)
+
+
+def _parse_expiry(value: Optional[str]) -> Optional[datetime]:
+    """Parse a stored token expiry into the naive UTC datetime google-auth compares against."""
+    if not value:
+        return None
+    expiry = datetime.fromisoformat(value)
+    if expiry.tzinfo is not None:
+        expiry = expiry.astimezone(timezone.utc).replace(tzinfo=None)
+    return expiry
+
+
 class AsyncGoogleOAuthHandler:
     """OAuth handler for Google services in metagen"""
 
     def __init__(self) -> None:
         # Use metagen token directory
         self.tokens_dir = Path.home() / ".metagen" / "tokens"
+        self._credential_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
         logger.debug(f"OAuth handler using token directory: {self.tokens_dir}")
 
-    async def load_credentials(self, user_id: str = "default_user") -> Optional[Credentials]:
+    def credentials_lock(self, user_id: str) -> asyncio.Lock:
+        """Lock serializing credential load/refresh/store for one user.
+
+        Holding it while refreshing means concurrent requests for the same user
+        trigger a single token refresh and token file write.
+        """
+        return self._credential_locks[user_id]
+
+    async def load_credentials(self, user_id: str = "default_user") -> Optional["Credentials"]:
         """Load stored OAuth credentials"""
         # Save tokens as {user_id}_token.json
         token_file = self.tokens_dir / f"{user_id}_token.json"
@@ -32,12 +64,12 @@ class AsyncGoogleOAuthHandler:
             logger.warning(f"No token file found at {token_file}")
             return None
 
+        # google-auth is imported on first use so startup doesn't pay for it
+        from google.oauth2.credentials import Credentials
+
         try:
-            # Run file I/O in executor to keep it async
-            loop = asyncio.get_event_loop()
-            token_data = await loop.run_in_executor(
-                None, lambda: json.loads(token_file.read_text())
-            )
+            # Read in a worker thread to keep it async; decoding is cheap
+            token_data = msgspec.json.decode(await asyncio.to_thread(token_file.read_bytes))
 
             # Create credentials from stored token
             credentials = Credentials(
@@ -47,6 +79,8 @@ class AsyncGoogleOAuthHandler:
                 client_id=token_data.get("client_id"),
                 client_secret=token_data.get("client_secret"),
                 scopes=token_data.get("scopes"),
+                # Without an expiry google-auth treats the token as valid forever
+                expiry=_parse_expiry(token_data.get("expiry")),
             )
 
             logger.debug("Successfully loaded credentials")
@@ -56,7 +90,7 @@ class AsyncGoogleOAuthHandler:
             logger.error(f"Error loading credentials: {e}")
             return None
 
-    async def store_credentials(self, user_id: str, credentials: Credentials) -> None:
+    async def store_credentials(self, user_id: str, credentials: "Credentials") -> None:
         """Store OAuth credentials"""
         try:
             # Ensure directory exists
@@ -73,13 +107,11 @@ class AsyncGoogleOAuthHandler:
                 "client_id": credentials.client_id,
                 "client_secret": credentials.client_secret,
                 "scopes": credentials.scopes,
+                "expiry": credentials.expiry.isoformat() if credentials.expiry else None,
             }
 
-            # Save to file
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None, lambda: token_file.write_text(json.dumps(token_data, indent=2))
-            )
+            # Save to file; only machines read it, so keep it compact
+            await asyncio.to_thread(_write_atomic, token_file, msgspec.json.encode(token_data))
 
             logger.debug("Successfully stored credentials")
 
@@ -87,20 +119,16 @@ class AsyncGoogleOAuthHandler:
             logger.error(f"Error storing credentials: {e}")
             raise
 
-    async def refresh_token(self, credentials: Credentials) -> Credentials:
+    async def refresh_token(self, credentials: "Credentials") -> "Credentials":
         """Refresh expired OAuth token"""
         try:
-            # Run refresh in executor to keep it async
-            loop = asyncio.get_event_loop()
-
-            def _refresh() -> Credentials:
-                if credentials.expired and credentials.refresh_token:
-                    credentials.refresh(Request())
-                return credentials
+            # Only expired credentials hit the network, so skip the thread hop otherwise
+            if credentials.expired and credentials.refresh_token:
+                from google.auth.transport.requests import Request
 
-            refreshed_creds = await loop.run_in_executor(None, _refresh)
-            logger.debug("Successfully refreshed credentials")
-            return refreshed_creds  # type: ignore[no-any-return]
+                await asyncio.to_thread(credentials.refresh, Request())
+                logger.debug("Successfully refreshed credentials")
+            return credentials
 
         except Exception as e:
             logger.error(f"Error refreshing token: {e}")
@@ -111,8 +139,7 @@ class AsyncGoogleOAuthHandler:
         try:
             token_file = self.tokens_dir / f"{user_id}_token.json"
             if token_file.exists():
-                loop = asyncio.get_event_loop()
-                await loop.run_in_executor(None, token_file.unlink)
+                await asyncio.to_thread(token_file.unlink)
                 logger.debug("Successfully revoked authentication")
             return True
         except Exception as e:
@@ -9,7 +9,9 @@ Tools are simple and focused. Context management (session tracking,
 resource injection) is handled by the Meta-agent during tool execution.
 """
 
+import functools
 import json
+import re
 from abc import ABC, abstractmethod
 from typing import Any
 
@@ -190,8 +192,25 @@ class BaseCoreTool(BaseTool):
 
         Override this method for custom formatting.
         """
-        # Default: pretty-printed JSON
-        return json.dumps(output.model_dump(), indent=2)
+        # Default: pretty-printed JSON, serialized by pydantic-core directly
+        return output.model_dump_json(indent=2)
+
+
+@functools.lru_cache(maxsize=128)
+def _placeholder_pattern(names: frozenset[str]) -> re.Pattern[str]:
+    """Compile a pattern matching {{NAME}} for any of the given names.
+
+    Cached by name set, so tools called repeatedly with the same input schema
+    compile their pattern once.
+    """
+    return re.compile("{{(" + "|".join(re.escape(name) for name in sorted(names)) + ")}}")
+
+
+def _placeholder_text(value: Any) -> str:
+    """Render a substituted value: JSON for containers, str() otherwise."""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, indent=2)
+    return str(value)
 
 
 class BaseLLMTool(BaseCoreTool):
@@ -247,20 +266,14 @@ class BaseLLMTool(BaseCoreTool):
 
     def _build_prompt(self, input_data: BaseModel) -> str:
         """Build prompt from instructions and input data."""
-        prompt = self.instructions
         input_dict = input_data.model_dump()
 
-        # Handle {{INPUT}} placeholder
-        if "{{INPUT}}" in prompt:
-            prompt = prompt.replace("{{INPUT}}", json.dumps(input_dict, indent=2))
+        # Field-specific placeholders (e.g., {{FIELD_NAME}}), plus {{INPUT}} for
+        # the whole input, all substituted in a single pass over the instructions
+        values = {key.upper(): value for key, value in input_dict.items()}
+        values["INPUT"] = input_dict
 
-        # Handle field-specific substitutions (e.g., {{FIELD_NAME}})
-        for key, value in input_dict.items():
-            placeholder = f"{{{{{key.upper()}}}}}"
-            if placeholder in prompt:
-                if isinstance(value, (dict, list)):
-                    prompt = prompt.replace(placeholder, json.dumps(value, indent=2))
-                else:
-                    prompt = prompt.replace(placeholder, str(value))
-
-        return prompt
+        pattern = _placeholder_pattern(frozenset(values))
+        return pattern.sub(
+            lambda match: _placeholder_text(values[match.group(1)]), self.instructions
+        )
@@ -77,12 +77,13 @@ class GoogleToolsWrapper:
         if not self._drive_tool:
             raise RuntimeError("Drive tool not initialized")
 
-        # DriveConnectorTool.search_files expects: user_id, query, max_results
-        # It doesn't support page_token or order_by
+        # DriveConnectorTool.search_files expects: user_id, query, max_results, page_token
+        # It doesn't support order_by
         return await self._drive_tool.search_files(
             user_id=user_id,
             query=query or "",  # query is required, provide empty string if None
             max_results=max_results,
+            page_token=page_token,
         )
 
     async def drive_get_file(self, file_id: str, fields: Optional[str] = None) -> dict[str, Any]:
@@ -213,6 +214,10 @@ class GoogleToolsWrapper:
                             "type": "integer",
                             "description": "Maximum number of results (default: 10)",
                         },
+                        "page_token": {
+                            "type": "string",
+                            "description": "next_page_token from a previous search, to continue it",
+                        },
                     },
                 },
             },
@@ -1,7 +1,6 @@
 """Core task management tools for reusable task definitions."""
 
 import logging
-import uuid
 from datetime import datetime
 from typing import Any
 
@@ -9,6 +8,7 @@ from pydantic import BaseModel, Field
 
 from agents.memory import MemoryManager
 from common.models import TaskConfig, TaskDefinition
+from common.models.base import new_id
 from tools.base import BaseCoreTool
 
 logger = logging.getLogger(__name__)
@@ -73,7 +73,7 @@ class CreateTaskTool(BaseCoreTool):
         task_input: CreateTaskInput = input_data  # type: ignore
 
         # Create task config
-        task_id = str(uuid.uuid4())
+        task_id = new_id()
         task_config = TaskConfig(
             id=task_id,
             name=task_input.task_definition.name,
@@ -144,10 +144,7 @@ class ExecuteTaskTool(BaseCoreTool):
             raise ValueError(f"Task definition not found: {exec_input.task_id}")
 
         # Validate input parameters
-        missing_params = []
-        for param in task_config.definition.input_schema:
-            if param.required and param.name not in exec_input.input_values:
-                missing_params.append(param.name)
+        missing_params = task_config.definition.missing_required_inputs(exec_input.input_values)
 
         if missing_params:
             raise ValueError(f"Missing required parameters: {missing_params}")
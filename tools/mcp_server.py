@@ -95,7 +95,10 @@ async def gmail_get_labels(user_id: str = "default_user") -> dict[str, Any]:
 
 @mcp.tool()
 async def drive_search_files(
-    query: str, user_id: str = "default_user", max_results: int = 10
+    query: str,
+    user_id: str = "default_user",
+    max_results: int = 10,
+    page_token: Optional[str] = None,
 ) -> dict[str, Any]:
     """
     Search Google Drive files.
@@ -104,11 +107,12 @@ async def drive_search_files(
         query: Drive search query
         user_id: User identifier (default: "default_user")
         max_results: Maximum number of files to return (default: 10)
+        page_token: next_page_token from a previous search, to fetch the next page
 
     Returns:
-        Dictionary containing count and list of matching files
+        Dictionary containing count, list of matching files and next_page_token
     """
-    return await drive_tool.search_files(user_id, query, max_results)
+    return await drive_tool.search_files(user_id, query, max_results, page_token)
 
 
 @mcp.tool()
@@ -148,6 +152,23 @@ async def calendar_list_events(
     return await gcal_tool.list_events(user_id, max_results, time_min, time_max)
 
 
+@mcp.tool()
+async def calendar_get_events(
+    event_ids: list[str], user_id: str = "default_user"
+) -> dict[str, Any]:
+    """
+    Get details for several Google Calendar events in one request.
+
+    Args:
+        event_ids: Calendar event IDs, e.g. from calendar_list_events
+        user_id: User identifier (default: "default_user")
+
+    Returns:
+        Dictionary containing the events found and errors for any that were not
+    """
+    return await gcal_tool.get_events(user_id, event_ids)
+
+
 @mcp.tool()
 async def google_auth_status(user_id: str = "default_user") -> dict[str, Any]:
     """
@@ -259,6 +280,24 @@ async def docs_replace_text(
     return await docs_tool.replace_text(user_id, document_id, find_text, replace_text)
 
 
+@mcp.tool()
+async def docs_replace_text_many(
+    document_id: str, replacements: dict[str, str], user_id: str = "default_user"
+) -> dict[str, Any]:
+    """
+    Replace several texts in a Google Docs document in a single update.
+
+    Args:
+        document_id: The Google Docs document ID
+        replacements: Mapping of text to find to its replacement, applied in order
+        user_id: User identifier (default: "default_user")
+
+    Returns:
+        Dictionary containing replace results
+    """
+    return await docs_tool.replace_text_many(user_id, document_id, replacements)
+
+
 # Google Sheets Tools
 
 
@@ -82,7 +82,7 @@ class ToolExecutor:
                     logger.info(f"Tool call {tool_name} handled by interceptor")
                     # Ensure tool_call_id is set
                     if result.tool_call_id is None:
-                        result.tool_call_id = tool_call.id
+                        result = result.model_copy(update={"tool_call_id": tool_call.id})
                     return result
 
                 # Otherwise, proceed with normal execution
@@ -109,13 +109,11 @@ class ToolExecutor:
 
         try:
             result = await tool.execute(tool_call.arguments)
-            # Core tools already return ToolCallResult, ensure IDs are set
+            # Core tools already return ToolCallResult; set session context and IDs
+            update = {"agent_id": tool_call.agent_id, "session_id": tool_call.session_id}
             if result.tool_call_id is None:
-                result.tool_call_id = tool_call.id
-            # Ensure session context is set
-            result.agent_id = tool_call.agent_id
-            result.session_id = tool_call.session_id
-            return result
+                update["tool_call_id"] = tool_call.id
+            return result.model_copy(update=update)
         except Exception as e:
             logger.error(f"Core tool {tool_call.name} failed: {e}")
             return ToolCallResult(